@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 from time import time, sleep
 import datetime
 from collections.abc import Iterable
@@ -9,6 +8,20 @@ from tqdm import trange
 
 import Population as p
 import Constants as c
+import Sampling as s
+import Evaluators as e
+import Archive as ar
+import Sigma as sg
+import EvaluationCache as ec
+import Checkpoint as cp
+import History as h
+import Telemetry as t
+import Profiling as pr
+import RandomStreams as rs
+import Config as cg
+import Surrogates as sr
+import Kernels as kr
+import CostFunctions as cf
 
 
 class AcorContinuousDomain(object):
@@ -27,47 +40,236 @@ class AcorContinuousDomain(object):
         http://usir.salford.ac.uk/30721/1/Riadi_Thesis_2014_jan.pdf
 
     """
+    FLOAT_TYPES = ("float64", "float32")
 
     def __init__(self, 
             n_pop: int, 
             n_vars: int,
             cost_func: object, 
-            domain_bounds: Dict):
+            domain_bounds: Dict,
+            sampling_mode: str = c.AcoConstants.SAMPLING_MODE,
+            sigma_method: str = c.AcoConstants.SIGMA_METHOD,
+            evaluator: object = None,
+            max_concurrency: int = c.AcoConstants.MAX_CONCURRENCY,
+            cache_size: Optional[int] = c.AcoConstants.EVALUATION_CACHE_SIZE,
+            cache_tolerance: Optional[float] = c.AcoConstants.EVALUATION_CACHE_TOLERANCE,
+            random_seed: int = c.HelperConstants.RANDOM_SEED,
+            stopping_criteria: Optional[List] = None,
+            checkpoint_path: Optional[str] = None,
+            checkpoint_interval: int = c.AcoConstants.CHECKPOINT_INTERVAL,
+            history_mode: str = c.AcoConstants.HISTORY_MODE,
+            history_interval: int = c.AcoConstants.HISTORY_INTERVAL,
+            history_path: Optional[str] = None,
+            callbacks: Optional[List] = None,
+            profile: bool = False,
+            random: object = None,
+            bit_generator: Optional[str] = None,
+            config: Optional[cg.AcoConfig] = None,
+            show_progress: bool = True,
+            selection: str = c.AcoConstants.SELECTION,
+            surrogate: object = c.AcoConstants.SURROGATE,
+            surrogate_oversampling: int = c.AcoConstants.SURROGATE_OVERSAMPLING,
+            surrogate_fraction: float = c.AcoConstants.SURROGATE_FRACTION,
+            kernel_backend: str = c.AcoConstants.KERNEL_BACKEND,
+            dtype: object = c.AcoConstants.DTYPE,
+            cost_dtype: object = c.AcoConstants.COST_DTYPE):
         """
         Constructor
         :param: n_pop: population size
         :param: n_vars: number of variables
         :param: cost_func_ cost function
         :param: domain_bounds: Continuous domain lower/upper bounds
+        :param: sampling_mode: ant sampling mode i.e. 'vectorized' or 'legacy' (original per-draw random order)
+        :param: sigma_method: sigma computation method i.e. 'loop', 'broadcast', 'sorted', 'auto' or 'incremental'
+        :param: evaluator: cost function evaluator i.e. an 'Evaluators.Evaluator', a backend name ('serial', 'thread',
+                'process' or 'distributed') or None (serial)
+        :param: max_concurrency: maximum number of concurrent cost function calls of the asyncio driver ('run')
+        :param: cache_size: size of the LRU evaluation cache placed in front of the cost function (None disables it)
+        :param: cache_tolerance: evaluation cache position quantization tolerance (None caches the exact positions)
+        :param: random_seed: random number generator seed (integer or 'numpy.random.SeedSequence')
+        :param: stopping_criteria: early stopping criteria (see 'StoppingCriteria'), checked after every generation
+                in addition to the maximum number of iterations
+        :param: checkpoint_path: checkpoint file path (None disables checkpointing)
+        :param: checkpoint_interval: number of generations between checkpoints
+        :param: history_mode: convergence history mode i.e. 'full' (a 'Population' per iteration), 'costs', 'sampled'
+                (costs and every 'history_interval'-th position) or 'memmap' (costs and positions streamed to
+                the 'history_path' '.npy' file)
+        :param: history_interval: position sampling interval of the 'sampled' history mode
+        :param: history_path: '.npy' file path of the 'memmap' history mode
+        :param: callbacks: generation callbacks i.e. callables invoked with a 'Telemetry.GenerationState' after every
+                generation (no snapshot is created when there are no callbacks)
+        :param: profile: times the main loop phases (see 'Profiling.PhaseProfiler') if True
+        :param: random: injected random number generator ('numpy.random.Generator', 'numpy.random.RandomState' or
+                'RandomStreams.RandomStream') drawing all the algorithm random numbers, overrides the seed
+        :param: bit_generator: bit generator of the seeded random number generator i.e. 'pcg64' or 'philox' (a
+                'numpy.random.Generator' shared by the initialization and the sampling) or 'legacy' (the original
+                seeding i.e. separate 'numpy.random.RandomState' streams of the initialization and the sampling).
+                None selects 'legacy' for the 'legacy' sampling mode (which then reproduces the original runs) and
+                'HelperConstants.BIT_GENERATOR' otherwise
+        :param: config: run hyperparameters i.e. number of ants, maximum number of iterations, q and zeta (None
+                snapshots the 'AcoConstants' values)
+        :param: show_progress: displays the main loop progress bar if True
+        :param: selection: kernel selection strategy i.e. 'roulette' or 'alias' (proportional to the kernel weights),
+                'rank' (linear ranking) or 'tournament' (see 'Selection')
+        :param: surrogate: surrogate pre-screening model i.e. 'quadratic', 'rbf' or a 'Surrogates.Surrogate' (None
+                disables the pre-screening), whose training state is checkpointed (custom surrogates without a
+                persisted state are retrained from the archive on a checkpoint resume)
+        :param: surrogate_oversampling: number of candidates sampled per ant by the surrogate pre-screening
+        :param: surrogate_fraction: fraction of the number of ants truly evaluated per (pre-screened) generation
+        :param: kernel_backend: hot path kernels i.e. 'numpy', 'numba' (compiled sigma, sampling and bounds kernels,
+                and the compiled twins of the built-in 'rastrigin'/'stybtangm' cost functions, see 'Kernels') or
+                'auto' ('numba' if installed); falls back to 'numpy' when Numba is not installed
+        :param: dtype: floating point precision of the archive, the sampling, the bounds and the (batch) cost function
+                inputs i.e. 'float64' or 'float32' (halves the memory traffic of high dimensional problems)
+        :param: cost_dtype: floating point precision of the costs and of the reported best solution i.e. 'float64'
+                or 'float32'
         """
         self.__domain_bounds = domain_bounds
         self.__l_bound = domain_bounds[0]
         self.__u_bound = domain_bounds[1]
+        self.__dtype = AcorContinuousDomain.__createFloatType(dtype)
+        self.__cost_dtype = AcorContinuousDomain.__createFloatType(cost_dtype)
+        self.__kernel_backend = kr.resolveKernelBackend(kernel_backend)
+        if self.__kernel_backend == "numba":
+            cost_func = cf.getCompiledCostFunction(cost_func)
+        self.__cache = ec.CachedCostFunction(cost_func, cache_size, cache_tolerance) if cache_size is not None else None
         self.__cost_func = cost_func
+        # The evaluators sit behind the evaluation cache (see '__evaluate'), so the cache lookups stay in this process
+        # and only the cache misses are dispatched (e.g. to the process pool workers or awaited)
+        self.__evaluator = e.createEvaluator(self.__cost_func, evaluator)
+        self.__owns_evaluator = evaluator is None or isinstance(evaluator, str)
+        self.__async_evaluator = e.AsyncEvaluator(self.__cost_func, max_concurrency)
         self.__n_pop = n_pop
-        self.__pops_sorted = None
+        self.__archive = None
         self.__n_vars = n_vars
-        self.__n_ants = c.AcoConstants.N_ANTS
-        self.__max_terations = c.AcoConstants.MAX_ITERATIONS
-        self.__q = c.AcoConstants.Q
-        self.__zeta = c.AcoConstants.ZETA
-        self.__random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__config = config if config is not None else cg.AcoConfig()
+        self.__n_ants = self.__config.n_ants
+        self.__max_terations = self.__config.max_iterations
+        self.__q = self.__config.q
+        self.__zeta = self.__config.zeta
+        self.__random_seed = random_seed
+        if bit_generator is None:
+            bit_generator = "legacy" if sampling_mode == "legacy" else c.HelperConstants.BIT_GENERATOR
+        self.__random = rs.createRandomStream(random, random_seed, bit_generator)
+        self.__shares_random = random is not None or bit_generator != "legacy"
+        self.__iteration = 0
+        self.__n_evaluations = 0
+        self.__start_time = None
+        self.__end_time = None
+        self.__stopping_criteria = list(stopping_criteria) if stopping_criteria is not None else []
+        self.__stop_reason = None
         self.__final_best_solution = None 
-        self.__best_solutions = [None]*self.__max_terations
+        self.__history_mode = history_mode
+        self.__history_interval = history_interval
+        self.__history_path = history_path
+        self.__history = None
         self.__probs = None
-        self.__new_pops = None   
+        self.__sampling_mode = sampling_mode
+        self.__selection = selection
+        self.__sampler = None
+        self.__sigma_engine = sg.SigmaEngine(self.__zeta, sigma_method, kernel_backend=self.__kernel_backend)
+        self.__checkpoint_path = checkpoint_path
+        self.__checkpoint_interval = checkpoint_interval
+        self.__callbacks = list(callbacks) if callbacks is not None else []
+        self.__profiler = pr.PhaseProfiler() if profile else pr.NullProfiler()
+        self.__show_progress = show_progress
+        self.__screen = None
+        if surrogate is not None:
+            self.__screen = sr.SurrogateScreen(surrogate, n_vars, surrogate_oversampling, surrogate_fraction)
+        self.__candidates = None
+        self.__screening = False
+        self.__n_new_evaluations = 0
 
     def __initialization(self):
         """
         Initialization of the ACO algorithm
         """
-        pops = p.Populations(self.__n_pop, self.__n_vars, self.__cost_func, self.__domain_bounds)
-        self.__pops_sorted = pops.ant_populations
-        self.__final_best_solution = pops.best_population
+        self.__start_time = time()
+        self.__end_time = None
+        positions = self.__createPopulations().createPositions()
+        self.__initializeArchive(positions, self.__evaluate(positions))
+
+    def __evaluate(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates solutions with the evaluator, looking their costs up in the evaluation cache first (only the cache
+        misses are dispatched)
+        :param: positions: solution positions (n_solutions, n_vars)
+        :return: solution costs (n_solutions,)
+        """
+        if self.__cache is None:
+            return self.__evaluator.evaluate(positions)
+        return self.__cache.evaluate(positions, self.__evaluator.evaluate)
+
+    async def __initializationAsync(self):
+        """
+        Initialization of the ACO algorithm (asyncio cost function evaluation)
+        """
+        self.__start_time = time()
+        self.__end_time = None
+        pops = self.__createPopulations()
+        positions = pops.createPositions()
+        costs = await self.__evaluateAsync(positions)
+        self.__initializeArchive(positions, costs)
+
+    async def __evaluateAsync(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates solutions with the asyncio evaluator, looking their costs up in the evaluation cache first (only
+        the cache misses are awaited)
+        :param: positions: solution positions (n_solutions, n_vars)
+        :return: solution costs (n_solutions,)
+        """
+        if self.__cache is None:
+            return await self.__async_evaluator.evaluate(positions)
+        return await self.__cache.evaluateAsync(positions, self.__async_evaluator.evaluate)
+
+    @staticmethod
+    def __createFloatType(dtype: object) -> np.dtype:
+        """
+        Creates (and validates) a floating point data type
+        :param: dtype: data type i.e. 'float64' or 'float32' (or the equivalent NumPy type)
+        """
+        dtype = np.dtype(dtype)
+        if dtype.name not in AcorContinuousDomain.FLOAT_TYPES:
+            raise ValueError(f"Invalid floating point type '{dtype}', expected one of {AcorContinuousDomain.FLOAT_TYPES}")
+        return dtype
+
+    def __createPopulations(self) -> p.Populations:
+        """
+        Creates the initial populations (drawn from the shared random stream, or from their own 'legacy' stream)
+        """
+        if self.__shares_random:
+            return p.Populations(self.__n_pop, self.__n_vars, self.__cost_func, self.__domain_bounds, self.__evaluator,
+                                 random=self.__random, dtype=self.__dtype)
+        return p.Populations(self.__n_pop, self.__n_vars, self.__cost_func, self.__domain_bounds, self.__evaluator,
+                             self.__random_seed, bit_generator="legacy", dtype=self.__dtype)
+
+    def __initializeArchive(self, positions: np.ndarray, costs: np.ndarray):
+        """
+        Initializes the archive and the Gaussian kernel parameters from the evaluated initial populations
+        :param: positions: initial positions (n_pop, n_vars)
+        :param: costs: initial costs (n_pop,)
+        """
+        self.__archive = ar.SolutionArchive(self.__n_pop, self.__n_ants, self.__n_vars, self.__dtype, self.__cost_dtype)
+        self.__archive.initialize(positions, costs)
+        self.__sigma_engine.reset()
+        self.__iteration = 0
+        self.__n_evaluations = self.__n_pop
+        self.__history = h.HistoryRecorder(self.__max_terations, self.__n_vars, self.__history_mode,
+                                           self.__history_interval, self.__history_path)
+        self.__stop_reason = None
+        for criterion in self.__stopping_criteria:
+            criterion.reset()
+        self.__final_best_solution = self.__archive.best_population
         self.__w = self.__computePdf()
         self.__probs = self.__w/np.sum(self.__w)
-        self.__means = np.zeros((self.__n_pop, self.__n_vars))
-        self.__sigmas = np.zeros((self.__n_pop, self.__n_vars))
+        self.__means = self.__archive.means
+        self.__sigmas = np.zeros((self.__n_pop, self.__n_vars), dtype=self.__dtype)
+        self.__sampler = s.KernelSampler(self.__probs, self.__random, self.__sampling_mode, self.__selection,
+                                         kernel_backend=self.__kernel_backend)
+        if self.__screen is not None:
+            self.__screen.reset()
+            self.__screen.update(self.__archive.means, self.__archive.costs)
+            self.__candidates = np.zeros((self.__screen.getNumberOfCandidates(self.__n_ants), self.__n_vars), dtype=self.__dtype)
 
     def initialization(self):
         """
@@ -79,7 +281,7 @@ class AcorContinuousDomain(object):
         """
         Computes the PDF values
         """
-        points = np.array(range(self.__n_pop), dtype=np.float)
+        points = np.array(range(self.__n_pop), dtype=float)
         # Solution Weights
         w = 1/(np.sqrt(2*np.pi)*self.__q*float(self.__n_pop))*np.square(np.exp(-0.5*((points-1)/(self.__q*float(self.__n_pop)))))
         return w
@@ -93,10 +295,9 @@ class AcorContinuousDomain(object):
 
     def __createMeans(self):
         """
-        Creates the ACO algorithm means 
+        Creates the ACO algorithm means i.e. a zero-copy view of the archive positions
         """
-        for i in range(self.__n_pop):
-            self.__means[i, :] = np.reshape(self.__pops_sorted[i].position, (1, -1))  
+        self.__means = self.__archive.means
 
     def createMeans(self):
         """
@@ -108,11 +309,7 @@ class AcorContinuousDomain(object):
         """
         Creates the ACO algorithm Satndard Deviation (sigmas)
         """
-        for l_i in range(self.__n_pop):
-            d = 0.0
-            for r_i in range(self.__n_pop):
-                d += np.abs(self.__means[l_i, :] - self.__means[r_i, :])
-            self.__sigmas[l_i, :] = (self.__zeta * d) / (self.__n_pop - 1) 
+        self.__sigma_engine.compute(self.__means, out=self.__sigmas)
 
     def createStandardDeviation(self):
         """
@@ -125,8 +322,7 @@ class AcorContinuousDomain(object):
         Roulette wheel selection strategy for selecting the optimal Guassain Kernel
         """
         r = self.__random.rand()
-        c = np.cumsum(np.reshape(self.__probs, (-1)))
-        j = np.argwhere(r <= c)[0,0]
+        j = np.minimum(np.searchsorted(self.__sampler.cum_probs, r, side="left"), self.__n_pop - 1)
         return j
 
     def rouletteWheelSelection(self):
@@ -139,20 +335,153 @@ class AcorContinuousDomain(object):
         """
         Constructs the new ACO Population solution
         """        
-        self.__createMeans()
-        self.__createStandardDeviation()
-        self.__new_pops = p.Populations.createEmptyNewPopulations(self.__n_ants, self.__n_vars)
-        for i in range(self.__n_ants):
-            for j in range(self.__n_vars):
-                # Select Gaussian Kernel
-                k = self.__rouletteWheelSelection()
-                # Generate Gaussian Random Variable
-                self.__new_pops[i].position[j] = self.__means[k, j] + self.__sigmas[k, j] * self.__random.randn()
-            # Apply Variable Bounds
-            self.__new_pops[i].position = np.maximum(self.__new_pops[i].position, self.__l_bound)
-            self.__new_pops[i].position = np.minimum(self.__new_pops[i].position, self.__u_bound)
-            # Evaluation
-            self.__new_pops[i].cost_function = self.__cost_func(self.__new_pops[i].position)
+        self.__sampleNewPopulationSolution()
+        # Evaluation (one batch call per generation)
+        with self.__profiler.phase("evaluation"):
+            positions = self.__screenNewPopulationSolution()
+            self.__storeNewPopulationCosts(self.__evaluate(positions))
+
+    async def __constructNewPopulationSolutionAsync(self):
+        """
+        Constructs the new ACO Population solution (asyncio cost function evaluation)
+        """
+        self.__sampleNewPopulationSolution()
+        with self.__profiler.phase("evaluation"):
+            positions = self.__screenNewPopulationSolution()
+            self.__storeNewPopulationCosts(await self.__evaluateAsync(positions))
+
+    def __sampleNewPopulationSolution(self):
+        """
+        Samples the (unevaluated) new ACO Population solution positions, or the candidates of the surrogate
+        pre-screening once its surrogate is ready
+        """
+        self.__screening = self.__screen is not None and self.__screen.is_ready
+        # Sampled in place into the archive sample rows (each ant owns one row) or the candidate buffer
+        positions = self.__candidates if self.__screening else self.__archive.sample_positions
+        with self.__profiler.phase("means"):
+            self.__createMeans()
+        with self.__profiler.phase("sigmas"):
+            self.__createStandardDeviation()
+        with self.__profiler.phase("sampling"):
+            self.__sampler.sample(self.__means, self.__sigmas, len(positions), self.__l_bound, self.__u_bound,
+                                  clip=False, out=positions)
+        with self.__profiler.phase("clipping"):
+            self.__sampler.clip(positions, self.__l_bound, self.__u_bound)
+        self.__n_new_evaluations = self.__n_ants
+        if self.__screening:
+            self.__n_new_evaluations = self.__screen.getNumberOfEvaluations(self.__n_ants)
+
+    def __screenNewPopulationSolution(self) -> np.ndarray:
+        """
+        Moves the candidates with the best surrogate predicted costs to the archive sample rows (the remaining rows
+        are left out of the merge with an infinite cost)
+        :return: positions to evaluate i.e. a view of the archive sample rows
+        """
+        positions = self.__archive.sample_positions[:self.__n_new_evaluations]
+        if self.__screening:
+            selected = self.__screen.select(self.__candidates, self.__n_new_evaluations)
+            np.take(self.__candidates, selected, axis=0, out=positions)
+            self.__archive.sample_costs[self.__n_new_evaluations:] = np.inf
+        return positions
+
+    def __storeNewPopulationCosts(self, costs: np.ndarray):
+        """
+        Stores the costs of the evaluated new solutions in the archive sample rows and retrains the surrogate
+        :param: costs: costs of the evaluated new solutions (n_new_evaluations,)
+        """
+        self.__archive.sample_costs[:len(costs)] = costs
+        self.__updateSurrogate()
+
+    def __updateSurrogate(self):
+        """
+        Retrains the surrogate of the pre-screening with the truly evaluated new solutions
+        """
+        if self.__screen is not None:
+            n_solutions = self.__n_new_evaluations
+            self.__screen.update(self.__archive.sample_positions[:n_solutions], self.__archive.sample_costs[:n_solutions])
+
+    def __updateArchive(self):
+        """
+        Merges the evaluated new ACO Population solution into the archive and stores the best solution
+        """
+        with self.__profiler.phase("merge"):
+            # Merge Main Population (Archive) and New Population (Samples), Sort Population and Delete Extra Members
+            self.__archive.merge()
+            self.__sigma_engine.update(self.__archive.order, self.__archive.means, self.__archive.sample_positions)
+            # Update Best Solution Ever Found
+            self.__final_best_solution = self.__archive.best_population
+            # Store Best Cost
+            self.__history.record(self.__archive.means[0], self.__archive.costs[0])
+        self.__iteration += 1
+        self.__n_evaluations += self.__n_new_evaluations
+        self.__profiler.countGeneration()
+        if self.__checkpoint_path is not None and self.__iteration % self.__checkpoint_interval == 0:
+            self.saveCheckpoint(self.__checkpoint_path)
+
+    def __checkStoppingCriteria(self) -> bool:
+        """
+        Checks the early stopping criteria (all the criteria are updated, the first satisfied one is reported)
+        :return: True if the main loop has to stop
+        """
+        satisfied = [criterion.name for criterion in self.__stopping_criteria if criterion.isSatisfied(self)]
+        if satisfied:
+            self.__stop_reason = satisfied[0]
+        return self.__stop_reason is not None
+
+    def __runGeneration(self) -> bool:
+        """
+        Executes one generation of the ACO algorithm main loop
+        :return: True if the main loop has to stop
+        """
+        self.__constructNewPopulationSolution()
+        return self.__completeGeneration()
+
+    async def __runGenerationAsync(self) -> bool:
+        """
+        Executes one generation of the ACO algorithm main loop (asyncio cost function evaluation)
+        :return: True if the main loop has to stop
+        """
+        await self.__constructNewPopulationSolutionAsync()
+        return self.__completeGeneration()
+
+    def __completeGeneration(self) -> bool:
+        """
+        Merges the evaluated new ACO Population solution into the archive, checks the early stopping criteria and
+        invokes the generation callbacks
+        :return: True if the main loop has to stop
+        """
+        self.__updateArchive()
+        stop = self.__checkStoppingCriteria()
+        self.__notifyCallbacks()
+        return stop
+
+    def __notifyCallbacks(self):
+        """
+        Invokes the generation callbacks with a snapshot of the current generation
+        """
+        if self.__callbacks:
+            state = self.generation_state
+            for callback in self.__callbacks:
+                callback(state)
+
+    def __finalizeRun(self):
+        """
+        Records the reason the main loop stopped and the end time, and trims the unused best solution slots of an
+        early stopped run
+        """
+        self.__end_time = time()
+        if self.__stop_reason is None and self.__iteration >= self.__max_terations:
+            self.__stop_reason = "max_iterations"
+        if self.__stop_reason is not None:
+            self.__history.truncate(self.__iteration)
+
+    def __resumeRun(self):
+        """
+        Restarts the run time clock of a finalized (paused) run, excluding the time elapsed since it was finalized
+        """
+        if self.__end_time is not None:
+            self.__start_time = time() - (self.__end_time - self.__start_time)
+            self.__end_time = None
 
     def constructNewPopulationSolution(self):
         """
@@ -165,32 +494,182 @@ class AcorContinuousDomain(object):
         Executes ACO algorithm main loop
         """
         self.__initialization()
-        for i in trange(self.__max_terations):
-          self.__constructNewPopulationSolution()
-          # Merge Main Population (Archive) and New Population (Samples)
-          self.__pops_sorted = self.__pops_sorted + self.__new_pops
-          # Sort Population
-          self.__pops_sorted = sorted(self.__pops_sorted, key=lambda x: x.cost_function, reverse=False)
-          # Delete Extra Members
-          self.__pops_sorted = self.__pops_sorted[:self.__n_pop]
-          # Update Best Solution Ever Found
-          self.__final_best_solution = self.__pops_sorted[0]
-          # Store Best Cost
-          self.__best_solutions[i] = self.__final_best_solution
+        self.__mainLoop()
+
+    def resumeMainLoop(self, checkpoint_path: str):
+        """
+        Resumes the ACO algorithm main loop from a checkpoint i.e. continues (bit-for-bit) where the checkpointed run
+        stopped (the early stopping criteria restart from their initial state)
+        :param: checkpoint_path: checkpoint file path
+        """
+        self.loadCheckpoint(checkpoint_path)
+        self.__mainLoop()
+
+    def __mainLoop(self):
+        """
+        Executes the ACO algorithm main loop from the current iteration
+        """
+        self.__resumeRun()
+        if self.__stop_reason is None:
+            for i in trange(self.__iteration, self.__max_terations, disable=not self.__show_progress):
+              if self.__runGeneration():
+                break
+        self.__finalizeRun()
+        if self.__owns_evaluator:
+            self.__evaluator.close()
+
+    def iterate(self):
+        """
+        Executes the ACO algorithm main loop as a generator i.e. yields a 'Telemetry.GenerationState' snapshot after
+        every generation, so the progress can be consumed while the algorithm runs, e.g.:
+
+            for state in acor.iterate():
+                print(state.iteration, state.best_cost)
+
+        The main loop is initialized on the first call and continues from the current iteration otherwise (so a
+        consumer may stop iterating and resume later)
+        """
+        if self.__archive is None:
+            self.__initialization()
+        self.__resumeRun()
+        try:
+            while self.__stop_reason is None and self.__iteration < self.__max_terations:
+                self.__runGeneration()
+                yield self.generation_state
+        finally:
+            self.__finalizeRun()
+            if self.__owns_evaluator:
+                self.__evaluator.close()
+
+    def saveCheckpoint(self, checkpoint_path: str):
+        """
+        Atomically saves the ACO algorithm state (archive, random number generator state, iteration counter, best
+        solution history, running sums of the 'incremental' sigma method and surrogate training state) to a
+        checkpoint file
+        :param: checkpoint_path: checkpoint file path
+        """
+        state = {
+            "n_pop": np.array(self.__n_pop),
+            "n_vars": np.array(self.__n_vars),
+            "n_ants": np.array(self.__n_ants),
+            "max_iterations": np.array(self.__max_terations),
+            "q": np.array(self.__q),
+            "zeta": np.array(self.__zeta),
+            "domain_bounds": np.array([self.__l_bound, self.__u_bound], dtype=float),
+            "sampling_mode": np.array(self.__sampling_mode),
+            "archive_positions": self.__archive.means,
+            "archive_costs": self.__archive.costs,
+            "random_state": cp.Checkpoint.encodeRandomState(self.__random),
+            "iteration": np.array(self.__iteration),
+            "n_evaluations": np.array(self.__n_evaluations),
+            "elapsed_time": np.array(self.elapsed_time),
+            "stop_reason": np.array(self.__stop_reason or ""),
+            **self.__history.getState(),
+            **self.__sigma_engine.getState(),
+            **(self.__screen.getState() if self.__screen is not None else {}),
+        }
+        cp.Checkpoint.save(checkpoint_path, state)
+
+    def loadCheckpoint(self, checkpoint_path: str):
+        """
+        Restores the ACO algorithm state from a checkpoint file
+        :param: checkpoint_path: checkpoint file path
+        """
+        state = cp.Checkpoint.load(checkpoint_path)
+        if int(state["n_pop"]) != self.__n_pop or int(state["n_vars"]) != self.__n_vars:
+            raise ValueError(f"The checkpoint (n_pop={int(state['n_pop'])}, n_vars={int(state['n_vars'])}) does not match "
+                             f"the ACO algorithm (n_pop={self.__n_pop}, n_vars={self.__n_vars})")
+        self.__n_ants = int(state["n_ants"])
+        self.__max_terations = int(state["max_iterations"])
+        self.__q = float(state["q"])
+        self.__zeta = float(state["zeta"])
+        self.__config = cg.AcoConfig(n_ants=self.__n_ants, max_iterations=self.__max_terations, q=self.__q, zeta=self.__zeta)
+        self.__domain_bounds = state["domain_bounds"].tolist()
+        self.__l_bound, self.__u_bound = self.__domain_bounds
+        self.__sampling_mode = str(state["sampling_mode"])
+        self.__sigma_engine = sg.SigmaEngine(self.__zeta, self.__sigma_engine.method, kernel_backend=self.__kernel_backend)
+        self.__initializeArchive(state["archive_positions"], state["archive_costs"])
+        cp.Checkpoint.restoreRandomState(self.__random, state["random_state"])
+        self.__iteration = int(state["iteration"])
+        self.__n_evaluations = int(state["n_evaluations"])
+        self.__end_time = time()
+        self.__start_time = self.__end_time - float(state["elapsed_time"])
+        self.__history.setState(state)
+        self.__sigma_engine.setState(state)
+        if self.__screen is not None:
+            self.__screen.setState(state)
+        self.__stop_reason = str(state["stop_reason"]) or None
+
+    async def run(self):
+        """
+        Executes ACO algorithm main loop with an asyncio driver i.e. the ants of each generation are evaluated
+        concurrently (up to 'max_concurrency' calls), which suits I/O bound 'async def' cost functions
+        """
+        try:
+            await self.__initializationAsync()
+            for i in trange(self.__max_terations, disable=not self.__show_progress):
+                if await self.__runGenerationAsync():
+                    break
+            self.__finalizeRun()
+        finally:
+            if self.__owns_evaluator:
+                self.__evaluator.close()
+
+    def runGenerations(self, n_generations: int) -> int:
+        """
+        Advances the ACO algorithm main loop by (up to) 'n_generations' generations, initializing it on the first
+        call (used to interleave the main loop with other work e.g. the island model migrations). An evaluator
+        created from a backend name is kept open (its worker pool is reused) between the calls and closed once the run
+        is finished
+        :param: n_generations: number of generations
+        :return: number of executed generations
+        """
+        try:
+            if self.__archive is None:
+                self.__initialization()
+            self.__resumeRun()
+            start = self.__iteration
+            if self.__stop_reason is None:
+                for _ in range(min(n_generations, self.__max_terations - self.__iteration)):
+                    if self.__runGeneration():
+                        break
+                self.__finalizeRun()
+            return self.__iteration - start
+        finally:
+            if self.__owns_evaluator and self.__stop_reason is not None:
+                self.__evaluator.close()
+
+    def emigrate(self, n_migrants: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets (copies of) the best archive members
+        :param: n_migrants: number of migrants
+        :return: migrant positions (n_migrants, n_vars) and costs (n_migrants,)
+        """
+        return self.__archive.means[:n_migrants].copy(), self.__archive.costs[:n_migrants].copy()
+
+    def immigrate(self, positions: np.ndarray, costs: np.ndarray):
+        """
+        Merges evaluated migrants into the archive (replacing the worst archive members they improve on)
+        :param: positions: migrant positions (n_migrants, n_vars)
+        :param: costs: migrant costs (n_migrants,)
+        """
+        self.__archive.insert(positions, costs)
+        self.__sigma_engine.update(self.__archive.order, self.__archive.means, self.__archive.sample_positions)
+        self.__final_best_solution = self.__archive.best_population
     
     @property
     def pops(self):
         """
-        Getter property of the 'self.__pops' attribute
+        Getter property of the archive solutions (as 'Population' views of the 'self.__archive' positions)
         """
-        return self.__pops_sorted
+        return self.__archive.populations if self.__archive is not None else None
 
     @property
     def new_pops(self):
         """
-        Getter property of the 'self.__new_pops' attribute
+        Getter property of the new samples (as 'Population' views of the 'self.__archive' positions)
         """
-        return self.__new_pops
+        return self.__archive.sample_populations if self.__archive is not None else None
 
     @property
     def final_best_solution(self):
@@ -202,9 +681,97 @@ class AcorContinuousDomain(object):
     @property
     def best_solutions(self):
         """
-        Getter property of the 'self.__best_solutions' attribute
+        Getter property of the best solution per iteration (see 'History.HistoryRecorder.best_solutions')
+        """
+        return self.__history.best_solutions if self.__history is not None else [None]*self.__max_terations
+
+    @property
+    def generation_state(self):
+        """
+        Getter property of a snapshot ('Telemetry.GenerationState') of the current generation. The spread is the
+        largest standard deviation the generation was sampled with i.e. it lags the merged archive by one generation
+        (recomputing the standard deviations of the merged archive would double the cost of the sigma phase)
+        """
+        return t.GenerationState(iteration=self.__iteration,
+                                 best_cost=float(self.__final_best_solution.cost_function),
+                                 spread=float(np.max(self.__sigmas)),
+                                 n_evaluations=self.__n_evaluations,
+                                 elapsed_time=self.elapsed_time)
+
+    @property
+    def profiler(self):
+        """
+        Getter property of the 'self.__profiler' attribute i.e. the main loop phase profiler ('Profiling.PhaseProfiler'
+        when profiling is enabled, 'Profiling.NullProfiler' otherwise)
+        """
+        return self.__profiler
+
+    @property
+    def config(self):
+        """
+        Getter property of the 'self.__config' attribute i.e. the run hyperparameters
+        """
+        return self.__config
+
+    @property
+    def history(self):
+        """
+        Getter property of the 'self.__history' attribute i.e. the convergence history recorder
+        """
+        return self.__history
+
+    @property
+    def archive(self):
+        """
+        Getter property of the 'self.__archive' attribute
+        """
+        return self.__archive
+
+    @property
+    def evaluator(self):
+        """
+        Getter property of the 'self.__evaluator' attribute
+        """
+        return self.__evaluator
+
+    @property
+    def cache(self):
+        """
+        Getter property of the 'self.__cache' attribute i.e. the evaluation cache (None when disabled)
+        """
+        return self.__cache
+
+    @property
+    def iteration(self):
+        """
+        Getter property of the 'self.__iteration' attribute i.e. the number of executed generations
+        """
+        return self.__iteration
+
+    @property
+    def n_evaluations(self):
+        """
+        Getter property of the 'self.__n_evaluations' attribute i.e. the number of evaluated solutions
+        """
+        return self.__n_evaluations
+
+    @property
+    def elapsed_time(self):
+        """
+        Getter property of the elapsed run time (seconds) i.e. the time spent in the main loop up to now, or up to the
+        end of a finished (or paused) run
         """
-        return self.__best_solutions
+        if self.__start_time is None:
+            return 0.0
+        return (self.__end_time if self.__end_time is not None else time()) - self.__start_time
+
+    @property
+    def stop_reason(self):
+        """
+        Getter property of the 'self.__stop_reason' attribute i.e. the name of the stopping rule that fired
+        ('max_iterations' or the name of an early stopping criterion)
+        """
+        return self.__stop_reason
 
     @property
     def probs(self):
@@ -227,3 +794,52 @@ class AcorContinuousDomain(object):
         """
         return self.__sigmas
 
+    @property
+    def sigma_engine(self):
+        """
+        Getter property of the 'self.__sigma_engine' attribute
+        """
+        return self.__sigma_engine
+
+    @property
+    def surrogate_screen(self):
+        """
+        Getter property of the 'self.__screen' attribute i.e. the surrogate pre-screening (None if disabled)
+        """
+        return self.__screen
+
+    @property
+    def dtype(self):
+        """
+        Getter property of the 'self.__dtype' attribute i.e. the archive/sampling floating point type
+        """
+        return self.__dtype
+
+    @property
+    def cost_dtype(self):
+        """
+        Getter property of the 'self.__cost_dtype' attribute i.e. the costs floating point type
+        """
+        return self.__cost_dtype
+
+    @property
+    def kernel_backend(self):
+        """
+        Getter property of the 'self.__kernel_backend' attribute i.e. the resolved kernel backend
+        """
+        return self.__kernel_backend
+
+    @property
+    def sampler(self):
+        """
+        Getter property of the 'self.__sampler' attribute
+        """
+        return self.__sampler
+
+    @property
+    def sampling_mode(self):
+        """
+        Getter property of the 'self.__sampling_mode' attribute
+        """
+        return self.__sampling_mode
+
@@ -0,0 +1,156 @@
+from typing import List
+import numpy as np
+
+import Constants as c
+import Population as p
+
+
+class SolutionArchive(object):
+    """
+    Array-backed ACOR solution archive.
+
+    The archive solutions and the new ant samples share one contiguous (n_pop + n_ants, n_vars) position array
+    and one (n_pop + n_ants,) cost vector:
+
+        - rows [0, n_pop) hold the archive, sorted by ascending cost
+        - rows [n_pop, n_pop + n_ants) hold the new ant samples of the current generation
+
+    Merging sorts the cost vector and gathers the best n_pop rows back into the archive rows through
+    preallocated scratch buffers, so the only per-generation allocation is the sort index. The archive means
+    are a zero-copy view of the archive rows.
+
+    The positions and the costs have their own floating point precision, so e.g. a 'float32' archive (halving the
+    memory traffic of the sampling and sigma computations) can keep 'float64' costs and best solution.
+    """
+    def __init__(self,
+            n_pop: int,
+            n_ants: int,
+            n_vars: int,
+            dtype: object = c.AcoConstants.DTYPE,
+            cost_dtype: object = c.AcoConstants.COST_DTYPE):
+        """
+        Constructor
+        :param: n_pop: population size (archive size)
+        :param: n_ants: number of ants (new samples per generation)
+        :param: n_vars: number of variables
+        :param: dtype: positions data type i.e. 'float64' or 'float32'
+        :param: cost_dtype: costs (and best solution) data type i.e. 'float64' or 'float32'
+        """
+        self.__n_pop = n_pop
+        self.__n_ants = n_ants
+        self.__n_vars = n_vars
+        capacity = n_pop + n_ants
+        self.__positions = np.zeros((capacity, n_vars), dtype=dtype)
+        self.__costs = np.full(capacity, np.inf, dtype=cost_dtype)
+        self.__scratch_positions = np.zeros((n_pop, n_vars), dtype=dtype)
+        self.__scratch_costs = np.zeros(n_pop, dtype=cost_dtype)
+        self.__order = None
+
+    def initialize(self,
+            positions: np.ndarray,
+            costs: np.ndarray):
+        """
+        Loads the initial (unsorted) archive solutions
+        :param: positions: initial solution positions (n_pop, n_vars)
+        :param: costs: initial solution costs (n_pop,)
+        """
+        positions = np.asarray(positions, dtype=self.__positions.dtype)
+        costs = np.asarray(costs, dtype=self.__costs.dtype)
+        order = np.argsort(costs, kind="stable")
+        np.take(positions, order, axis=0, out=self.__positions[:self.__n_pop])
+        np.take(costs, order, out=self.__costs[:self.__n_pop])
+        self.__costs[self.__n_pop:] = np.inf
+
+    def merge(self):
+        """
+        Merges the archive and the new samples, sorts them by cost (ties keep the archive members first) and
+        keeps the best n_pop solutions in the archive rows
+        """
+        self.__order = np.argsort(self.__costs, kind="stable")
+        keep = self.__order[:self.__n_pop]
+        np.take(self.__positions, keep, axis=0, out=self.__scratch_positions)
+        np.take(self.__costs, keep, out=self.__scratch_costs)
+        self.__positions[:self.__n_pop] = self.__scratch_positions
+        self.__costs[:self.__n_pop] = self.__scratch_costs
+
+    def insert(self,
+            positions: np.ndarray,
+            costs: np.ndarray):
+        """
+        Merges externally evaluated solutions (e.g. island model migrants) into the archive
+        :param: positions: solution positions (n_solutions <= n_ants, n_vars)
+        :param: costs: solution costs (n_solutions,)
+        """
+        n_solutions = len(costs)
+        if n_solutions > self.__n_ants:
+            raise ValueError(f"Cannot insert {n_solutions} solutions, the archive holds at most {self.__n_ants} new solutions")
+        self.sample_positions[:n_solutions] = positions
+        self.sample_costs[:n_solutions] = costs
+        self.sample_costs[n_solutions:] = np.inf
+        self.merge()
+
+    @property
+    def means(self):
+        """
+        Getter property of the archive positions i.e. a zero-copy (n_pop, n_vars) view
+        """
+        return self.__positions[:self.__n_pop]
+
+    @property
+    def costs(self):
+        """
+        Getter property of the archive costs i.e. a zero-copy (n_pop,) view
+        """
+        return self.__costs[:self.__n_pop]
+
+    @property
+    def sample_positions(self):
+        """
+        Getter property of the new sample positions i.e. a zero-copy (n_ants, n_vars) view
+        """
+        return self.__positions[self.__n_pop:]
+
+    @property
+    def sample_costs(self):
+        """
+        Getter property of the new sample costs i.e. a zero-copy (n_ants,) view
+        """
+        return self.__costs[self.__n_pop:]
+
+    @property
+    def order(self):
+        """
+        Getter property of the sort index computed by the last merge
+        """
+        return self.__order
+
+    @property
+    def best_population(self):
+        """
+        Getter property of (a copy of) the best archive solution, with the costs precision
+        """
+        position = np.reshape(self.__positions[0], (-1, 1)).astype(self.__costs.dtype)
+        return p.Population(position=position, cost_function=self.__costs[0])
+
+    @property
+    def populations(self):
+        """
+        Getter property of the archive solutions as 'Population' views
+        """
+        return SolutionArchive.__createPopulationViews(self.means, self.costs)
+
+    @property
+    def sample_populations(self):
+        """
+        Getter property of the new samples as 'Population' views
+        """
+        return SolutionArchive.__createPopulationViews(self.sample_positions, self.sample_costs)
+
+    @staticmethod
+    def __createPopulationViews(positions: np.ndarray, costs: np.ndarray) -> List:
+        """
+        Creates 'Population' views of the rows of a position array
+        :param: positions: solution positions
+        :param: costs: solution costs
+        """
+        return [p.Population(position=np.reshape(positions[i], (-1, 1)), cost_function=costs[i]) for i in range(len(costs))]
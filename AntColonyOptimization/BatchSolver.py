@@ -0,0 +1,235 @@
+from time import time
+from typing import List, Optional, Sequence
+import numpy as np
+from tqdm import trange
+
+import Population as p
+import Constants as c
+import Sampling as s
+import Evaluators as e
+import Sigma as sg
+import RandomStreams as rs
+import Config as cg
+
+
+class BatchAcorContinuousDomain(object):
+    """
+    Batched ACOR solver i.e. advances 'n_instances' independent colonies (same-shaped problem instances) in lockstep.
+
+    The archives, means, sigmas and samples of all the colonies are stacked along a leading batch axis e.g. the
+    archive positions are an (n_instances, n_pop, n_vars) array, so each generation is sampled, evaluated (one
+    vectorized cost function call across all the instances), merged and sorted with a handful of NumPy calls
+    instead of one Python level ACO main loop per instance. The colonies share the ACO hyperparameters and one
+    random number generator.
+
+    The cost function is either:
+
+        - a cost function shared by all the instances (batch or single solution, see 'CostFunctions.batchCostFunction'),
+          evaluated through the 'evaluator' on the (n_instances * n_ants, n_vars) stacked samples
+        - an instance-aware cost function ('instance_aware=True') invoked with the (n_instances, n_ants, n_vars)
+          samples and returning the (n_instances, n_ants) costs, so every instance can be a different problem
+          (e.g. one calibration per asset)
+    """
+    def __init__(self,
+            n_instances: int,
+            n_pop: int,
+            n_vars: int,
+            cost_func: object,
+            domain_bounds: Sequence,
+            instance_aware: bool = False,
+            sigma_method: str = c.AcoConstants.SIGMA_METHOD,
+            evaluator: object = None,
+            random_seed: int = c.HelperConstants.RANDOM_SEED,
+            random: object = None,
+            bit_generator: str = c.HelperConstants.BIT_GENERATOR,
+            config: Optional[cg.AcoConfig] = None,
+            selection: str = c.AcoConstants.SELECTION):
+        """
+        Constructor
+        :param: n_instances: number of problem instances (colonies)
+        :param: n_pop: population size (archive size) of each colony
+        :param: n_vars: number of variables
+        :param: cost_func: cost function (see the class documentation)
+        :param: domain_bounds: continuous domain lower/upper bounds shared by all the instances ([l_bound, u_bound])
+                or per instance (an (n_instances, 2) sequence of [l_bound, u_bound] pairs)
+        :param: instance_aware: True if the cost function evaluates the (n_instances, n_ants, n_vars) samples
+        :param: sigma_method: sigma computation method i.e. 'loop', 'broadcast', 'sorted' or 'auto'
+        :param: evaluator: cost function evaluator of a shared cost function i.e. an 'Evaluators.Evaluator', a
+                backend name ('serial', 'thread' or 'process') or None (serial)
+        :param: random_seed: random number generator seed (integer or 'numpy.random.SeedSequence')
+        :param: random: injected random number generator (see 'AcorContinuousDomain'), overrides the seed
+        :param: bit_generator: bit generator of the seeded random number generator i.e. 'pcg64', 'philox' or 'legacy'
+                (see 'AcorContinuousDomain')
+        :param: config: run hyperparameters (None snapshots the 'AcoConstants' values)
+        :param: selection: kernel selection strategy i.e. 'roulette', 'alias', 'rank' or 'tournament' (see 'Selection')
+        """
+        if n_instances < 1:
+            raise ValueError(f"Invalid number of instances '{n_instances}', expected a positive integer")
+        bounds = np.asarray(domain_bounds, dtype=float)
+        if bounds.shape not in [(2,), (n_instances, 2)]:
+            raise ValueError(f"Invalid domain bounds shape {bounds.shape}, expected (2,) or ({n_instances}, 2)")
+        self.__n_instances = n_instances
+        self.__n_pop = n_pop
+        self.__n_vars = n_vars
+        config = config if config is not None else cg.AcoConfig()
+        self.__n_ants = config.n_ants
+        self.__max_terations = config.max_iterations
+        self.__q = config.q
+        self.__zeta = config.zeta
+        self.__l_bound = bounds[..., 0].reshape(-1, 1, 1) if bounds.ndim == 2 else bounds[0]
+        self.__u_bound = bounds[..., 1].reshape(-1, 1, 1) if bounds.ndim == 2 else bounds[1]
+        self.__cost_func = cost_func
+        self.__instance_aware = instance_aware
+        self.__evaluator = None if instance_aware else e.createEvaluator(cost_func, evaluator)
+        self.__owns_evaluator = evaluator is None or isinstance(evaluator, str)
+        self.__random_seed = random_seed
+        self.__random = rs.createRandomStream(random, random_seed, bit_generator)
+        self.__shares_random = random is not None or bit_generator != "legacy"
+        self.__sigma_engine = sg.SigmaEngine(self.__zeta, sigma_method)
+        self.__selection = selection
+        self.__positions = None
+        self.__costs = None
+        self.__sigmas = None
+        self.__sampler = None
+        self.__history = None
+        self.__iteration = 0
+        self.__n_evaluations = 0
+        self.__start_time = None
+
+    def __initialization(self):
+        """
+        Initialization of the batched ACO algorithm i.e. uniform initial archives, sorted by cost
+        """
+        self.__start_time = time()
+        capacity = self.__n_pop + self.__n_ants
+        self.__positions = np.zeros((self.__n_instances, capacity, self.__n_vars))
+        self.__costs = np.full((self.__n_instances, capacity), np.inf)
+        initial_random = self.__random if self.__shares_random else rs.createRandomStream(None, self.__random_seed, "legacy")
+        positions = initial_random.uniform(self.__l_bound, self.__u_bound, (self.__n_instances, self.__n_pop, self.__n_vars))
+        costs = self.__evaluate(positions)
+        order = np.argsort(costs, axis=1, kind="stable")
+        self.__positions[:, :self.__n_pop] = np.take_along_axis(positions, order[..., np.newaxis], axis=1)
+        self.__costs[:, :self.__n_pop] = np.take_along_axis(costs, order, axis=1)
+        self.__sigmas = np.zeros((self.__n_instances, self.__n_pop, self.__n_vars))
+        self.__history = np.full((self.__max_terations, self.__n_instances), np.nan)
+        self.__iteration = 0
+        self.__n_evaluations = self.__n_instances * self.__n_pop
+        points = np.array(range(self.__n_pop), dtype=float)
+        # Solution Weights
+        w = 1/(np.sqrt(2*np.pi)*self.__q*float(self.__n_pop))*np.square(np.exp(-0.5*((points-1)/(self.__q*float(self.__n_pop)))))
+        self.__sampler = s.KernelSampler(w/np.sum(w), self.__random, "vectorized", self.__selection)
+
+    def __evaluate(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the stacked solutions of all the instances with one (vectorized) cost function call
+        :param: positions: solution positions (n_instances, n_solutions, n_vars)
+        :return: solution costs (n_instances, n_solutions)
+        """
+        if self.__instance_aware:
+            return np.asarray(self.__cost_func(positions), dtype=float)
+        costs = self.__evaluator.evaluate(np.reshape(positions, (-1, self.__n_vars)))
+        return np.reshape(costs, positions.shape[:2])
+
+    def __runGeneration(self):
+        """
+        Executes one (lockstep) generation of all the colonies
+        """
+        means = self.__positions[:, :self.__n_pop]
+        self.__sigma_engine.compute(means, out=self.__sigmas)
+        samples = self.__sampler.sampleBatch(means, self.__sigmas, self.__n_ants)
+        s.KernelSampler.applyBounds(samples, self.__l_bound, self.__u_bound)
+        self.__positions[:, self.__n_pop:] = samples
+        self.__costs[:, self.__n_pop:] = self.__evaluate(samples)
+        # Merge Main Populations (Archives) and New Populations (Samples), Sort Populations and Delete Extra Members
+        keep = np.argsort(self.__costs, axis=1, kind="stable")[:, :self.__n_pop]
+        self.__positions[:, :self.__n_pop] = np.take_along_axis(self.__positions, keep[..., np.newaxis], axis=1)
+        self.__costs[:, :self.__n_pop] = np.take_along_axis(self.__costs, keep, axis=1)
+        # Store Best Costs
+        self.__history[self.__iteration] = self.__costs[:, 0]
+        self.__iteration += 1
+        self.__n_evaluations += self.__n_instances * self.__n_ants
+
+    def runMainLoop(self) -> List[p.Population]:
+        """
+        Executes the batched ACO algorithm main loop
+        :return: best solution of each instance
+        """
+        self.__initialization()
+        for i in trange(self.__max_terations):
+            self.__runGeneration()
+        if self.__owns_evaluator and self.__evaluator is not None:
+            self.__evaluator.close()
+        return self.final_best_solutions
+
+    @property
+    def final_best_solutions(self):
+        """
+        Getter property of the best solution ('Population') of each instance
+        """
+        if self.__positions is None:
+            return None
+        return [p.Population(position=np.reshape(self.__positions[i, 0], (-1, 1)).copy(), cost_function=self.__costs[i, 0])
+                for i in range(self.__n_instances)]
+
+    @property
+    def best_positions(self):
+        """
+        Getter property of the best position of each instance (n_instances, n_vars)
+        """
+        return self.__positions[:, 0].copy() if self.__positions is not None else None
+
+    @property
+    def best_costs(self):
+        """
+        Getter property of the best cost of each instance (n_instances,)
+        """
+        return self.__costs[:, 0].copy() if self.__costs is not None else None
+
+    @property
+    def means(self):
+        """
+        Getter property of the archive positions i.e. the Gaussian kernel means (n_instances, n_pop, n_vars)
+        """
+        return self.__positions[:, :self.__n_pop] if self.__positions is not None else None
+
+    @property
+    def sigmas(self):
+        """
+        Getter property of the 'self.__sigmas' attribute (n_instances, n_pop, n_vars)
+        """
+        return self.__sigmas
+
+    @property
+    def history(self):
+        """
+        Getter property of the best cost per iteration of each instance (n_iterations, n_instances)
+        """
+        return self.__history[:self.__iteration] if self.__history is not None else None
+
+    @property
+    def n_instances(self):
+        """
+        Getter property of the 'self.__n_instances' attribute
+        """
+        return self.__n_instances
+
+    @property
+    def iteration(self):
+        """
+        Getter property of the 'self.__iteration' attribute i.e. the number of executed generations
+        """
+        return self.__iteration
+
+    @property
+    def n_evaluations(self):
+        """
+        Getter property of the 'self.__n_evaluations' attribute i.e. the number of evaluated solutions (all instances)
+        """
+        return self.__n_evaluations
+
+    @property
+    def elapsed_time(self):
+        """
+        Getter property of the elapsed run time (seconds)
+        """
+        return time() - self.__start_time if self.__start_time is not None else 0.0
@@ -0,0 +1,379 @@
+import sys
+import json
+import argparse
+import platform
+import math
+import itertools
+import tracemalloc
+from time import perf_counter
+from typing import Dict, List, Optional
+import numpy as np
+
+import Constants as c
+import Acor as a
+import Config as cg
+import Surrogates as sr
+
+
+class BenchmarkSuite(object):
+    """
+    Reproducible (seeded, offline) benchmark suite of the ACO algorithm.
+
+    Every problem of 'ProblemConstants.COST_FUNC_MAP' is run across the grid of numbers of variables, population
+    (archive) sizes, numbers of ants and archive/sampling floating point types. Each benchmark records the generations per second and the cost function
+    evaluations per second (of the fastest of 'n_repeats' timed runs), the peak (traced) memory of a separate
+    run and the final best cost. The results can be saved as a JSON baseline and later runs compared against it,
+    flagging the throughput, memory and final cost regressions.
+
+    Usage (from the 'AntColonyOptimization' directory):
+
+        python Benchmark.py --save baseline.json
+        python Benchmark.py --compare baseline.json
+        python Benchmark.py --n-vars 1000 --n-pop 100 --n-ants 200 --dtype float64 float32
+    """
+    def __init__(self,
+            cases: Optional[List[str]] = None,
+            n_vars_grid: tuple = c.BenchmarkConstants.N_VARS_GRID,
+            n_pop_grid: tuple = c.BenchmarkConstants.N_POP_GRID,
+            n_ants_grid: tuple = c.BenchmarkConstants.N_ANTS_GRID,
+            n_generations: int = c.BenchmarkConstants.N_GENERATIONS,
+            n_repeats: int = c.BenchmarkConstants.N_REPEATS,
+            random_seed: int = c.HelperConstants.RANDOM_SEED,
+            dtype_grid: tuple = c.BenchmarkConstants.DTYPE_GRID,
+            **acor_kwargs):
+        """
+        Constructor
+        :param: cases: problem cases (keys of 'ProblemConstants.COST_FUNC_MAP') to benchmark (None for all)
+        :param: n_vars_grid: numbers of variables
+        :param: n_pop_grid: population (archive) sizes
+        :param: n_ants_grid: numbers of ants
+        :param: n_generations: number of generations per run
+        :param: n_repeats: number of timed runs per benchmark
+        :param: random_seed: random number generator seed
+        :param: dtype_grid: archive/sampling floating point types i.e. 'float64' and/or 'float32'
+        :param: acor_kwargs: additional 'AcorContinuousDomain' constructor arguments
+        """
+        self.__cases = list(cases) if cases is not None else list(c.ProblemConstants.COST_FUNC_MAP)
+        self.__n_vars_grid = n_vars_grid
+        self.__n_pop_grid = n_pop_grid
+        self.__n_ants_grid = n_ants_grid
+        self.__n_generations = n_generations
+        self.__n_repeats = n_repeats
+        self.__random_seed = random_seed
+        self.__dtype_grid = dtype_grid
+        self.__acor_kwargs = acor_kwargs
+        self.__results = None
+
+    def run(self, verbose: bool = False) -> List[Dict]:
+        """
+        Runs the benchmark suite
+        :param: verbose: prints each benchmark result if True
+        :return: benchmark results (one dictionary per benchmark)
+        """
+        self.__results = []
+        grid = itertools.product(self.__cases, self.__n_vars_grid, self.__n_pop_grid, self.__n_ants_grid, self.__dtype_grid)
+        for case, n_vars, n_pop, n_ants, dtype in grid:
+            result = self.__runBenchmark(case, n_vars, n_pop, n_ants, dtype)
+            self.__results.append(result)
+            if verbose:
+                print(f"{BenchmarkSuite.createKey(result)}: {result['generations_per_second']:.1f} generations/s, "
+                      f"{result['evaluations_per_second']:.1f} evaluations/s, peak memory = {result['peak_memory']} B, "
+                      f"final cost = {result['final_cost']:.6e}")
+        return self.__results
+
+    def __runBenchmark(self, case: str, n_vars: int, n_pop: int, n_ants: int, dtype: str) -> Dict:
+        """
+        Runs a single benchmark
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP[case]
+        run_times = []
+        for _ in range(self.__n_repeats):
+            acor = self.__createAcor(problem, n_vars, n_pop, n_ants, dtype)
+            acor.runGenerations(0)  # initialization (not timed)
+            start_time = perf_counter()
+            acor.runGenerations(self.__n_generations)
+            run_times.append(perf_counter() - start_time)
+        tracemalloc.start()
+        try:
+            memory_acor = self.__createAcor(problem, n_vars, n_pop, n_ants, dtype)
+            memory_acor.runGenerations(self.__n_generations)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        run_time = min(run_times)
+        return {"case": case,
+                "func_title": problem["func_title"],
+                "n_vars": n_vars,
+                "n_pop": n_pop,
+                "n_ants": n_ants,
+                "dtype": dtype,
+                "n_generations": acor.iteration,
+                "run_time": run_time,
+                "generations_per_second": acor.iteration / run_time,
+                "evaluations_per_second": acor.iteration * n_ants / run_time,
+                "peak_memory": peak_memory,
+                "final_cost": float(acor.final_best_solution.cost_function)}
+
+    def __createAcor(self, problem: Dict, n_vars: int, n_pop: int, n_ants: int, dtype: str) -> a.AcorContinuousDomain:
+        """
+        Creates the (seeded) ACO algorithm of a benchmark
+        """
+        return a.AcorContinuousDomain(n_pop=n_pop,
+                                      n_vars=n_vars,
+                                      cost_func=problem["func"],
+                                      domain_bounds=problem["bounds"],
+                                      random_seed=self.__random_seed,
+                                      config=cg.AcoConfig(n_ants=n_ants, max_iterations=self.__n_generations),
+                                      dtype=dtype,
+                                      **self.__acor_kwargs)
+
+    @staticmethod
+    def createKey(result: Dict) -> str:
+        """
+        Creates the key identifying a benchmark
+        :param: result: benchmark result
+        """
+        key = f"{result['case']}/n_vars={result['n_vars']}/n_pop={result['n_pop']}/n_ants={result['n_ants']}"
+        # The default precision keeps the keys of the baselines saved before the floating point type grid
+        dtype = result.get("dtype", "float64")
+        return key if dtype == "float64" else f"{key}/dtype={dtype}"
+
+    @staticmethod
+    def saveBaseline(path: str, results: List[Dict]):
+        """
+        Saves benchmark results as a JSON baseline (with the environment they were measured in)
+        :param: path: baseline file path
+        :param: results: benchmark results
+        """
+        baseline = {"environment": {"python": platform.python_version(),
+                                    "numpy": np.__version__,
+                                    "platform": platform.platform(),
+                                    "processor": platform.processor()},
+                    "results": results}
+        with open(path, "w") as baseline_file:
+            json.dump(baseline, baseline_file, indent=2)
+
+    @staticmethod
+    def loadBaseline(path: str) -> List[Dict]:
+        """
+        Loads the benchmark results of a JSON baseline
+        :param: path: baseline file path
+        """
+        with open(path) as baseline_file:
+            return json.load(baseline_file)["results"]
+
+    @staticmethod
+    def compare(results: List[Dict],
+            baseline: List[Dict],
+            speed_tolerance: float = c.BenchmarkConstants.SPEED_TOLERANCE,
+            memory_tolerance: float = c.BenchmarkConstants.MEMORY_TOLERANCE,
+            cost_tolerance: float = c.BenchmarkConstants.COST_TOLERANCE) -> List[Dict]:
+        """
+        Compares benchmark results against a baseline
+        :param: results: benchmark results
+        :param: baseline: baseline benchmark results (benchmarks missing from the baseline are ignored)
+        :param: speed_tolerance: allowed relative throughput decrease
+        :param: memory_tolerance: allowed relative peak memory increase
+        :param: cost_tolerance: allowed final cost increase (absolute, or relative for costs larger than one)
+        :return: regressions i.e. one dictionary (benchmark key, metric, baseline and current values) per regression
+        """
+        baseline_map = {BenchmarkSuite.createKey(x): x for x in baseline}
+        regressions = []
+        for result in results:
+            key = BenchmarkSuite.createKey(result)
+            reference = baseline_map.get(key)
+            if reference is None:
+                continue
+            checks = [("generations_per_second", result["generations_per_second"] < reference["generations_per_second"]*(1.0 - speed_tolerance)),
+                      ("evaluations_per_second", result["evaluations_per_second"] < reference["evaluations_per_second"]*(1.0 - speed_tolerance)),
+                      ("peak_memory", result["peak_memory"] > reference["peak_memory"]*(1.0 + memory_tolerance)),
+                      ("final_cost", result["final_cost"] > reference["final_cost"] + cost_tolerance*max(1.0, abs(reference["final_cost"])))]
+            for metric, regressed in checks:
+                if regressed:
+                    regressions.append({"benchmark": key,
+                                        "metric": metric,
+                                        "baseline": reference[metric],
+                                        "current": result[metric]})
+        return regressions
+
+    @property
+    def results(self):
+        """
+        Getter property of the 'self.__results' attribute
+        """
+        return self.__results
+
+
+class SurrogateReport(object):
+    """
+    Reports the reduction of the true cost function evaluations of the surrogate-assisted pre-screening.
+
+    Every problem of 'ProblemConstants.COST_FUNC_MAP' is run without (baseline) and with the surrogate pre-screening
+    on the same true evaluation budget. A quality level is a fraction of the best cost improvement of the baseline
+    run (from its initial archive to its final best cost), and the report lists the number of true evaluations each
+    run needed to reach it (None if it was not reached) and the relative reduction.
+
+    Usage (from the 'AntColonyOptimization' directory):
+
+        python Benchmark.py --surrogate-report quadratic
+    """
+    def __init__(self,
+            surrogate: str,
+            cases: Optional[List[str]] = None,
+            quality_levels: tuple = c.BenchmarkConstants.QUALITY_LEVELS,
+            n_pop: int = c.AcoConstants.N_POP,
+            n_ants: int = c.AcoConstants.N_ANTS,
+            n_generations: int = c.BenchmarkConstants.N_GENERATIONS,
+            random_seed: int = c.HelperConstants.RANDOM_SEED,
+            **acor_kwargs):
+        """
+        Constructor
+        :param: surrogate: surrogate pre-screening model i.e. 'quadratic' or 'rbf'
+        :param: cases: problem cases (keys of 'ProblemConstants.COST_FUNC_MAP') to report (None for all)
+        :param: quality_levels: fractions of the baseline best cost improvement
+        :param: n_pop: population size (archive size)
+        :param: n_ants: number of ants
+        :param: n_generations: number of generations of the baseline run (which sets the true evaluation budget)
+        :param: random_seed: random number generator seed
+        :param: acor_kwargs: additional 'AcorContinuousDomain' constructor arguments (e.g. the surrogate oversampling
+                and fraction)
+        """
+        if surrogate not in sr.SURROGATES:
+            raise ValueError(f"Invalid surrogate '{surrogate}', expected one of {sr.SURROGATES}")
+        self.__surrogate = surrogate
+        self.__cases = list(cases) if cases is not None else list(c.ProblemConstants.COST_FUNC_MAP)
+        self.__quality_levels = quality_levels
+        self.__n_pop = n_pop
+        self.__n_ants = n_ants
+        self.__n_generations = n_generations
+        self.__random_seed = random_seed
+        self.__acor_kwargs = acor_kwargs
+        self.__results = None
+
+    def run(self, verbose: bool = False) -> List[Dict]:
+        """
+        Runs the surrogate report
+        :param: verbose: prints each report row if True
+        :return: report rows (one dictionary per problem and quality level)
+        """
+        self.__results = []
+        for case in self.__cases:
+            problem = c.ProblemConstants.COST_FUNC_MAP[case]
+            initial_cost, baseline = self.__runAcor(problem, None, self.__n_generations)
+            # Same true evaluation budget i.e. more (pre-screened) generations
+            fraction = self.__acor_kwargs.get("surrogate_fraction", c.AcoConstants.SURROGATE_FRACTION)
+            n_evaluations = sr.SurrogateScreen(self.__surrogate, problem["n_dims"], fraction=fraction).getNumberOfEvaluations(self.__n_ants)
+            n_generations = math.ceil(self.__n_generations*self.__n_ants/n_evaluations)
+            _, screened = self.__runAcor(problem, self.__surrogate, n_generations)
+            final_cost = baseline[-1][1]
+            for quality_level in self.__quality_levels:
+                target_cost = initial_cost - quality_level*(initial_cost - final_cost)
+                baseline_evaluations = SurrogateReport.__countEvaluations(baseline, target_cost)
+                surrogate_evaluations = SurrogateReport.__countEvaluations(screened, target_cost)
+                reduction = None
+                if baseline_evaluations is not None and surrogate_evaluations is not None:
+                    reduction = 1.0 - surrogate_evaluations/baseline_evaluations
+                result = {"case": case,
+                          "func_title": problem["func_title"],
+                          "surrogate": self.__surrogate,
+                          "quality_level": quality_level,
+                          "target_cost": float(target_cost),
+                          "baseline_evaluations": baseline_evaluations,
+                          "surrogate_evaluations": surrogate_evaluations,
+                          "evaluation_reduction": reduction}
+                self.__results.append(result)
+                if verbose:
+                    print(f"{case}/{self.__surrogate}/quality={quality_level}: target cost = {target_cost:.6e}, "
+                          f"evaluations = {baseline_evaluations} (baseline) vs {surrogate_evaluations} (surrogate), "
+                          f"reduction = {'n/a' if reduction is None else f'{reduction:.1%}'}")
+        return self.__results
+
+    def __runAcor(self, problem: Dict, surrogate: Optional[str], n_generations: int):
+        """
+        Runs the (seeded) ACO algorithm of a problem
+        :return: initial best cost and the (number of true evaluations, best cost) pair of every generation
+        """
+        trace = []
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                      n_vars=problem["n_dims"],
+                                      cost_func=problem["func"],
+                                      domain_bounds=problem["bounds"],
+                                      random_seed=self.__random_seed,
+                                      config=cg.AcoConfig(n_ants=self.__n_ants, max_iterations=n_generations),
+                                      callbacks=[lambda state: trace.append((state.n_evaluations, state.best_cost))],
+                                      surrogate=surrogate,
+                                      **self.__acor_kwargs)
+        acor.runGenerations(0)
+        initial_cost = float(acor.final_best_solution.cost_function)
+        acor.runGenerations(n_generations)
+        return initial_cost, trace
+
+    @staticmethod
+    def __countEvaluations(trace: List, target_cost: float) -> Optional[int]:
+        """
+        Counts the true evaluations needed to reach a target cost (None if it was not reached)
+        """
+        for n_evaluations, best_cost in trace:
+            if best_cost <= target_cost:
+                return int(n_evaluations)
+        return None
+
+    @property
+    def results(self):
+        """
+        Getter property of the 'self.__results' attribute
+        """
+        return self.__results
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Benchmark suite command line entry point
+    :param: args: command line arguments (None for 'sys.argv')
+    :return: exit code (1 if regressions were flagged)
+    """
+    parser = argparse.ArgumentParser(description="ACOR benchmark suite")
+    parser.add_argument("--cases", nargs="+", default=None, help="problem cases (default: all)")
+    parser.add_argument("--n-vars", nargs="+", type=int, default=c.BenchmarkConstants.N_VARS_GRID)
+    parser.add_argument("--n-pop", nargs="+", type=int, default=c.BenchmarkConstants.N_POP_GRID)
+    parser.add_argument("--n-ants", nargs="+", type=int, default=c.BenchmarkConstants.N_ANTS_GRID)
+    parser.add_argument("--dtype", nargs="+", choices=a.AcorContinuousDomain.FLOAT_TYPES, default=c.BenchmarkConstants.DTYPE_GRID)
+    parser.add_argument("--n-generations", type=int, default=c.BenchmarkConstants.N_GENERATIONS)
+    parser.add_argument("--n-repeats", type=int, default=c.BenchmarkConstants.N_REPEATS)
+    parser.add_argument("--save", default=None, help="baseline file the results are saved to")
+    parser.add_argument("--compare", default=None, help="baseline file the results are compared against")
+    parser.add_argument("--speed-tolerance", type=float, default=c.BenchmarkConstants.SPEED_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=c.BenchmarkConstants.MEMORY_TOLERANCE)
+    parser.add_argument("--cost-tolerance", type=float, default=c.BenchmarkConstants.COST_TOLERANCE)
+    parser.add_argument("--surrogate-report", choices=sr.SURROGATES, default=None,
+                        help="reports the true evaluation reduction of a surrogate pre-screening instead")
+    options = parser.parse_args(args)
+    if options.surrogate_report is not None:
+        SurrogateReport(options.surrogate_report, cases=options.cases, n_generations=options.n_generations).run(verbose=True)
+        return 0
+    suite = BenchmarkSuite(cases=options.cases,
+                           n_vars_grid=options.n_vars,
+                           n_pop_grid=options.n_pop,
+                           n_ants_grid=options.n_ants,
+                           n_generations=options.n_generations,
+                           n_repeats=options.n_repeats,
+                           dtype_grid=options.dtype)
+    results = suite.run(verbose=True)
+    if options.save is not None:
+        BenchmarkSuite.saveBaseline(options.save, results)
+    if options.compare is not None:
+        regressions = BenchmarkSuite.compare(results,
+                                             BenchmarkSuite.loadBaseline(options.compare),
+                                             options.speed_tolerance,
+                                             options.memory_tolerance,
+                                             options.cost_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression['benchmark']} {regression['metric']}: "
+                  f"baseline = {regression['baseline']}, current = {regression['current']}")
+        print(f"{len(regressions)} regression(s) flagged")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+from typing import Dict, Tuple
+import numpy as np
+
+
+class BufferPool(object):
+    """
+    Pool of named, reusable scratch arrays of the ACO algorithm hot loop.
+
+    A buffer is allocated on its first request and handed out again (in place) by every later request of the
+    same name, shape and data type, so a component that fills its buffers with 'out=' writes allocates them once
+    per run instead of once per generation. The allocations are counted, which makes the allocation churn of the
+    hot loop measurable.
+    """
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__buffers = {}
+        self.__n_allocations = 0
+
+    def get(self,
+            name: str,
+            shape: Tuple[int, ...],
+            dtype: object = float) -> np.ndarray:
+        """
+        Gets a scratch buffer (allocated on the first request or when its shape/data type changes)
+        :param: name: buffer name
+        :param: shape: buffer shape
+        :param: dtype: buffer data type
+        :return: uninitialized buffer
+        """
+        buffer = self.__buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self.__buffers[name] = buffer
+            self.__n_allocations += 1
+        return buffer
+
+    def clear(self):
+        """
+        Releases the pooled buffers
+        """
+        self.__buffers.clear()
+
+    @property
+    def n_allocations(self):
+        """
+        Getter property of the 'self.__n_allocations' attribute i.e. the number of buffer allocations
+        """
+        return self.__n_allocations
+
+    @property
+    def n_bytes(self):
+        """
+        Getter property of the memory held by the pooled buffers (bytes)
+        """
+        return sum(buffer.nbytes for buffer in self.__buffers.values())
+
+    @property
+    def shapes(self) -> Dict[str, Tuple[int, ...]]:
+        """
+        Getter property of the pooled buffer shapes (by name)
+        """
+        return {name: buffer.shape for name, buffer in self.__buffers.items()}
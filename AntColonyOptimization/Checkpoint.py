@@ -0,0 +1,98 @@
+import os
+import json
+import tempfile
+from typing import Any, Dict
+import numpy as np
+
+
+class Checkpoint(object):
+    """
+    Checkpoint (save/load) helpers of the ACO algorithm state.
+
+    A checkpoint is a single binary NumPy '.npz' file of named arrays (no pickled objects). Nested state such as
+    the random number generator state is stored as a JSON string array. Checkpoints are written atomically i.e.
+    to a temporary file of the target directory that then replaces the target file, so an interrupted write never
+    corrupts the previous checkpoint.
+    """
+
+    @staticmethod
+    def save(path: str, state: Dict[str, Any]):
+        """
+        Atomically writes a checkpoint
+        :param: path: checkpoint file path
+        :param: state: checkpoint state i.e. a dictionary of arrays/scalars/strings
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(prefix=".checkpoint-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                np.savez(temp_file, **state)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def load(path: str) -> Dict[str, np.ndarray]:
+        """
+        Reads a checkpoint
+        :param: path: checkpoint file path
+        :return: checkpoint state i.e. a dictionary of arrays
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return {key: data[key] for key in data.files}
+
+    @staticmethod
+    def encodeRandomState(random: object) -> np.ndarray:
+        """
+        Encodes the state of a random number generator ('RandomState' or 'Generator') as a JSON string array
+        :param: random: random number generator (or 'RandomStreams.RandomStream')
+        """
+        random = getattr(random, "generator", random)
+        if isinstance(random, np.random.RandomState):
+            state = random.get_state(legacy=False)
+        else:
+            state = random.bit_generator.state
+        return np.array(json.dumps(Checkpoint.__toJson(state)))
+
+    @staticmethod
+    def restoreRandomState(random: object, encoded_state: np.ndarray):
+        """
+        Restores the state of a random number generator ('RandomState' or 'Generator')
+        :param: random: random number generator (or 'RandomStreams.RandomStream')
+        :param: encoded_state: JSON string array created by 'encodeRandomState'
+        """
+        random = getattr(random, "generator", random)
+        state = Checkpoint.__fromJson(json.loads(str(encoded_state)))
+        if isinstance(random, np.random.RandomState):
+            random.set_state(state)
+        else:
+            random.bit_generator.state = state
+
+    @staticmethod
+    def __toJson(value: Any) -> Any:
+        """
+        Converts nested state (with NumPy arrays/scalars) to JSON serializable values
+        """
+        if isinstance(value, dict):
+            return {key: Checkpoint.__toJson(item) for key, item in value.items()}
+        if isinstance(value, np.ndarray):
+            return {"__ndarray__": value.tolist(), "dtype": str(value.dtype)}
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    @staticmethod
+    def __fromJson(value: Any) -> Any:
+        """
+        Converts JSON values back to nested state (with NumPy arrays)
+        """
+        if isinstance(value, dict):
+            if "__ndarray__" in value:
+                return np.array(value["__ndarray__"], dtype=value["dtype"])
+            return {key: Checkpoint.__fromJson(item) for key, item in value.items()}
+        return value
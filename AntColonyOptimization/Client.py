@@ -1,10 +1,12 @@
-import matplotlib.pyplot as plt
+import sys
+import argparse
 from pprint import pformat
 
 import Population as p 
 import Constants as c
 import Acor as a
 import Utils as u
+import Config as cg
 
 
 
@@ -17,10 +19,27 @@ class Client(object):
                  cost_func, 
                  domain_bounds,
                  func_title,
-                 problem_use_case="case_1"
+                 problem_use_case="case_1",
+                 evaluator=None,
+                 stopping_criteria=None,
+                 checkpoint_path=None,
+                 checkpoint_interval=c.AcoConstants.CHECKPOINT_INTERVAL,
+                 config=None,
+                 headless=False,
+                 output_path=None,
+                 plot_path=None
                  ):
         """
         Constructor
+        :param: evaluator: cost function evaluator i.e. an 'Evaluators.Evaluator', a backend name ('serial', 'thread',
+                'process' or 'distributed') or None (serial)
+        :param: stopping_criteria: early stopping criteria (see 'StoppingCriteria')
+        :param: checkpoint_path: checkpoint file path (None disables checkpointing)
+        :param: checkpoint_interval: number of generations between checkpoints
+        :param: config: run hyperparameters i.e. a 'Config.AcoConfig' (None snapshots the 'AcoConstants' values)
+        :param: headless: runs without any window or progress bar (matplotlib is only imported to save 'plot_path')
+        :param: output_path: JSON (or '.npz') file path the results are written to (None does not write them)
+        :param: plot_path: image file path the performance plot is saved to (None does not save it)
         """
         self.__problem_use_case = problem_use_case
         self.__n_vars = n_vars
@@ -28,31 +47,69 @@ class Client(object):
         self.__domain_bounds = domain_bounds
         self.__func_title = func_title       
         self.__n_pop = n_pop
-        self.__solutions = None
+        self.__history = None
+        self.__evaluator = evaluator
+        self.__stopping_criteria = stopping_criteria
+        self.__checkpoint_path = checkpoint_path
+        self.__checkpoint_interval = checkpoint_interval
+        self.__config = config
+        self.__headless = headless
+        self.__output_path = output_path
+        self.__plot_path = plot_path
+        self.__final_best_solution = None
 
     def runOptimizationRoutine(self):
         """
         Entry Point used to run the ACO algorithm
         """
+        self.__runOptimization()
+
+    def resumeOptimizationRoutine(self, checkpoint_path):
+        """
+        Entry Point used to resume the ACO algorithm from a checkpoint
+        :param: checkpoint_path: checkpoint file path
+        """
+        self.__runOptimization(checkpoint_path)
+
+    def __runOptimization(self, resume_checkpoint_path=None):
+        """
+        Runs (or resumes from a checkpoint) the ACO algorithm and reports its performance
+        :param: resume_checkpoint_path: checkpoint file path to resume from (None starts a new run)
+        """
         start_time = u.Helpers.getStartTime()
         acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
                                        n_vars=self.__n_vars, 
                                        cost_func=self.__cost_func, 
-                                       domain_bounds=self.__domain_bounds)
+                                       domain_bounds=self.__domain_bounds,
+                                       evaluator=self.__evaluator,
+                                       stopping_criteria=self.__stopping_criteria,
+                                       checkpoint_path=self.__checkpoint_path,
+                                       checkpoint_interval=self.__checkpoint_interval,
+                                       config=self.__config,
+                                       show_progress=not self.__headless)
         print(f"The main loop computation is now running..")
         print(f"{c.HelperConstants.CARRIAGE_RETURN}")
         print(f"{c.HelperConstants.CARRIAGE_RETURN}")
-        acor.runMainLoop()
-        self.__solutions = acor.best_solutions
-        print(f"Now Plotting the optimization performance..")
-        print(f"{c.HelperConstants.CARRIAGE_RETURN}")
-        print(f"{c.HelperConstants.CARRIAGE_RETURN}")
-        print(f"{c.HelperConstants.CARRIAGE_RETURN}")
-        self.__plotAlgorithmperformance()
+        if resume_checkpoint_path is None:
+            acor.runMainLoop()
+        else:
+            acor.resumeMainLoop(resume_checkpoint_path)
+        self.__history = acor.history
+        self.__final_best_solution = acor.final_best_solution
+        if self.__output_path is not None:
+            u.Helpers.saveAcoResults(self.__output_path, acor, problem_use_case=self.__problem_use_case, func_title=self.__func_title)
+            print(f"The results were written to '{self.__output_path}'")
+        if not self.__headless or self.__plot_path is not None:
+            print(f"Now Plotting the optimization performance..")
+            print(f"{c.HelperConstants.CARRIAGE_RETURN}")
+            print(f"{c.HelperConstants.CARRIAGE_RETURN}")
+            print(f"{c.HelperConstants.CARRIAGE_RETURN}")
+            self.__plotAlgorithmperformance()
         run_time = u.Helpers.computeTotalRunTime(start_time)
         result = u.Helpers.printAcoResults(acor.final_best_solution)
         print(f"Best soltion:{c.HelperConstants.CARRIAGE_RETURN}{c.HelperConstants.CARRIAGE_RETURN}{result}")
         print(f"ACO compute time is: {run_time}")
+        print(f"ACO stopped after {acor.iteration} iterations ({acor.n_evaluations} evaluations), stopping rule: '{acor.stop_reason}'")
         print(f"{c.HelperConstants.CARRIAGE_RETURN}")
         print(f"{c.HelperConstants.CARRIAGE_RETURN}")
 
@@ -60,29 +117,42 @@ class Client(object):
     @property
     def __plotData(self):
         """
-        getter propert to retrieve the data use to plot the ACO performance
+        getter propert to retrieve the (downsampled) data use to plot the ACO performance
         """
-        X = [x.position for x in self.__solutions]
-        f_x = [x.cost_function for x in self.__solutions]
-        return X, f_x
+        iterations, f_x = self.__history.downsample(c.HelperConstants.MAX_PLOT_POINTS)
+        return iterations, f_x
 
     def __plotAlgorithmperformance(self):
         """
         Plots the performance/convergence of the ACO algorithm  for a specified optimization problem
         """            
-        X, f_x = self.__plotData
+        iterations, f_x = self.__plotData
         best_f_x = f_x[-1] 
         title_msg = f"ACO performance for the '{self.__func_title}' problem with optimal f_x = {best_f_x:.4e}, bounds = {str(self.__domain_bounds)} and dimensions = {str(self.__n_vars)}"
-        iterations = range(len(X))
-        #fig, ax = plt.subplots()
-        fig = plt.figure(figsize=(10,6))
+        # matplotlib is imported lazily (the headless mode renders off-screen, without pyplot)
+        if self.__headless:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(10,6))
+        else:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(10,6))
         ax = fig.add_subplot(111) 
         ax.plot(iterations, f_x, label='ACO performance') 
         ax.set_xlabel('Iterations')  
         ax.set_ylabel('Fitness') 
         ax.set_title(title_msg, fontdict={'fontsize': 8})  
         ax.legend() 
-        plt.show() 
+        if self.__plot_path is not None:
+            fig.savefig(self.__plot_path)
+        if not self.__headless:
+            plt.show() 
+
+    @property
+    def final_best_solution(self):
+        """
+        Getter property of the 'self.__final_best_solution' attribute
+        """
+        return self.__final_best_solution
 
 def runAcoClient():
     """
@@ -94,7 +164,7 @@ def runAcoClient():
     domain_bounds = c.ProblemConstants.COST_FUNC_MAP[problem_case]["bounds"]
     func_title = c.ProblemConstants.COST_FUNC_MAP[problem_case]["func_title"]
     n_pop = c.AcoConstants.N_POP
-    c.AcoConstants.MAX_ITERATIONS = 1000
+    config = cg.AcoConfig(max_iterations=1000)
     print(f"{c.HelperConstants.DIVIDER}")
     print(f"{c.HelperConstants.CARRIAGE_RETURN}")
     print(f"Start of the demonstration of the minimization of the Continuous domain function {func_title} using Ant Colony Optimization..")
@@ -104,7 +174,8 @@ def runAcoClient():
                  cost_func=cost_func, 
                  domain_bounds=domain_bounds,
                  func_title=func_title,
-                 problem_use_case=problem_case
+                 problem_use_case=problem_case,
+                 config=config
                  )
     client.runOptimizationRoutine()
     print(f"{c.HelperConstants.CARRIAGE_RETURN}")
@@ -115,6 +186,50 @@ def runAcoClient():
     print(f"{c.HelperConstants.CARRIAGE_RETURN}")
 
 
+def main(args=None):
+    """
+    Command line entry point used to run a 'ProblemConstants.COST_FUNC_MAP' case (with optional overrides) e.g.
+
+        python Client.py --case case_2 --n-vars 30 --max-iterations 500 --headless --output results.json
+
+    Without any command line argument (i.e. 'python Client.py') the demo ('runAcoClient') is run
+    :param: args: command line arguments (None for 'sys.argv')
+    :return: exit code
+    """
+    args = sys.argv[1:] if args is None else args
+    if not args:
+        runAcoClient()
+        return 0
+    parser = argparse.ArgumentParser(description="Ant Colony Optimization for Continuous Domains (ACOR)")
+    parser.add_argument("--case", default="case_4", choices=sorted(c.ProblemConstants.COST_FUNC_MAP), help="problem case")
+    parser.add_argument("--n-vars", type=int, default=None, help="number of variables (default: the case dimensions)")
+    parser.add_argument("--bounds", type=float, nargs=2, default=None, help="domain lower/upper bounds (default: the case bounds)")
+    parser.add_argument("--n-pop", type=int, default=c.AcoConstants.N_POP, help="population (archive) size")
+    parser.add_argument("--n-ants", type=int, default=c.AcoConstants.N_ANTS, help="number of ants")
+    parser.add_argument("--max-iterations", type=int, default=c.AcoConstants.MAX_ITERATIONS, help="maximum number of iterations")
+    parser.add_argument("--q", type=float, default=c.AcoConstants.Q, help="intensification factor")
+    parser.add_argument("--zeta", type=float, default=c.AcoConstants.ZETA, help="deviation-distance ratio")
+    parser.add_argument("--evaluator", default=None, choices=["serial", "thread", "process"], help="evaluation backend")
+    parser.add_argument("--headless", action="store_true", help="runs without any window or progress bar")
+    parser.add_argument("--output", default=None, help="JSON (or '.npz') results file")
+    parser.add_argument("--plot", default=None, help="performance plot image file")
+    options = parser.parse_args(args)
+    problem = c.ProblemConstants.COST_FUNC_MAP[options.case]
+    client = Client(n_pop=options.n_pop,
+                 n_vars=options.n_vars if options.n_vars is not None else problem["n_dims"],
+                 cost_func=problem["func"],
+                 domain_bounds=options.bounds if options.bounds is not None else problem["bounds"],
+                 func_title=problem["func_title"],
+                 problem_use_case=options.case,
+                 evaluator=options.evaluator,
+                 config=cg.AcoConfig(n_ants=options.n_ants, max_iterations=options.max_iterations, q=options.q, zeta=options.zeta),
+                 headless=options.headless,
+                 output_path=options.output,
+                 plot_path=options.plot
+                 )
+    client.runOptimizationRoutine()
+    return 0
+
 
 if __name__ == "__main__":
-    runAcoClient()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,42 @@
+import dataclasses
+from dataclasses import dataclass, field
+
+import Constants as c
+
+
+@dataclass(frozen=True)
+class AcoConfig(object):
+    """
+    Immutable per-run hyperparameters of the ACO algorithm.
+
+    The fields default to the 'AcoConstants' values at creation time, so 'AcoConfig()' snapshots the (global)
+    constants whilst 'AcoConfig(q=0.1, max_iterations=200)' overrides them for one run only. Differently
+    configured ACO algorithms can therefore run side by side (e.g. in threads) without mutating 'AcoConstants'.
+    """
+    n_ants: int = field(default_factory=lambda: c.AcoConstants.N_ANTS)                      # Number of ants
+    max_iterations: int = field(default_factory=lambda: c.AcoConstants.MAX_ITERATIONS)      # Maximum Number of Iterations
+    q: float = field(default_factory=lambda: c.AcoConstants.Q)                              # Intensification Factor (Selection Pressure)
+    zeta: float = field(default_factory=lambda: c.AcoConstants.ZETA)                        # Deviation-Distance Ratio
+
+    def __post_init__(self):
+        if self.n_ants < 1:
+            raise ValueError(f"Invalid number of ants '{self.n_ants}', expected a positive integer")
+        if self.max_iterations < 0:
+            raise ValueError(f"Invalid maximum number of iterations '{self.max_iterations}', expected a non-negative integer")
+        if self.q <= 0.0:
+            raise ValueError(f"Invalid intensification factor (q) '{self.q}', expected a positive value")
+        if self.zeta <= 0.0:
+            raise ValueError(f"Invalid deviation-distance ratio (zeta) '{self.zeta}', expected a positive value")
+
+    def replace(self, **changes) -> "AcoConfig":
+        """
+        Creates a copy of the configuration with some hyperparameters changed
+        :param: changes: changed hyperparameters
+        """
+        return dataclasses.replace(self, **changes)
+
+    def toDict(self) -> dict:
+        """
+        Converts the configuration to a dictionary
+        """
+        return dataclasses.asdict(self)
@@ -9,6 +9,8 @@ class HelperConstants(object):
     CARRIAGE_RETURN = "\n"
     N_EPOCHS_FOR_DISPLAY = 50
     RANDOM_SEED = 100
+    BIT_GENERATOR = "pcg64"                 # Random bit generator ('legacy' RandomState, 'pcg64' or 'philox' Generator), the 'legacy' sampling mode defaults to 'legacy'
+    MAX_PLOT_POINTS = 2000
 
 class ProblemConstants(object):
     """
@@ -51,3 +53,58 @@ class AcoConstants(object):
     #Q = 0.5
     Q = 0.5                                 # Intensification Factor (Selection Pressure)
     ZETA = 1                                # Deviation-Distance Ratio
+    SAMPLING_MODE = "vectorized"            # Ant sampling engine ('vectorized' or 'legacy')
+    SIGMA_METHOD = "auto"                   # Sigma engine ('loop', 'broadcast', 'sorted' or 'auto')
+    SIGMA_CHUNK_SIZE = 64                   # Archive members per chunk of the 'broadcast' sigma engine
+    SELECTION = "roulette"                  # Kernel selection strategy ('roulette', 'alias', 'rank' or 'tournament')
+    TOURNAMENT_SIZE = 2                     # Archive members per tournament of the 'tournament' kernel selection
+    RANK_SELECTION_PRESSURE = 1.5           # Linear ranking selection pressure (in [1, 2]) of the 'rank' kernel selection
+    SIGMA_REFRESH_INTERVAL = 100            # Incremental updates between full recomputations of the 'incremental' sigma engine
+    DTYPE = "float64"                       # Archive/sampling floating point precision ('float64' or 'float32')
+    COST_DTYPE = "float64"                  # Costs and reported best solution floating point precision ('float64' or 'float32')
+    KERNEL_BACKEND = "numpy"                # Hot path kernels ('numpy', 'numba' (compiled, falls back to 'numpy' without Numba) or 'auto')
+    EVALUATION_BACKEND = "serial"           # Cost function evaluation backend ('serial', 'thread', 'process' or 'distributed')
+    MAX_CONCURRENCY = 16                    # Maximum concurrent (async) cost function calls per generation
+    EVALUATION_CACHE_SIZE = None            # Evaluation cache (LRU) size (None disables the cache)
+    EVALUATION_CACHE_TOLERANCE = None       # Evaluation cache position quantization tolerance (None for exact positions)
+    DISTRIBUTED_ADDRESS = "tcp://127.0.0.1:0"   # Distributed evaluation: coordinator address ('tcp://host:port' (port 0 picks a free port) or 'unix:///path')
+    DISTRIBUTED_N_WORKERS = None            # Distributed evaluation: local worker processes (None for the number of CPU cores)
+    DISTRIBUTED_BATCH_SIZE = None           # Distributed evaluation: solutions per task (None for an even split across the workers)
+    HEARTBEAT_INTERVAL = 1.0                # Distributed evaluation: seconds between the heartbeats of a busy worker
+    HEARTBEAT_TIMEOUT = 10.0                # Distributed evaluation: seconds of silence after which a busy worker is lost
+    TASK_TIMEOUT = None                     # Distributed evaluation: seconds after which a task is re-dispatched (None disables it)
+    CONNECT_TIMEOUT = 30.0                  # Distributed evaluation: seconds to wait for a worker (coordinator) to connect
+    MAX_RETRIES = 3                         # Distributed evaluation: maximum re-dispatches of a lost task
+    MIGRATION_INTERVAL = 50                 # Island model: generations between migrations
+    N_MIGRANTS = 2                          # Island model: best archive members sent by each island per migration
+    CHECKPOINT_INTERVAL = 100               # Generations between checkpoints
+    HISTORY_MODE = "full"                   # Convergence history mode ('full', 'costs', 'sampled' or 'memmap')
+    HISTORY_INTERVAL = 10                   # Position sampling interval (iterations) of the 'sampled' history mode
+    SURROGATE = None                        # Surrogate pre-screening model ('quadratic', 'rbf' or None to disable it)
+    SURROGATE_OVERSAMPLING = 4              # Surrogate pre-screening: sampled candidates per ant
+    SURROGATE_FRACTION = 0.5                # Surrogate pre-screening: fraction of the ants truly evaluated per generation
+    SURROGATE_FORGETTING = 0.95             # Forgetting factor of the (incremental) 'quadratic' surrogate
+    SURROGATE_MAX_SAMPLES = 200             # Training samples (the best ones) kept by the 'rbf' surrogate
+    SURROGATE_SMOOTHING = 1e-10             # Interpolation matrix regularization of the 'rbf' surrogate
+
+class BenchmarkConstants(object):
+    """
+    Benchmark suite specifications
+    """
+    N_VARS_GRID = (2, 10, 30)               # Numbers of decision variables benchmarked
+    N_POP_GRID = (10, 50)                   # Population (archive) sizes benchmarked
+    N_ANTS_GRID = (40,)                     # Numbers of ants benchmarked
+    DTYPE_GRID = ("float64",)               # Archive/sampling floating point types benchmarked ('float64' and/or 'float32')
+    N_GENERATIONS = 100                     # Generations per benchmark run
+    N_REPEATS = 3                           # Timed repeats per benchmark (the fastest one is kept)
+    SPEED_TOLERANCE = 0.25                  # Allowed relative throughput decrease before flagging a regression
+    MEMORY_TOLERANCE = 0.25                 # Allowed relative peak memory increase before flagging a regression
+    COST_TOLERANCE = 1e-6                   # Allowed (absolute/relative) final cost increase before flagging a regression
+    QUALITY_LEVELS = (0.5, 0.9, 0.99)       # Surrogate report: fractions of the baseline best cost improvement to reach
+
+class SweepConstants(object):
+    """
+    Hyperparameter sweep specifications
+    """
+    SEARCH_MODE = "grid"                    # Search mode ('grid' or 'random')
+    N_TRIALS = 20                           # Number of trials of the random search
@@ -1,10 +1,31 @@
-import numpy as np
-
 """
 Continious domain (constrained) common optimization functions
 Reference: https://www.sfu.ca/~ssurjano/optimization.html
+
+Batch evaluation contract: a cost function declares that it can evaluate a whole generation at once by exposing
+a 'batch' attribute i.e. a callable that accepts an (n_ants, n_vars) matrix of solutions and returns an (n_ants,)
+cost vector. The 'batchCostFunction' decorator declares the contract for the built-in functions below, which can
+still be called with a single (n_vars, 1) solution to return a scalar cost.
 """
+import functools
+import numpy as np
+
+import Kernels as kr
+
 
+def batchCostFunction(func):
+    """
+    Decorator used to declare a batch cost function
+    :param: func: batch cost function i.e. (n_ants, n_vars) matrix -> (n_ants,) cost vector
+    :return: single solution cost function exposing 'func' via its 'batch' attribute
+    """
+    @functools.wraps(func)
+    def scalarCostFunction(x):
+        return func(np.reshape(x, (1, -1)))[0]
+    scalarCostFunction.batch = func
+    return scalarCostFunction
+
+@batchCostFunction
 def dp(x):
     """
     Diagonal Plane
@@ -13,9 +34,10 @@ def dp(x):
     Optimal x_hat : [x0, x1, ... xN] =  [0.5, 0.5,... 0.5]
     Optimal f_x_hat = 0.5
     """
-    y = np.mean(x)
+    y = np.mean(x, axis=1)
     return y
 
+@batchCostFunction
 def sphere(x):
     """
     Sphere
@@ -24,9 +46,10 @@ def sphere(x):
     Optimal x_hat : [x0, x1, ... xN] =  [0.0, 0.0,... 0.0]
     Optimal f_x_hat = 0.0
     """
-    y = np.sum(np.power(x,2))
+    y = np.sum(np.power(x,2), axis=1)
     return y
 
+@batchCostFunction
 def stybtangm(x):
     """
     Styblinski-Tang function
@@ -36,9 +59,10 @@ def stybtangm(x):
     Optimal x_hat : [x0, x1, ... xN] =  [-2.903534, -2.903534,...-2.903534]
     Optimal f_x_hat = -39.16599
     """
-    y = (np.sum(np.power(x, 4.0) - 16.0*np.square(x) + 5.0*x))/2.0
+    y = (np.sum(np.power(x, 4.0) - 16.0*np.square(x) + 5.0*x, axis=1))/2.0
     return y
 
+@batchCostFunction
 def rastrigin(x):
     """
     Rastrigin function
@@ -48,11 +72,35 @@ def rastrigin(x):
     Optimal x_hat : [x0, x1, ... xN] =  [0.0, 0.0,...0.0]
     Optimal f_x_hat = 0.0
     """
-    d = x.shape[0]
-    y = 10.0*d + np.sum((np.square(x) - 10*np.cos(2*np.pi*x)))
+    d = x.shape[1]
+    y = 10.0*d + np.sum((np.square(x) - 10*np.cos(2*np.pi*x)), axis=1)
     return y
-    
-    
 
-    
-    
\ No newline at end of file
+
+@batchCostFunction
+def rastriginCompiled(x):
+    """
+    Rastrigin function evaluated by the compiled kernel (see 'Kernels'), or by 'rastrigin' without Numba
+    """
+    if not kr.hasNumba():
+        return rastrigin.batch(x)
+    return kr.rastrigin(np.ascontiguousarray(x, dtype=np.result_type(x, np.float32)))
+
+@batchCostFunction
+def stybtangmCompiled(x):
+    """
+    Styblinski-Tang function evaluated by the compiled kernel (see 'Kernels'), or by 'stybtangm' without Numba
+    """
+    if not kr.hasNumba():
+        return stybtangm.batch(x)
+    return kr.stybtangm(np.ascontiguousarray(x, dtype=np.result_type(x, np.float32)))
+
+COMPILED_COST_FUNCTIONS = {rastrigin: rastriginCompiled, stybtangm: stybtangmCompiled}
+
+def getCompiledCostFunction(func):
+    """
+    Gets the compiled twin of a built-in cost function
+    :param: func: cost function
+    :return: compiled cost function (the cost function itself if it has no compiled twin)
+    """
+    return COMPILED_COST_FUNCTIONS.get(func, func)
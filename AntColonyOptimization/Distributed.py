@@ -0,0 +1,612 @@
+import os
+import sys
+import math
+import stat
+import time
+import socket
+import struct
+import argparse
+import importlib
+import selectors
+import threading
+import traceback
+import collections
+import multiprocessing as mp
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+import Constants as c
+import CostFunctions as cf
+import Evaluators as e
+
+"""
+Socket based distributed evaluation farm of the ACO algorithm.
+
+A coordinator ('DistributedEvaluator') listens on a TCP or Unix socket and evaluation workers ('runWorker'), either
+local worker processes or processes on other nodes, connect to it. Each generation the coordinator splits the ant
+solutions into tasks, dispatches them to the idle workers and gathers the costs in the solution order.
+
+Every message is a binary frame i.e. a fixed size header (message type, payload data type, task id, rows, columns)
+followed by the raw little endian array bytes, so the positions and costs are sent without any pickling.
+"""
+
+PROTOCOL_VERSION = 1
+
+MSG_HELLO = 1                               # Worker -> coordinator: handshake (task id field = protocol version)
+MSG_TASK = 2                                # Coordinator -> worker: solution positions (n_solutions, n_vars)
+MSG_RESULT = 3                              # Worker -> coordinator: solution costs (n_solutions, 1)
+MSG_HEARTBEAT = 4                           # Worker -> coordinator: liveness signal sent while evaluating a task
+MSG_ERROR = 5                               # Worker -> coordinator: cost function traceback (UTF-8 bytes)
+MSG_SHUTDOWN = 6                            # Coordinator -> worker: stop request
+
+HEADER = struct.Struct("!BBQII")
+PAYLOAD_TYPES = (np.dtype("<f8"), np.dtype("<f4"), np.dtype("u1"))
+
+
+def parseAddress(address: str) -> Tuple[int, object]:
+    """
+    Parses a coordinator address
+    :param: address: 'tcp://host:port' or 'unix:///path/to/socket'
+    :return: socket family and socket address
+    """
+    if address.startswith("unix://"):
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError(f"Unix sockets are not supported on this platform '{address}'")
+        return socket.AF_UNIX, address[len("unix://"):]
+    if address.startswith("tcp://"):
+        host, _, port = address[len("tcp://"):].rpartition(":")
+        if host and port.isdigit():
+            return socket.AF_INET, (host.strip("[]"), int(port))
+    raise ValueError(f"Invalid address '{address}', expected 'tcp://host:port' or 'unix:///path'")
+
+
+def formatAddress(family: int, address: object) -> str:
+    """
+    Formats a socket address as a coordinator address
+    :param: family: socket family
+    :param: address: socket address
+    """
+    if family == getattr(socket, "AF_UNIX", None):
+        return f"unix://{address}"
+    return f"tcp://{address[0]}:{address[1]}"
+
+
+def sendFrame(sock: socket.socket, message_type: int, task_id: int = 0, array: Optional[np.ndarray] = None):
+    """
+    Sends a binary frame
+    :param: sock: connected socket
+    :param: message_type: message type
+    :param: task_id: task id
+    :param: array: optional 1D/2D payload array (float64, float32 or uint8)
+    """
+    if array is None:
+        sock.sendall(HEADER.pack(message_type, 0, task_id, 0, 0))
+        return
+    array = np.asarray(array)
+    type_code = PAYLOAD_TYPES.index(array.dtype.newbyteorder("<") if array.dtype.itemsize > 1 else array.dtype)
+    array = np.ascontiguousarray(array, dtype=PAYLOAD_TYPES[type_code])
+    n_rows, n_cols = (array.shape[0], 1) if array.ndim == 1 else array.shape
+    sock.sendall(b"".join((HEADER.pack(message_type, type_code, task_id, n_rows, n_cols), array.data)))
+
+
+def receiveFrame(sock: socket.socket) -> Tuple[int, int, Optional[np.ndarray]]:
+    """
+    Receives a binary frame
+    :param: sock: connected socket
+    :return: message type, task id and payload array (None for an empty payload)
+    """
+    message_type, type_code, task_id, n_rows, n_cols = HEADER.unpack(_receiveExactly(sock, HEADER.size))
+    if n_rows*n_cols == 0:
+        return message_type, task_id, None
+    dtype = PAYLOAD_TYPES[type_code]
+    payload = _receiveExactly(sock, n_rows*n_cols*dtype.itemsize)
+    return message_type, task_id, np.frombuffer(payload, dtype=dtype).reshape(n_rows, n_cols)
+
+
+def _receiveExactly(sock: socket.socket, n_bytes: int) -> bytearray:
+    """
+    Receives exactly 'n_bytes' bytes
+    :param: sock: connected socket
+    :param: n_bytes: number of bytes
+    """
+    buffer = bytearray(n_bytes)
+    view = memoryview(buffer)
+    n_received = 0
+    while n_received < n_bytes:
+        n_chunk = sock.recv_into(view[n_received:])
+        if n_chunk == 0:
+            raise ConnectionError("Connection closed by the peer")
+        n_received += n_chunk
+    return buffer
+
+
+def loadCostFunction(name: str) -> object:
+    """
+    Loads a cost function by name
+    :param: name: built-in cost function name (see 'CostFunctions') or 'module:function'
+    """
+    if ":" in name:
+        module_name, _, func_name = name.partition(":")
+        return getattr(importlib.import_module(module_name), func_name)
+    cost_func = getattr(cf, name, None)
+    if not callable(cost_func):
+        raise ValueError(f"Invalid cost function '{name}'")
+    return cost_func
+
+
+class _WorkerConnection(object):
+    """
+    Coordinator side state of a connected evaluation worker
+    """
+    def __init__(self, sock: socket.socket, now: float):
+        self.sock = sock
+        self.is_ready = False
+        self.task_id = None
+        self.dispatched_at = now
+        self.last_seen = now
+
+
+class DistributedEvaluator(object):
+    """
+    Coordinator of a socket based evaluation farm, used as the ACO algorithm evaluator (see 'Evaluators').
+
+    The coordinator listens on 'address' and starts 'n_local_workers' local worker processes; workers of other nodes
+    join by running this module ('python Distributed.py --address <address> --cost-func <name>') and may connect or
+    leave at any time. The solutions of each evaluation are split into tasks of 'batch_size' rows, dispatched to the
+    idle workers and gathered in the solution order, so the costs are independent of the worker scheduling.
+
+    A busy worker sends heartbeats every 'heartbeat_interval' seconds. A worker whose connection is closed, that is
+    silent for more than 'heartbeat_timeout' seconds or that holds a task for more than 'task_timeout' seconds is
+    dropped and its task is re-dispatched to another worker (up to 'max_retries' times). Evaluating without any
+    connected worker for more than 'connect_timeout' seconds raises a 'TimeoutError'.
+    """
+    def __init__(self,
+            cost_func: object,
+            address: str = c.AcoConstants.DISTRIBUTED_ADDRESS,
+            n_local_workers: Optional[int] = c.AcoConstants.DISTRIBUTED_N_WORKERS,
+            batch_size: Optional[int] = c.AcoConstants.DISTRIBUTED_BATCH_SIZE,
+            heartbeat_interval: float = c.AcoConstants.HEARTBEAT_INTERVAL,
+            heartbeat_timeout: float = c.AcoConstants.HEARTBEAT_TIMEOUT,
+            task_timeout: Optional[float] = c.AcoConstants.TASK_TIMEOUT,
+            connect_timeout: float = c.AcoConstants.CONNECT_TIMEOUT,
+            max_retries: int = c.AcoConstants.MAX_RETRIES):
+        """
+        Constructor
+        :param: cost_func: batch or single solution cost function of the local workers (must be picklable)
+        :param: address: coordinator address i.e. 'tcp://host:port' (port 0 picks a free port) or 'unix:///path'
+        :param: n_local_workers: number of local worker processes (None for the number of CPU cores, 0 for remote
+                workers only)
+        :param: batch_size: number of solutions per task (None for an even split across the connected workers)
+        :param: heartbeat_interval: seconds between the heartbeats of a busy worker
+        :param: heartbeat_timeout: seconds of silence after which a busy worker is considered lost
+        :param: task_timeout: seconds after which a task is re-dispatched (None disables the task timeout)
+        :param: connect_timeout: seconds an evaluation waits for a worker to connect
+        :param: max_retries: maximum number of re-dispatches of a task
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"Invalid batch size '{batch_size}', expected a positive integer")
+        if heartbeat_timeout <= heartbeat_interval:
+            raise ValueError(f"Invalid heartbeat timeout '{heartbeat_timeout}', expected more than the heartbeat "
+                             f"interval '{heartbeat_interval}'")
+        parseAddress(address)
+        self.__cost_func = cost_func
+        self.__address = address
+        self.__n_local_workers = n_local_workers if n_local_workers is not None else (os.cpu_count() or 1)
+        self.__batch_size = batch_size
+        self.__heartbeat_interval = heartbeat_interval
+        self.__heartbeat_timeout = heartbeat_timeout
+        self.__task_timeout = task_timeout
+        self.__connect_timeout = connect_timeout
+        self.__max_retries = max_retries
+        self.__listener = None
+        self.__selector = None
+        self.__workers = {}
+        self.__processes = []
+        self.__next_task_id = 1
+        self.__n_evaluations = 0
+        self.__n_tasks = 0
+        self.__n_redispatched = 0
+        self.__n_lost_workers = 0
+
+    def start(self):
+        """
+        Starts listening and the local worker processes, waiting for them to connect (called by the first evaluation
+        if needed)
+        """
+        if self.__listener is not None:
+            return
+        family, address = parseAddress(self.__address)
+        if family == socket.AF_INET:
+            self.__listener = socket.socket(family, socket.SOCK_STREAM)
+            self.__listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        else:
+            if os.path.exists(address):
+                # Only a stale socket (e.g. of a crashed coordinator) is replaced, never a regular file
+                if not stat.S_ISSOCK(os.stat(address).st_mode):
+                    raise FileExistsError(f"The unix socket path '{address}' exists and is not a socket")
+                os.remove(address)
+            self.__listener = socket.socket(family, socket.SOCK_STREAM)
+        self.__listener.bind(address)
+        self.__listener.listen()
+        self.__listener.setblocking(False)
+        self.__address = formatAddress(family, self.__listener.getsockname())
+        self.__selector = selectors.DefaultSelector()
+        self.__selector.register(self.__listener, selectors.EVENT_READ)
+        for _ in range(self.__n_local_workers):
+            process = mp.Process(target=runWorker,
+                                 args=(self.__address, self.__cost_func, self.__heartbeat_interval, self.__connect_timeout),
+                                 daemon=True)
+            process.start()
+            self.__processes.append(process)
+        self.waitForWorkers(self.__n_local_workers)
+
+    def waitForWorkers(self, n_workers: int, timeout: Optional[float] = None) -> int:
+        """
+        Waits for workers to connect
+        :param: n_workers: number of workers to wait for
+        :param: timeout: seconds to wait (defaults to the connect timeout)
+        :return: number of connected workers
+        """
+        if self.__listener is None:
+            self.start()
+        deadline = time.monotonic() + (timeout if timeout is not None else self.__connect_timeout)
+        while self.n_workers < n_workers:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{self.n_workers} of {n_workers} evaluation worker(s) connected to {self.__address}")
+            self.__poll(min(remaining, self.__heartbeat_interval), None)
+        return self.n_workers
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of solutions on the workers
+        :param: positions: solution positions (n_ants, n_vars)
+        :return: solution costs (n_ants,)
+        """
+        self.start()
+        positions = np.atleast_2d(positions)
+        n_solutions = positions.shape[0]
+        self.__n_evaluations += n_solutions
+        costs = np.empty(n_solutions, dtype=float)
+        tasks = self.__createTasks(positions)
+        state = {"positions": positions, "costs": costs, "tasks": tasks, "attempts": dict.fromkeys(tasks, 0),
+                 "pending": collections.deque(tasks)}
+        # Idle workers were not polled since the previous evaluation, their liveness is measured from now on
+        now = time.monotonic()
+        for worker in self.__workers.values():
+            worker.last_seen = now
+        without_workers_since = None
+        while state["tasks"]:
+            self.__dispatch(state)
+            self.__poll(self.__heartbeat_interval, state)
+            self.__checkTimeouts(state)
+            if self.n_workers > 0:
+                without_workers_since = None
+            elif without_workers_since is None:
+                without_workers_since = time.monotonic()
+            elif time.monotonic() - without_workers_since > self.__connect_timeout:
+                raise TimeoutError(f"No evaluation worker connected to {self.__address} "
+                                   f"within {self.__connect_timeout} seconds")
+        return costs
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of solutions (see 'evaluate')
+        """
+        return self.evaluate(positions)
+
+    def __createTasks(self, positions: np.ndarray) -> Dict[int, Tuple[int, int]]:
+        """
+        Splits the solutions into tasks (contiguous row ranges)
+        :param: positions: solution positions (n_ants, n_vars)
+        :return: row range of each task (by task id)
+        """
+        n_solutions = positions.shape[0]
+        batch_size = self.__batch_size
+        if batch_size is None:
+            batch_size = max(1, math.ceil(n_solutions / max(1, self.n_workers, self.__n_local_workers)))
+        tasks = {}
+        for start in range(0, n_solutions, batch_size):
+            tasks[self.__next_task_id] = (start, min(start + batch_size, n_solutions))
+            self.__next_task_id += 1
+        self.__n_tasks += len(tasks)
+        return tasks
+
+    def __dispatch(self, state: Dict):
+        """
+        Sends the pending tasks to the idle workers
+        """
+        for worker in list(self.__workers.values()):
+            if not state["pending"]:
+                break
+            if not worker.is_ready or worker.task_id is not None:
+                continue
+            task_id = state["pending"].popleft()
+            start, stop = state["tasks"][task_id]
+            worker.task_id = task_id
+            worker.dispatched_at = worker.last_seen = time.monotonic()
+            try:
+                sendFrame(worker.sock, MSG_TASK, task_id, state["positions"][start:stop])
+            except OSError:
+                self.__dropWorker(worker, state)
+
+    def __poll(self, timeout: float, state: Optional[Dict]):
+        """
+        Accepts the connecting workers and handles the received frames
+        :param: timeout: seconds to wait for an event
+        :param: state: evaluation state (None outside of an evaluation)
+        """
+        for key, _ in self.__selector.select(timeout):
+            if key.fileobj is self.__listener:
+                self.__accept()
+                continue
+            worker = key.data
+            try:
+                message_type, task_id, payload = receiveFrame(worker.sock)
+            except (OSError, ConnectionError, struct.error):
+                self.__dropWorker(worker, state)
+                continue
+            worker.last_seen = time.monotonic()
+            if message_type == MSG_HELLO:
+                if task_id != PROTOCOL_VERSION:
+                    self.__dropWorker(worker, state)
+                    continue
+                worker.is_ready = True
+            elif message_type == MSG_RESULT:
+                if worker.task_id == task_id:
+                    worker.task_id = None
+                if state is not None and task_id in state["tasks"]:
+                    start, stop = state["tasks"].pop(task_id)
+                    state["costs"][start:stop] = payload[:, 0]
+            elif message_type == MSG_ERROR:
+                # The worker itself is healthy i.e. it stays available to the next evaluations, and the (late)
+                # errors of the tasks of an abandoned evaluation are ignored
+                if worker.task_id == task_id:
+                    worker.task_id = None
+                if state is None or task_id not in state["tasks"]:
+                    continue
+                message = bytes(payload).decode("utf-8", errors="replace")
+                raise RuntimeError(f"Evaluation worker failed:{c.HelperConstants.CARRIAGE_RETURN}{message}")
+
+    def __accept(self):
+        """
+        Accepts a connecting worker
+        """
+        try:
+            sock, _ = self.__listener.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(True)
+        sock.settimeout(self.__heartbeat_timeout)
+        if sock.family == socket.AF_INET:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        worker = _WorkerConnection(sock, time.monotonic())
+        self.__workers[sock] = worker
+        self.__selector.register(sock, selectors.EVENT_READ, worker)
+
+    def __checkTimeouts(self, state: Dict):
+        """
+        Drops the busy workers exceeding the heartbeat or the task timeout
+        """
+        now = time.monotonic()
+        for worker in list(self.__workers.values()):
+            if worker.task_id is None:
+                continue
+            if now - worker.last_seen > self.__heartbeat_timeout or \
+               (self.__task_timeout is not None and now - worker.dispatched_at > self.__task_timeout):
+                self.__dropWorker(worker, state)
+
+    def __dropWorker(self, worker: _WorkerConnection, state: Optional[Dict]):
+        """
+        Closes a (lost) worker connection and re-dispatches its task
+        """
+        self.__selector.unregister(worker.sock)
+        del self.__workers[worker.sock]
+        worker.sock.close()
+        self.__n_lost_workers += 1
+        if state is None or worker.task_id not in state["tasks"]:
+            return
+        state["attempts"][worker.task_id] += 1
+        if state["attempts"][worker.task_id] > self.__max_retries:
+            raise RuntimeError(f"Task {worker.task_id} was lost more than {self.__max_retries} times")
+        state["pending"].appendleft(worker.task_id)
+        self.__n_redispatched += 1
+
+    def close(self):
+        """
+        Stops the workers and the coordinator
+        """
+        for worker in list(self.__workers.values()):
+            try:
+                sendFrame(worker.sock, MSG_SHUTDOWN)
+            except OSError:
+                pass
+            worker.sock.close()
+        self.__workers.clear()
+        for process in self.__processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.__processes = []
+        if self.__selector is not None:
+            self.__selector.close()
+            self.__selector = None
+        if self.__listener is not None:
+            self.__listener.close()
+            self.__listener = None
+            family, address = parseAddress(self.__address)
+            if family != socket.AF_INET and os.path.exists(address) and stat.S_ISSOCK(os.stat(address).st_mode):
+                os.remove(address)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def backend(self):
+        """
+        Getter property of the evaluation backend name
+        """
+        return "distributed"
+
+    @property
+    def cost_func(self):
+        """
+        Getter property of the 'self.__cost_func' attribute
+        """
+        return self.__cost_func
+
+    @property
+    def address(self):
+        """
+        Getter property of the 'self.__address' attribute (the bound address once started)
+        """
+        return self.__address
+
+    @property
+    def n_workers(self):
+        """
+        Getter property of the number of connected (handshaken) workers
+        """
+        return sum(worker.is_ready for worker in self.__workers.values())
+
+    @property
+    def n_evaluations(self):
+        """
+        Getter property of the 'self.__n_evaluations' attribute i.e. the number of evaluated solutions
+        """
+        return self.__n_evaluations
+
+    @property
+    def n_tasks(self):
+        """
+        Getter property of the 'self.__n_tasks' attribute i.e. the number of (first) dispatched tasks
+        """
+        return self.__n_tasks
+
+    @property
+    def n_redispatched(self):
+        """
+        Getter property of the 'self.__n_redispatched' attribute i.e. the number of re-dispatched tasks
+        """
+        return self.__n_redispatched
+
+    @property
+    def n_lost_workers(self):
+        """
+        Getter property of the 'self.__n_lost_workers' attribute i.e. the number of dropped worker connections
+        """
+        return self.__n_lost_workers
+
+
+def runWorker(address: str,
+        cost_func: object,
+        heartbeat_interval: float = c.AcoConstants.HEARTBEAT_INTERVAL,
+        connect_timeout: float = c.AcoConstants.CONNECT_TIMEOUT) -> int:
+    """
+    Evaluation worker loop i.e. connects to a coordinator and evaluates its tasks until it shuts down
+    :param: address: coordinator address i.e. 'tcp://host:port' or 'unix:///path'
+    :param: cost_func: batch or single solution cost function
+    :param: heartbeat_interval: seconds between the heartbeats sent while evaluating a task (None disables them)
+    :param: connect_timeout: seconds the worker retries to connect to the coordinator
+    :return: number of evaluated tasks
+    """
+    batch_cost_func = e.BatchCostFunction(cost_func)
+    sock = _connect(address, connect_timeout)
+    send_lock = threading.Lock()
+    busy, stopped = threading.Event(), threading.Event()
+
+    def sendHeartbeats():
+        while not stopped.wait(heartbeat_interval):
+            if busy.is_set():
+                try:
+                    with send_lock:
+                        sendFrame(sock, MSG_HEARTBEAT)
+                except OSError:
+                    break
+
+    if heartbeat_interval is not None:
+        threading.Thread(target=sendHeartbeats, daemon=True).start()
+    n_tasks = 0
+    try:
+        with send_lock:
+            sendFrame(sock, MSG_HELLO, PROTOCOL_VERSION)
+        while True:
+            message_type, task_id, positions = receiveFrame(sock)
+            if message_type == MSG_SHUTDOWN:
+                break
+            if message_type != MSG_TASK:
+                continue
+            busy.set()
+            try:
+                costs = batch_cost_func(positions)
+            except Exception:
+                with send_lock:
+                    sendFrame(sock, MSG_ERROR, task_id, np.frombuffer(traceback.format_exc().encode("utf-8"), dtype="u1"))
+                continue
+            finally:
+                busy.clear()
+            with send_lock:
+                sendFrame(sock, MSG_RESULT, task_id, costs)
+            n_tasks += 1
+    except (OSError, ConnectionError):
+        pass
+    finally:
+        stopped.set()
+        sock.close()
+    return n_tasks
+
+
+def _connect(address: str, connect_timeout: float) -> socket.socket:
+    """
+    Connects to a coordinator, retrying until it listens
+    :param: address: coordinator address
+    :param: connect_timeout: seconds to retry
+    """
+    family, sock_address = parseAddress(address)
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.connect(sock_address)
+            break
+        except OSError:
+            sock.close()
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+    if family == socket.AF_INET:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    return sock
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Evaluation worker command line entry point
+    :param: args: command line arguments (None for 'sys.argv')
+    :return: exit code
+    """
+    parser = argparse.ArgumentParser(description="ACOR distributed evaluation worker")
+    parser.add_argument("--address", required=True, help="coordinator address i.e. 'tcp://host:port' or 'unix:///path'")
+    parser.add_argument("--cost-func", required=True, help="built-in cost function name or 'module:function'")
+    parser.add_argument("--n-workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--heartbeat-interval", type=float, default=c.AcoConstants.HEARTBEAT_INTERVAL)
+    parser.add_argument("--connect-timeout", type=float, default=c.AcoConstants.CONNECT_TIMEOUT)
+    options = parser.parse_args(args)
+    worker_args = (options.address, loadCostFunction(options.cost_func), options.heartbeat_interval, options.connect_timeout)
+    if options.n_workers == 1:
+        runWorker(*worker_args)
+        return 0
+    processes = [mp.Process(target=runWorker, args=worker_args) for _ in range(options.n_workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
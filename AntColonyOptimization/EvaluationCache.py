@@ -0,0 +1,199 @@
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+import Constants as c
+import Evaluators as e
+
+
+class CachedCostFunction(object):
+    """
+    Memoization layer in front of a cost function.
+
+    The costs are cached per solution position, keyed on the raw position values or, when a tolerance is
+    specified, on the positions quantized to a grid of that tolerance (so nearby solutions e.g. ants clipped onto
+    the same domain corner share one evaluation). The cache memory is bounded by a least recently used (LRU)
+    eviction policy and the cache hits/misses are counted.
+
+    The cached cost function declares the batch evaluation contract (see 'CostFunctions.batchCostFunction'):
+    the cache misses of a batch are de-duplicated and evaluated with one (batch) call of the wrapped cost function.
+    The cache can also sit in front of an evaluator ('evaluate'/'evaluateAsync'), so the lookups stay in the calling
+    process and only the misses are dispatched (e.g. to a process pool or to the asyncio driver).
+    """
+    def __init__(self,
+            cost_func: object,
+            max_size: int,
+            tolerance: Optional[float] = c.AcoConstants.EVALUATION_CACHE_TOLERANCE):
+        """
+        Constructor
+        :param: cost_func: batch or single solution cost function ('async def' cost functions are evaluated by
+                'evaluateAsync' only)
+        :param: max_size: maximum number of cached costs
+        :param: tolerance: position quantization tolerance (None caches the exact positions)
+        """
+        if max_size < 1:
+            raise ValueError(f"Invalid cache size '{max_size}', expected a positive integer")
+        if tolerance is not None and tolerance <= 0.0:
+            raise ValueError(f"Invalid cache tolerance '{tolerance}', expected a positive value")
+        self.__batch_cost_func = e.BatchCostFunction(cost_func)
+        self.__is_async = inspect.iscoroutinefunction(cost_func)
+        self.__max_size = max_size
+        self.__tolerance = tolerance
+        self.__cache = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __call__(self, x: np.ndarray) -> float:
+        """
+        Evaluates a single solution
+        :param: x: solution position (n_vars, 1)
+        :return: solution cost
+        """
+        return self.batch(np.reshape(x, (1, -1)))[0]
+
+    def batch(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of solutions
+        :param: positions: solution positions (n_ants, n_vars)
+        :return: solution costs (n_ants,)
+        """
+        if self.__is_async:
+            raise TypeError("The costs of an 'async def' cost function are evaluated by 'evaluateAsync'")
+        return self.evaluate(positions, self.__batch_cost_func)
+
+    def evaluate(self, positions: np.ndarray, evaluate_func: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Evaluates a batch of solutions, only sending the (de-duplicated) cache misses to an evaluation function
+        e.g. the 'evaluate' method of an 'Evaluators.Evaluator'
+        :param: positions: solution positions (n_ants, n_vars)
+        :param: evaluate_func: batch evaluation function of the cache misses
+        :return: solution costs (n_ants,)
+        """
+        positions = np.atleast_2d(positions)
+        costs, misses = self.__lookup(positions)
+        if misses:
+            self.__insert(costs, misses, evaluate_func(positions[[indices[0] for indices in misses.values()]]))
+        return costs
+
+    async def evaluateAsync(self, positions: np.ndarray, evaluate_func: Callable[[np.ndarray], Awaitable]) -> np.ndarray:
+        """
+        Evaluates a batch of solutions, only awaiting the (de-duplicated) cache misses e.g. with the 'evaluate'
+        coroutine of an 'Evaluators.AsyncEvaluator'
+        :param: positions: solution positions (n_ants, n_vars)
+        :param: evaluate_func: asynchronous batch evaluation function of the cache misses
+        :return: solution costs (n_ants,)
+        """
+        positions = np.atleast_2d(positions)
+        costs, misses = self.__lookup(positions)
+        if misses:
+            self.__insert(costs, misses, await evaluate_func(positions[[indices[0] for indices in misses.values()]]))
+        return costs
+
+    def __lookup(self, positions: np.ndarray) -> Tuple[np.ndarray, Dict[bytes, List[int]]]:
+        """
+        Looks the solution costs up in the cache
+        :param: positions: solution positions (n_ants, n_vars)
+        :return: solution costs (only set for the cache hits) and the solution indices of each missed key
+        """
+        keys = [self.__createKey(position) for position in positions]
+        costs = np.empty(len(keys))
+        misses = {}
+        with self.__lock:
+            for i, key in enumerate(keys):
+                if key in self.__cache:
+                    self.__cache.move_to_end(key)
+                    costs[i] = self.__cache[key]
+                    self.__hits += 1
+                else:
+                    misses.setdefault(key, []).append(i)
+        return costs, misses
+
+    def __insert(self, costs: np.ndarray, misses: Dict[bytes, List[int]], miss_costs: np.ndarray):
+        """
+        Caches the evaluated costs of the cache misses
+        :param: costs: solution costs (filled in place)
+        :param: misses: solution indices of each missed key
+        :param: miss_costs: evaluated costs (one per missed key)
+        """
+        with self.__lock:
+            for (key, indices), cost in zip(misses.items(), miss_costs):
+                costs[indices] = cost
+                self.__misses += 1
+                self.__hits += len(indices) - 1
+                self.__cache[key] = cost
+                self.__cache.move_to_end(key)
+            while len(self.__cache) > self.__max_size:
+                self.__cache.popitem(last=False)
+
+    def __createKey(self, position: np.ndarray) -> bytes:
+        """
+        Creates the cache key of a solution position
+        :param: position: solution position
+        """
+        if self.__tolerance is None:
+            return np.ascontiguousarray(position, dtype=float).tobytes()
+        return np.rint(position / self.__tolerance).astype(np.int64).tobytes()
+
+    def clear(self):
+        """
+        Clears the cache and its hit/miss counters
+        """
+        with self.__lock:
+            self.__cache.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_CachedCostFunction__lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    @property
+    def hits(self):
+        """
+        Getter property of the 'self.__hits' attribute
+        """
+        return self.__hits
+
+    @property
+    def misses(self):
+        """
+        Getter property of the 'self.__misses' attribute
+        """
+        return self.__misses
+
+    @property
+    def hit_rate(self):
+        """
+        Getter property of the cache hit rate
+        """
+        n_lookups = self.__hits + self.__misses
+        return self.__hits / n_lookups if n_lookups > 0 else 0.0
+
+    @property
+    def size(self):
+        """
+        Getter property of the number of cached costs
+        """
+        return len(self.__cache)
+
+    @property
+    def max_size(self):
+        """
+        Getter property of the 'self.__max_size' attribute
+        """
+        return self.__max_size
+
+    @property
+    def cost_func(self):
+        """
+        Getter property of the cached cost function
+        """
+        return self.__batch_cost_func.cost_func
@@ -0,0 +1,295 @@
+import os
+import math
+import asyncio
+import inspect
+import concurrent.futures as futures
+from typing import List, Optional
+import numpy as np
+
+import Constants as c
+
+
+class BatchCostFunction(object):
+    """
+    Adapts a cost function to the batch evaluation contract (see 'CostFunctions.batchCostFunction') i.e. a
+    callable that accepts an (n_ants, n_vars) matrix of solutions and returns an (n_ants,) cost vector.
+
+    Cost functions declaring the contract (via their 'batch' attribute) are invoked once per call, whilst
+    single solution cost functions are invoked once per (n_vars, 1) solution column.
+    """
+    def __init__(self, cost_func: object):
+        """
+        Constructor
+        :param: cost_func: batch or single solution cost function
+        """
+        if isinstance(cost_func, BatchCostFunction):
+            cost_func = cost_func.cost_func
+        self.__cost_func = cost_func
+        self.__batch_func = getattr(cost_func, "batch", None)
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of solutions
+        :param: positions: solution positions (n_ants, n_vars)
+        :return: solution costs (n_ants,)
+        """
+        positions = np.atleast_2d(positions)
+        if self.__batch_func is not None:
+            return np.asarray(self.__batch_func(positions), dtype=float)
+        return np.array([self.__cost_func(np.reshape(x, (-1, 1))) for x in positions], dtype=float)
+
+    def __reduce__(self):
+        return (BatchCostFunction, (self.__cost_func,))
+
+    @staticmethod
+    def isBatchCostFunction(cost_func: object) -> bool:
+        """
+        Checks if a cost function declares the batch evaluation contract
+        :param: cost_func: cost function
+        """
+        return isinstance(cost_func, BatchCostFunction) or callable(getattr(cost_func, "batch", None))
+
+    @property
+    def cost_func(self):
+        """
+        Getter property of the 'self.__cost_func' attribute
+        """
+        return self.__cost_func
+
+    @property
+    def is_batch(self):
+        """
+        Getter property indicating if the wrapped cost function is a native batch cost function
+        """
+        return self.__batch_func is not None
+
+
+class Evaluator(object):
+    """
+    Pluggable cost function evaluator used to evaluate the ant solutions of a generation.
+
+    The solutions are split into chunks (of 'chunk_size' rows) that are evaluated with one of the following
+    backends:
+
+        - 'serial': chunks are evaluated one after another in the calling thread
+        - 'thread': chunks are evaluated by a thread pool (suited to cost functions releasing the GIL e.g. I/O or
+          NumPy heavy simulations)
+        - 'process': chunks are evaluated by a process pool (the cost function must be picklable)
+
+    The chunk results are gathered in submission order, so the costs are deterministic and independent of the
+    worker scheduling. The worker pool is created lazily and released by 'close'.
+    """
+    BACKENDS = ("serial", "thread", "process")
+
+    def __init__(self,
+            cost_func: object,
+            backend: str = c.AcoConstants.EVALUATION_BACKEND,
+            n_workers: Optional[int] = None,
+            chunk_size: Optional[int] = None):
+        """
+        Constructor
+        :param: cost_func: batch or single solution cost function
+        :param: backend: evaluation backend i.e. 'serial', 'thread' or 'process'
+        :param: n_workers: number of pool workers (defaults to the number of CPU cores)
+        :param: chunk_size: number of solutions per chunk (defaults to an even split across the workers)
+        """
+        if backend not in Evaluator.BACKENDS:
+            raise ValueError(f"Invalid evaluation backend '{backend}', expected one of {Evaluator.BACKENDS}")
+        self.__batch_cost_func = BatchCostFunction(cost_func)
+        self.__backend = backend
+        self.__n_workers = n_workers if n_workers is not None else (os.cpu_count() or 1)
+        self.__chunk_size = chunk_size
+        self.__executor = None
+        self.__n_evaluations = 0
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of solutions
+        :param: positions: solution positions (n_ants, n_vars)
+        :return: solution costs (n_ants,)
+        """
+        positions = np.atleast_2d(positions)
+        n_solutions = positions.shape[0]
+        self.__n_evaluations += n_solutions
+        if self.__backend == "serial" and self.__chunk_size is None:
+            return self.__batch_cost_func(positions)
+        chunks = self.__splitChunks(positions)
+        if self.__backend == "serial":
+            costs = [self.__batch_cost_func(chunk) for chunk in chunks]
+        elif self.__backend == "thread":
+            costs = list(self.__getExecutor().map(self.__batch_cost_func, chunks))
+        else:
+            costs = list(self.__getExecutor().map(_evaluateProcessChunk, chunks))
+        return np.concatenate(costs)
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of solutions (see 'evaluate')
+        """
+        return self.evaluate(positions)
+
+    def __splitChunks(self, positions: np.ndarray) -> List[np.ndarray]:
+        """
+        Splits the solutions into contiguous chunks
+        :param: positions: solution positions (n_ants, n_vars)
+        """
+        n_solutions = positions.shape[0]
+        chunk_size = self.__chunk_size
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(n_solutions / self.__n_workers))
+        return [positions[start:start + chunk_size] for start in range(0, n_solutions, chunk_size)]
+
+    def __getExecutor(self):
+        """
+        Gets (lazily creates) the worker pool
+        """
+        if self.__executor is None:
+            if self.__backend == "thread":
+                self.__executor = futures.ThreadPoolExecutor(max_workers=self.__n_workers)
+            else:
+                self.__executor = futures.ProcessPoolExecutor(max_workers=self.__n_workers,
+                                                         initializer=_initializeProcessWorker,
+                                                         initargs=(self.__batch_cost_func.cost_func,))
+        return self.__executor
+
+    def close(self):
+        """
+        Releases the worker pool
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_Evaluator__executor"] = None
+        return state
+
+    @property
+    def backend(self):
+        """
+        Getter property of the 'self.__backend' attribute
+        """
+        return self.__backend
+
+    @property
+    def cost_func(self):
+        """
+        Getter property of the evaluated cost function
+        """
+        return self.__batch_cost_func.cost_func
+
+    @property
+    def n_evaluations(self):
+        """
+        Getter property of the 'self.__n_evaluations' attribute i.e. the number of evaluated solutions
+        """
+        return self.__n_evaluations
+
+
+class AsyncEvaluator(object):
+    """
+    Asyncio cost function evaluator used to evaluate the ant solutions of a generation concurrently.
+
+    'async def' cost functions are awaited once per (n_vars, 1) solution column, with at most 'max_concurrency'
+    calls in flight, whilst regular (batch or single solution) cost functions are evaluated synchronously.
+    The costs are returned in the solution order.
+    """
+    def __init__(self,
+            cost_func: object,
+            max_concurrency: int = c.AcoConstants.MAX_CONCURRENCY):
+        """
+        Constructor
+        :param: cost_func: 'async def' (or regular) cost function
+        :param: max_concurrency: maximum number of concurrent cost function calls
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid maximum concurrency '{max_concurrency}', expected a positive integer")
+        self.__cost_func = cost_func
+        self.__is_async = inspect.iscoroutinefunction(cost_func)
+        self.__batch_cost_func = None if self.__is_async else BatchCostFunction(cost_func)
+        self.__max_concurrency = max_concurrency
+        self.__n_evaluations = 0
+
+    async def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of solutions
+        :param: positions: solution positions (n_ants, n_vars)
+        :return: solution costs (n_ants,)
+        """
+        positions = np.atleast_2d(positions)
+        self.__n_evaluations += positions.shape[0]
+        if not self.__is_async:
+            return self.__batch_cost_func(positions)
+        semaphore = asyncio.Semaphore(self.__max_concurrency)
+
+        async def evaluateSolution(position):
+            async with semaphore:
+                return await self.__cost_func(np.reshape(position, (-1, 1)))
+
+        costs = await asyncio.gather(*[evaluateSolution(position) for position in positions])
+        return np.array(costs, dtype=float)
+
+    @property
+    def is_async(self):
+        """
+        Getter property indicating if the cost function is an 'async def' function
+        """
+        return self.__is_async
+
+    @property
+    def max_concurrency(self):
+        """
+        Getter property of the 'self.__max_concurrency' attribute
+        """
+        return self.__max_concurrency
+
+    @property
+    def n_evaluations(self):
+        """
+        Getter property of the 'self.__n_evaluations' attribute i.e. the number of evaluated solutions
+        """
+        return self.__n_evaluations
+
+
+_process_batch_cost_func = None
+
+
+def _initializeProcessWorker(cost_func: object):
+    """
+    Initializes a process pool worker with the (batch) cost function
+    :param: cost_func: batch or single solution cost function
+    """
+    global _process_batch_cost_func
+    _process_batch_cost_func = BatchCostFunction(cost_func)
+
+
+def _evaluateProcessChunk(positions: np.ndarray) -> np.ndarray:
+    """
+    Evaluates a chunk of solutions in a process pool worker
+    :param: positions: solution positions
+    """
+    return _process_batch_cost_func(positions)
+
+
+def createEvaluator(cost_func: object, evaluator: object = None) -> Evaluator:
+    """
+    Creates the evaluator used by the ACO algorithm
+    :param: cost_func: batch or single solution cost function
+    :param: evaluator: an 'Evaluator' (or any object exposing 'evaluate'), a backend name ('serial', 'thread',
+            'process' or 'distributed' i.e. a 'Distributed.DistributedEvaluator' with local workers) or None (serial)
+    """
+    if evaluator is None:
+        return Evaluator(cost_func)
+    if evaluator == "distributed":
+        import Distributed as ds
+        return ds.DistributedEvaluator(cost_func)
+    if isinstance(evaluator, str):
+        return Evaluator(cost_func, backend=evaluator)
+    return evaluator
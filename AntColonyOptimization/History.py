@@ -0,0 +1,188 @@
+import math
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+import Constants as c
+import Population as p
+
+
+class HistoryRecorder(object):
+    """
+    Records the convergence history (best solution per iteration) of the ACO algorithm.
+
+    The following (memory) modes are supported:
+
+        - 'full': keeps a (copied) 'Population' per iteration i.e. the original 'best_solutions' list
+        - 'costs': keeps the best costs only, in a preallocated float array
+        - 'sampled': keeps the best costs and the best positions of every 'interval'-th iteration
+        - 'memmap': keeps the best costs and streams every best position to a memory-mapped '.npy' file
+    """
+    MODES = ("full", "costs", "sampled", "memmap")
+
+    def __init__(self,
+            max_iterations: int,
+            n_vars: int,
+            mode: str = c.AcoConstants.HISTORY_MODE,
+            interval: int = c.AcoConstants.HISTORY_INTERVAL,
+            path: Optional[str] = None):
+        """
+        Constructor
+        :param: max_iterations: maximum number of iterations
+        :param: n_vars: number of variables
+        :param: mode: history mode i.e. 'full', 'costs', 'sampled' or 'memmap'
+        :param: interval: position sampling interval (iterations) of the 'sampled' mode
+        :param: path: '.npy' file path of the 'memmap' mode
+        """
+        if mode not in HistoryRecorder.MODES:
+            raise ValueError(f"Invalid history mode '{mode}', expected one of {HistoryRecorder.MODES}")
+        if mode == "memmap" and path is None:
+            raise ValueError("The 'memmap' history mode requires a file path")
+        self.__max_iterations = max_iterations
+        self.__n_vars = n_vars
+        self.__mode = mode
+        self.__interval = interval if mode == "sampled" else 1
+        self.__path = path
+        self.__n_iterations = 0
+        self.__solutions = [None]*max_iterations if mode == "full" else None
+        self.__costs = np.full(max_iterations, np.nan) if mode != "full" else None
+        self.__positions = None
+        if mode == "sampled":
+            self.__positions = np.zeros((math.ceil(max_iterations / self.__interval), n_vars))
+
+    def record(self,
+            position: np.ndarray,
+            cost: float):
+        """
+        Records the best solution of the next iteration
+        :param: position: best position (n_vars,)
+        :param: cost: best cost
+        """
+        i = self.__n_iterations
+        if self.__mode == "memmap" and self.__positions is None:
+            # Opened on the first record, so a recorder restored from a checkpoint keeps the streamed positions
+            self.__positions = np.lib.format.open_memmap(self.__path, mode="w+", dtype=float,
+                                                         shape=(self.__max_iterations, self.__n_vars))
+        if self.__mode == "full":
+            self.__solutions[i] = p.Population(position=np.reshape(position, (-1, 1)).copy(), cost_function=cost)
+        else:
+            self.__costs[i] = cost
+            if self.__positions is not None and i % self.__interval == 0:
+                self.__positions[i // self.__interval] = np.reshape(position, (-1))
+        self.__n_iterations += 1
+
+    def truncate(self, n_iterations: int):
+        """
+        Discards the unused iteration slots (e.g. of an early stopped run)
+        :param: n_iterations: number of recorded iterations
+        """
+        self.__max_iterations = n_iterations
+        if self.__mode == "full":
+            self.__solutions = self.__solutions[:n_iterations]
+        else:
+            self.__costs = self.__costs[:n_iterations]
+        if self.__mode == "memmap" and self.__positions is not None:
+            self.__positions.flush()
+
+    def downsample(self, max_points: int = c.HelperConstants.MAX_PLOT_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Downsamples the recorded best costs (e.g. for plotting), always keeping the first and the last iteration
+        :param: max_points: maximum number of points
+        :return: iterations and best costs
+        """
+        costs = self.costs
+        iterations = np.arange(len(costs))
+        if len(costs) > max_points:
+            iterations = np.unique(np.linspace(0, len(costs) - 1, max_points).astype(int))
+        return iterations, costs[iterations]
+
+    def getState(self) -> Dict[str, np.ndarray]:
+        """
+        Gets the history state (used by the checkpoints)
+        """
+        if self.__mode == "memmap" and self.__positions is not None:
+            self.__positions.flush()
+        # The 'costs' mode has no positions and the 'memmap' positions are kept in their file (a checkpoint must not
+        # hold object arrays i.e. None)
+        positions = self.positions if self.__mode in ("full", "sampled") else np.zeros((0, self.__n_vars))
+        return {"history_costs": self.costs, "history_positions": positions}
+
+    def setState(self, state: Dict[str, np.ndarray]):
+        """
+        Restores the history state (used by the checkpoints)
+        :param: state: history state created by 'getState'
+        """
+        costs = state["history_costs"]
+        positions = state["history_positions"]
+        self.__n_iterations = len(costs)
+        if self.__mode == "full":
+            for i, (position, cost) in enumerate(zip(positions, costs)):
+                self.__solutions[i] = p.Population(position=np.reshape(position, (-1, 1)).copy(), cost_function=cost)
+            return
+        self.__costs[:len(costs)] = costs
+        if self.__mode == "sampled":
+            self.__positions[:len(positions)] = positions
+        elif self.__mode == "memmap":
+            self.__positions = np.lib.format.open_memmap(self.__path, mode="r+")
+
+    @property
+    def mode(self):
+        """
+        Getter property of the 'self.__mode' attribute
+        """
+        return self.__mode
+
+    @property
+    def n_iterations(self):
+        """
+        Getter property of the 'self.__n_iterations' attribute i.e. the number of recorded iterations
+        """
+        return self.__n_iterations
+
+    @property
+    def costs(self):
+        """
+        Getter property of the recorded best costs
+        """
+        if self.__mode == "full":
+            return np.array([x.cost_function for x in self.__solutions[:self.__n_iterations]], dtype=float)
+        return self.__costs[:self.__n_iterations]
+
+    @property
+    def positions(self):
+        """
+        Getter property of the recorded best positions (every 'interval'-th iteration for the 'sampled' mode and
+        None for the 'costs' mode)
+        """
+        if self.__mode == "full":
+            return np.reshape([x.position for x in self.__solutions[:self.__n_iterations]], (self.__n_iterations, self.__n_vars))
+        if self.__mode == "costs":
+            return None
+        if self.__positions is None:
+            return np.zeros((0, self.__n_vars))
+        return self.__positions[:math.ceil(self.__n_iterations / self.__interval)]
+
+    @property
+    def position_iterations(self):
+        """
+        Getter property of the iterations of the recorded best positions
+        """
+        if self.__mode == "costs":
+            return np.zeros(0, dtype=int)
+        return np.arange(0, self.__n_iterations, self.__interval)
+
+    @property
+    def best_solutions(self) -> List:
+        """
+        Getter property of the best solution per iteration ('Population' objects, whose position is None for
+        iterations without a recorded position)
+        """
+        if self.__mode == "full":
+            return self.__solutions
+        positions = self.positions
+        solutions = [None]*self.__max_iterations
+        for i in range(self.__n_iterations):
+            position = None
+            if positions is not None and i % self.__interval == 0:
+                position = np.reshape(positions[i // self.__interval], (-1, 1))
+            solutions[i] = p.Population(position=position, cost_function=self.__costs[i])
+        return solutions
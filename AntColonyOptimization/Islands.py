@@ -0,0 +1,211 @@
+import math
+import traceback
+import multiprocessing as mp
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+import Constants as c
+import Acor as a
+import RandomStreams as rs
+
+
+class IslandModelRunner(object):
+    """
+    Island model (multi-start) runner of the ACO algorithm.
+
+    Runs 'n_islands' independent ACOR colonies, each seeded with an independent stream (spawned from one
+    'SeedSequence') and, in parallel mode, hosted by its own worker process for the whole run. Every
+    'migration_interval' generations the 'n_migrants' best archive members of each island migrate to the next
+    island of a ring topology, where they replace the worst archive members they improve on.
+
+    The global best solution and the per island convergence histories (best cost per generation) are collected
+    at the end of the run. The cost function (and any other ACO constructor argument) must be picklable.
+    """
+    def __init__(self,
+            n_islands: int,
+            n_pop: int,
+            n_vars: int,
+            cost_func: object,
+            domain_bounds: Dict,
+            n_generations: int = c.AcoConstants.MAX_ITERATIONS,
+            migration_interval: int = c.AcoConstants.MIGRATION_INTERVAL,
+            n_migrants: int = c.AcoConstants.N_MIGRANTS,
+            random_seed: int = c.HelperConstants.RANDOM_SEED,
+            parallel: bool = True,
+            **acor_kwargs):
+        """
+        Constructor
+        :param: n_islands: number of islands (colonies)
+        :param: n_pop: population size (archive size) of each island
+        :param: n_vars: number of variables
+        :param: cost_func: cost function
+        :param: domain_bounds: continuous domain lower/upper bounds
+        :param: n_generations: number of generations (capped by the maximum number of iterations of the islands 'config')
+        :param: migration_interval: number of generations between migrations
+        :param: n_migrants: number of migrants sent by each island per migration (0 disables the migrations)
+        :param: random_seed: root seed the (independent) island seeds are spawned from
+        :param: parallel: runs each island in its own worker process if True, one after another otherwise
+        :param: acor_kwargs: additional 'AcorContinuousDomain' constructor arguments
+        """
+        if n_islands < 1:
+            raise ValueError(f"Invalid number of islands '{n_islands}', expected a positive integer")
+        if migration_interval < 1:
+            raise ValueError(f"Invalid migration interval '{migration_interval}', expected a positive integer")
+        self.__n_islands = n_islands
+        self.__n_generations = n_generations
+        self.__migration_interval = migration_interval
+        self.__n_migrants = n_migrants if n_islands > 1 else 0
+        self.__parallel = parallel
+        self.__seeds = rs.spawnSeeds(n_islands, random_seed)
+        self.__islands = [a.AcorContinuousDomain(n_pop=n_pop,
+                                                  n_vars=n_vars,
+                                                  cost_func=cost_func,
+                                                  domain_bounds=domain_bounds,
+                                                  random_seed=seed,
+                                                  **acor_kwargs) for seed in self.__seeds]
+        self.__island_best_solutions = None
+        self.__convergence_histories = None
+        self.__best_solution = None
+
+    def run(self):
+        """
+        Runs the island model
+        :return: global best solution
+        """
+        histories = [[] for _ in range(self.__n_islands)]
+        connections, workers = self.__startWorkers() if self.__parallel else (None, None)
+        try:
+            migrants = [None] * self.__n_islands
+            for epoch in range(math.ceil(self.__n_generations / self.__migration_interval)):
+                # The last epoch is clamped to the remaining generations of the budget
+                n_epoch_generations = min(self.__migration_interval, self.__n_generations - epoch*self.__migration_interval)
+                if connections is not None:
+                    for connection, island_migrants in zip(connections, migrants):
+                        connection.send(("epoch", n_epoch_generations, self.__n_migrants, island_migrants))
+                    results = [IslandModelRunner.__receive(connection) for connection in connections]
+                else:
+                    results = [_advanceIsland(acor, n_epoch_generations, self.__n_migrants, island_migrants)
+                               for acor, island_migrants in zip(self.__islands, migrants)]
+                emigrants = [result[0] for result in results]
+                for history, result in zip(histories, results):
+                    history.append(result[1])
+                # Ring topology: island i receives the best archive members of island i - 1
+                migrants = [emigrants[i - 1] if self.__n_migrants > 0 else None for i in range(self.__n_islands)]
+            if connections is not None:
+                for connection in connections:
+                    connection.send(("finish",))
+                self.__island_best_solutions = [IslandModelRunner.__receive(connection) for connection in connections]
+            else:
+                self.__island_best_solutions = [acor.final_best_solution for acor in self.__islands]
+        finally:
+            if connections is not None:
+                self.__stopWorkers(connections, workers)
+        self.__convergence_histories = [np.concatenate(history) for history in histories]
+        self.__best_solution = min(self.__island_best_solutions, key=lambda x: x.cost_function)
+        return self.__best_solution
+
+    def __startWorkers(self) -> Tuple[List, List]:
+        """
+        Starts one worker process per island
+        """
+        connections, workers = [], []
+        for acor in self.__islands:
+            parent_connection, child_connection = mp.Pipe()
+            worker = mp.Process(target=_runIslandWorker, args=(child_connection, acor), daemon=True)
+            worker.start()
+            child_connection.close()
+            connections.append(parent_connection)
+            workers.append(worker)
+        return connections, workers
+
+    def __stopWorkers(self, connections: List, workers: List):
+        """
+        Stops the island worker processes
+        """
+        for connection in connections:
+            connection.close()
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    @staticmethod
+    def __receive(connection) -> object:
+        """
+        Receives an island worker reply, raising the worker errors
+        """
+        reply = connection.recv()
+        if reply[0] == "error":
+            raise RuntimeError(f"Island worker failed:{c.HelperConstants.CARRIAGE_RETURN}{reply[1]}")
+        return reply[1]
+
+    @property
+    def seeds(self):
+        """
+        Getter property of the 'self.__seeds' attribute i.e. the island random seeds ('numpy.random.SeedSequence' objects)
+        """
+        return self.__seeds
+
+    @property
+    def best_solution(self):
+        """
+        Getter property of the 'self.__best_solution' attribute i.e. the global best solution
+        """
+        return self.__best_solution
+
+    @property
+    def island_best_solutions(self):
+        """
+        Getter property of the 'self.__island_best_solutions' attribute
+        """
+        return self.__island_best_solutions
+
+    @property
+    def convergence_histories(self):
+        """
+        Getter property of the 'self.__convergence_histories' attribute i.e. the best cost per generation of each island
+        """
+        return self.__convergence_histories
+
+
+def _advanceIsland(acor: a.AcorContinuousDomain,
+        n_generations: int,
+        n_migrants: int,
+        migrants: Optional[Tuple[np.ndarray, np.ndarray]]) -> Tuple[Optional[Tuple[np.ndarray, np.ndarray]], np.ndarray]:
+    """
+    Advances an island by one migration epoch
+    :param: acor: island ACO algorithm
+    :param: n_generations: number of generations
+    :param: n_migrants: number of emigrants
+    :param: migrants: immigrant positions and costs (or None)
+    :return: emigrant positions and costs (or None) and the best cost of each executed generation
+    """
+    if migrants is not None:
+        acor.immigrate(*migrants)
+    start = acor.iteration
+    acor.runGenerations(n_generations)
+    costs = np.array(acor.history.costs[start:acor.iteration], dtype=float)
+    emigrants = acor.emigrate(n_migrants) if n_migrants > 0 else None
+    return emigrants, costs
+
+
+def _runIslandWorker(connection, acor: a.AcorContinuousDomain):
+    """
+    Island worker process loop
+    :param: connection: pipe connection to the island model runner
+    :param: acor: island ACO algorithm
+    """
+    try:
+        while True:
+            message = connection.recv()
+            if message[0] == "epoch":
+                connection.send(("ok", _advanceIsland(acor, *message[1:])))
+            elif message[0] == "finish":
+                connection.send(("ok", acor.final_best_solution))
+                break
+    except EOFError:
+        pass
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+    finally:
+        connection.close()
@@ -0,0 +1,225 @@
+"""
+Optional compiled (Numba) kernels of the ACO algorithm hot paths.
+
+Each kernel is a fused, allocation-free loop writing to a caller owned output array: the sums of absolute
+deviations of the sigmas, the (roulette wheel) Gaussian kernel sampling, the variable bounds and the built-in
+'rastrigin' and 'stybtangm' cost functions. The loops are compiled with 'numba.njit' (on their first call) when Numba
+is installed and remain plain Python functions otherwise, in which case the ACO algorithm components keep their NumPy
+paths (see 'resolveKernelBackend'). Numba is only imported once the compiled kernels are requested.
+"""
+import math
+import warnings
+import functools
+import importlib
+import numpy as np
+
+KERNEL_BACKENDS = ("numpy", "numba", "auto")
+
+_numba = None
+_numba_imported = False
+
+
+def _importNumba() -> object:
+    """
+    Imports Numba on the first request
+    :return: the 'numba' module or None if it is not installed
+    """
+    global _numba, _numba_imported
+    if not _numba_imported:
+        try:
+            _numba = importlib.import_module("numba")
+        except ImportError:  # optional dependency
+            _numba = None
+        _numba_imported = True
+    return _numba
+
+
+def hasNumba() -> bool:
+    """
+    Checks if Numba is installed (importing it)
+    """
+    return _importNumba() is not None
+
+
+def _jit(func):
+    """
+    Compiles a kernel on its first call when Numba is installed
+    :param: func: kernel
+    """
+    kernel = None
+
+    @functools.wraps(func)
+    def callKernel(*args):
+        nonlocal kernel
+        if kernel is None:
+            numba = _importNumba()
+            kernel = func if numba is None else numba.njit(cache=True, nogil=True)(func)
+        return kernel(*args)
+
+    return callKernel
+
+
+def resolveKernelBackend(backend: str) -> str:
+    """
+    Resolves a kernel backend, falling back to the NumPy kernels when Numba is not installed
+    :param: backend: kernel backend i.e. 'numpy', 'numba' or 'auto' ('numba' if installed, 'numpy' otherwise)
+    :return: resolved kernel backend i.e. 'numpy' or 'numba'
+    """
+    if backend not in KERNEL_BACKENDS:
+        raise ValueError(f"Invalid kernel backend '{backend}', expected one of {KERNEL_BACKENDS}")
+    if backend == "numpy":
+        return "numpy"
+    if not hasNumba():
+        if backend == "numba":
+            warnings.warn("Numba is not installed, falling back to the 'numpy' kernels", RuntimeWarning)
+        return "numpy"
+    return "numba"
+
+
+@_jit
+def _computeDistanceSums(means, out):
+    n_pop, n_vars = means.shape
+    for i in range(n_pop):
+        for j in range(n_vars):
+            out[i, j] = 0.0
+        for r in range(n_pop):
+            for j in range(n_vars):
+                out[i, j] += abs(means[i, j] - means[r, j])
+    return out
+
+
+@_jit
+def _sampleRoulette(means, sigmas, cum_probs, uniforms, noise, out):
+    n_ants, n_vars = out.shape
+    n_pop = cum_probs.shape[0]
+    for i in range(n_ants):
+        for j in range(n_vars):
+            # Binary search of the first cumulative probability >= the uniform draw (i.e. 'np.searchsorted')
+            r = uniforms[i, j]
+            lo, hi = 0, n_pop
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if cum_probs[mid] < r:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            k = min(lo, n_pop - 1)
+            out[i, j] = means[k, j] + sigmas[k, j]*noise[i, j]
+    return out
+
+
+@_jit
+def _gatherSamples(means, sigmas, indices, noise, out):
+    n_ants, n_vars = out.shape
+    for i in range(n_ants):
+        for j in range(n_vars):
+            k = indices[i, j]
+            out[i, j] = means[k, j] + sigmas[k, j]*noise[i, j]
+    return out
+
+
+@_jit
+def _applyBounds(positions, l_bound, u_bound):
+    n_rows, n_vars = positions.shape
+    for i in range(n_rows):
+        for j in range(n_vars):
+            x = positions[i, j]
+            if x < l_bound:
+                positions[i, j] = l_bound
+            elif x > u_bound:
+                positions[i, j] = u_bound
+    return positions
+
+
+@_jit
+def _rastrigin(x, out):
+    n_rows, n_vars = x.shape
+    for i in range(n_rows):
+        total = 0.0
+        for j in range(n_vars):
+            total += x[i, j]*x[i, j] - 10.0*math.cos(2.0*math.pi*x[i, j])
+        out[i] = 10.0*n_vars + total
+    return out
+
+
+@_jit
+def _stybtangm(x, out):
+    n_rows, n_vars = x.shape
+    for i in range(n_rows):
+        total = 0.0
+        for j in range(n_vars):
+            square = x[i, j]*x[i, j]
+            total += square*square - 16.0*square + 5.0*x[i, j]
+        out[i] = total/2.0
+    return out
+
+
+def computeDistanceSums(means: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Computes the per-dimension sums of absolute deviations of the archive positions (see 'Sigma.SigmaEngine')
+    :param: means: archive positions (n_pop, n_vars)
+    :param: out: optional output array (n_pop, n_vars)
+    """
+    return _computeDistanceSums(means, out if out is not None else np.empty_like(means))
+
+
+def sampleRoulette(means: np.ndarray,
+        sigmas: np.ndarray,
+        cum_probs: np.ndarray,
+        uniforms: np.ndarray,
+        noise: np.ndarray,
+        out: np.ndarray) -> np.ndarray:
+    """
+    Fused roulette wheel kernel selection and Gaussian sampling of the ant solutions
+    :param: means: Gaussian kernel means (n_pop, n_vars)
+    :param: sigmas: Gaussian kernel standard deviations (n_pop, n_vars)
+    :param: cum_probs: cumulative kernel selection probabilities (n_pop,)
+    :param: uniforms: uniform [0, 1) random numbers of the kernel selection (n_ants, n_vars)
+    :param: noise: standard normal random numbers (n_ants, n_vars)
+    :param: out: output array (n_ants, n_vars)
+    """
+    return _sampleRoulette(means, sigmas, cum_probs, uniforms, noise, out)
+
+
+def gatherSamples(means: np.ndarray,
+        sigmas: np.ndarray,
+        indices: np.ndarray,
+        noise: np.ndarray,
+        out: np.ndarray) -> np.ndarray:
+    """
+    Fused Gaussian sampling of the ant solutions from already selected kernels
+    :param: means: Gaussian kernel means (n_pop, n_vars)
+    :param: sigmas: Gaussian kernel standard deviations (n_pop, n_vars)
+    :param: indices: selected kernel indices (n_ants, n_vars)
+    :param: noise: standard normal random numbers (n_ants, n_vars)
+    :param: out: output array (n_ants, n_vars)
+    """
+    return _gatherSamples(means, sigmas, indices, noise, out)
+
+
+def applyBounds(positions: np.ndarray, l_bound: float, u_bound: float) -> np.ndarray:
+    """
+    Applies the variable bounds (in place)
+    :param: positions: ant solution positions (n_ants, n_vars)
+    :param: l_bound: domain lower bound
+    :param: u_bound: domain upper bound
+    """
+    return _applyBounds(positions, float(l_bound), float(u_bound))
+
+
+def rastrigin(x: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Batch Rastrigin function (see 'CostFunctions.rastrigin')
+    :param: x: solutions (n_ants, n_vars)
+    :param: out: optional output array (n_ants,)
+    """
+    return _rastrigin(x, out if out is not None else np.empty(x.shape[0], dtype=x.dtype))
+
+
+def stybtangm(x: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Batch Styblinski-Tang function (see 'CostFunctions.stybtangm')
+    :param: x: solutions (n_ants, n_vars)
+    :param: out: optional output array (n_ants,)
+    """
+    return _stybtangm(x, out if out is not None else np.empty(x.shape[0], dtype=x.dtype))
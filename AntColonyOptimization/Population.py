@@ -2,11 +2,15 @@ from typing import Dict, Tuple, List, Optional, Any
 import numpy as np
 
 import Constants as c
+import Evaluators as e
+import RandomStreams as rs
 
 class Population(object):
     """
     Specifies an ACO Population
     """
+    __slots__ = ("position", "cost_function")
+
     def __init__(self,
         position, 
         cost_function) -> None:
@@ -25,33 +29,62 @@ class Populations(object):
             n_pop: int, 
             n_vars: int,
             cost_func: object, 
-            domain_bounds: Dict):
+            domain_bounds: Dict,
+            evaluator: object = None,
+            random_seed: int = c.HelperConstants.RANDOM_SEED,
+            random: object = None,
+            bit_generator: str = c.HelperConstants.BIT_GENERATOR,
+            dtype: object = c.AcoConstants.DTYPE):
         """
         Constructor
         :param: n_pop: population size
         :param: n_vars: number of variables
         :param: cost_func_ cost function
         :param: domain_bounds: continious domain lower/upper bounds
+        :param: evaluator: cost function evaluator i.e. an 'Evaluators.Evaluator', a backend name or None (serial).
+                An evaluator created from a backend name is closed once the initial populations are evaluated, an
+                injected one is left open for its owner
+        :param: random_seed: random number generator seed
+        :param: random: injected random number generator ('RandomState', 'Generator' or 'RandomStream'), overrides
+                the seed
+        :param: bit_generator: bit generator of the seeded random number generator i.e. 'legacy', 'pcg64' or 'philox'
+        :param: dtype: positions data type i.e. 'float64' or 'float32'
         """
         self.__l_bound = domain_bounds[0]
         self.__u_bound = domain_bounds[1]
         self.__cost_func = cost_func
+        self.__evaluator = e.createEvaluator(cost_func, evaluator)
+        self.__owns_evaluator = evaluator is None or isinstance(evaluator, str)
         self.__n_pop = n_pop
         self.__pops = [None]*n_pop
+        self.__positions = None
+        self.__costs = None
         self.__pops_sorted = None
         self.__best_pop = None
         self.__n_vars = n_vars
-        self.__random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)        
+        self.__random = rs.createRandomStream(random, random_seed, bit_generator)
+        self.__dtype = np.dtype(dtype)
 
     def __initializePopulation(self):
         """
         Initializes the ant colony populations
         """
-        positions = np.random.uniform()
+        self.__positions = self.createPositions()
+        try:
+            self.__costs = self.__evaluator.evaluate(self.__positions)
+        finally:
+            if self.__owns_evaluator:
+                self.__evaluator.close()
         for i in range(self.__n_pop):
-            position = self.__random.uniform(self.__l_bound, self.__u_bound, (self.__n_vars, 1))
-            cost = self.__cost_func(position)
-            self.__pops[i] = Population(position=position, cost_function=cost)
+            self.__pops[i] = Population(position=np.reshape(self.__positions[i], (-1, 1)), cost_function=self.__costs[i])
+
+    def createPositions(self) -> np.ndarray:
+        """
+        Creates the (uniformly distributed) initial ant colony positions without evaluating them
+        :return: initial positions (n_pop, n_vars)
+        """
+        positions = self.__random.uniform(self.__l_bound, self.__u_bound, (self.__n_pop, self.__n_vars))
+        return positions.astype(self.__dtype, copy=False)
 
     @property
     def ant_populations(self):
@@ -62,6 +95,20 @@ class Populations(object):
         self.__pops_sorted = sorted(self.__pops, key=lambda x: x.cost_function, reverse=False)
         return self.__pops_sorted
 
+    @property
+    def positions(self):
+        """
+        Getter property to retrieve the (unsorted) initial positions i.e. the 'self.__positions' array
+        """
+        return self.__positions
+
+    @property
+    def costs(self):
+        """
+        Getter property to retrieve the (unsorted) initial costs i.e. the 'self.__costs' array
+        """
+        return self.__costs
+
     @property
     def best_population(self):
         """
@@ -70,14 +117,16 @@ class Populations(object):
         return self.__pops_sorted[0]
 
     @staticmethod
-    def createEmptyNewPopulations(n_ants: int, n_vars: int) -> object:
+    def createEmptyNewPopulations(n_ants: int, n_vars: int, dtype: object = c.AcoConstants.DTYPE) -> object:
         """
         Creates an empty collection of ant populations
         :params: n_ants: number of ants
         :params: n_vars: number of variables
+        :params: dtype: positions data type
         """
-        position = np.zeros((n_vars, 1))
-        empty_populations = [Population(position=position, cost_function=None) for _ in range(n_ants)]
+        # One preallocated block, each ant owns a distinct (n_vars, 1) row view
+        positions = np.zeros((n_ants, n_vars), dtype=dtype)
+        empty_populations = [Population(position=np.reshape(positions[i], (-1, 1)), cost_function=None) for i in range(n_ants)]
         return empty_populations
 
 
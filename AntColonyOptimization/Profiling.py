@@ -0,0 +1,195 @@
+import json
+from abc import ABC, abstractmethod
+from time import perf_counter
+from typing import Dict, Optional
+
+
+class ProfilingReport(ABC):
+    """
+    Base class of the profilers i.e. exports the profiling report (created by 'toDict') as JSON or as a pandas
+    DataFrame
+    """
+    @abstractmethod
+    def toDict(self) -> Dict:
+        """
+        Creates the profiling report
+        :return: report i.e. the number of generations, the profiled time and the statistics of each phase
+        """
+
+    def toJson(self, path: Optional[str] = None) -> str:
+        """
+        Creates the profiling report as JSON
+        :param: path: JSON file path the report is (also) written to (None does not write a file)
+        """
+        report = json.dumps(self.toDict(), indent=2)
+        if path is not None:
+            with open(path, "w") as report_file:
+                report_file.write(report)
+        return report
+
+    def toDataFrame(self) -> object:
+        """
+        Creates the profiling report as a pandas DataFrame (one row per phase)
+        """
+        import pandas as pd
+        return pd.DataFrame.from_dict(self.toDict()["phases"], orient="index")
+
+
+class PhaseProfiler(ProfilingReport):
+    """
+    Opt-in per-phase timing instrumentation of the ACO algorithm main loop.
+
+    The wall time (via 'time.perf_counter') and the number of calls of each hot-path phase of a generation are
+    accumulated i.e.:
+
+        - 'means': creation of the Gaussian kernel means
+        - 'sigmas': computation of the Gaussian kernel standard deviations
+        - 'sampling': roulette wheel (kernel) selection and Gaussian sampling of the ants
+        - 'clipping': application of the variable bounds
+        - 'evaluation': cost function evaluation of the ants (including the optional surrogate pre-screening)
+        - 'merge': merge/sort of the archive and new solutions (including the best solution history)
+
+    and exported as a report (dictionary, JSON or pandas DataFrame). A phase is timed with a (reusable) context
+    manager e.g. 'with profiler.phase("sigmas"): ...'.
+    """
+    PHASES = ("means", "sigmas", "sampling", "clipping", "evaluation", "merge")
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__timers = {name: _PhaseTimer(self, name) for name in PhaseProfiler.PHASES}
+        self.__total_times = None
+        self.__n_calls = None
+        self.__n_generations = 0
+        self.reset()
+
+    def phase(self, name: str) -> "_PhaseTimer":
+        """
+        Gets the timer (context manager) of a phase
+        :param: name: phase name
+        """
+        return self.__timers[name]
+
+    def record(self, name: str, seconds: float):
+        """
+        Accumulates the duration of a phase call
+        :param: name: phase name
+        :param: seconds: phase call duration (seconds)
+        """
+        self.__total_times[name] += seconds
+        self.__n_calls[name] += 1
+
+    def countGeneration(self):
+        """
+        Counts a completed generation
+        """
+        self.__n_generations += 1
+
+    def reset(self):
+        """
+        Resets the timers and counts
+        """
+        self.__total_times = dict.fromkeys(PhaseProfiler.PHASES, 0.0)
+        self.__n_calls = dict.fromkeys(PhaseProfiler.PHASES, 0)
+        self.__n_generations = 0
+
+    def toDict(self) -> Dict:
+        """
+        Creates the profiling report i.e. the total time, number of calls, mean time per call/generation and
+        fraction of the profiled time of each phase
+        """
+        profiled_time = sum(self.__total_times.values())
+        phases = {}
+        for name in PhaseProfiler.PHASES:
+            total_time = self.__total_times[name]
+            n_calls = self.__n_calls[name]
+            phases[name] = {"total_time": total_time,
+                            "n_calls": n_calls,
+                            "mean_time_per_call": total_time / n_calls if n_calls > 0 else 0.0,
+                            "mean_time_per_generation": total_time / self.__n_generations if self.__n_generations > 0 else 0.0,
+                            "fraction": total_time / profiled_time if profiled_time > 0.0 else 0.0}
+        return {"n_generations": self.__n_generations, "profiled_time": profiled_time, "phases": phases}
+
+    @property
+    def total_times(self):
+        """
+        Getter property of the 'self.__total_times' attribute i.e. the accumulated time (seconds) per phase
+        """
+        return self.__total_times
+
+    @property
+    def n_calls(self):
+        """
+        Getter property of the 'self.__n_calls' attribute i.e. the number of calls per phase
+        """
+        return self.__n_calls
+
+    @property
+    def n_generations(self):
+        """
+        Getter property of the 'self.__n_generations' attribute
+        """
+        return self.__n_generations
+
+
+class NullProfiler(ProfilingReport):
+    """
+    Disabled profiler i.e. the phases are not timed (the default of the ACO algorithm)
+    """
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__timer = _NullPhaseTimer()
+
+    def phase(self, name: str) -> "_NullPhaseTimer":
+        """
+        Gets the (no-op) timer of a phase
+        :param: name: phase name
+        """
+        return self.__timer
+
+    def countGeneration(self):
+        """
+        Ignores a completed generation
+        """
+        pass
+
+    def toDict(self) -> Dict:
+        """
+        Creates the (empty) profiling report i.e. no generation and no phase were profiled
+        """
+        return {"n_generations": 0, "profiled_time": 0.0, "phases": {}}
+
+
+class _PhaseTimer(object):
+    """
+    Reusable context manager timing the calls of a profiler phase
+    """
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: PhaseProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, perf_counter() - self.start)
+
+
+class _NullPhaseTimer(object):
+    """
+    No-op context manager of the disabled profiler
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
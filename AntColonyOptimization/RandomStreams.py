@@ -0,0 +1,134 @@
+from typing import List, Optional, Union
+import numpy as np
+
+import Constants as c
+
+
+class RandomStream(object):
+    """
+    Uniform (bulk) random number interface over the legacy 'numpy.random.RandomState' and the
+    'numpy.random.Generator' (e.g. with the faster PCG64 or Philox bit generators), so the ACO algorithm components
+    draw their random numbers the same way whichever generator was configured or injected.
+    """
+    BIT_GENERATORS = ("legacy", "pcg64", "philox")
+
+    def __init__(self, random: object):
+        """
+        Constructor
+        :param: random: random number generator i.e. a 'RandomState', a 'Generator' or a 'RandomStream'
+        """
+        if isinstance(random, RandomStream):
+            random = random.generator
+        if not isinstance(random, (np.random.RandomState, np.random.Generator)):
+            raise TypeError(f"Invalid random number generator '{type(random).__name__}', expected a "
+                            f"'numpy.random.RandomState' or a 'numpy.random.Generator'")
+        self.__generator = random
+        self.__is_legacy = isinstance(random, np.random.RandomState)
+
+    def rand(self, *shape: int) -> Union[float, np.ndarray]:
+        """
+        Draws uniform [0, 1) random numbers
+        :param: shape: output shape (a scalar is drawn when no shape is specified)
+        """
+        if self.__is_legacy:
+            return self.__generator.rand(*shape)
+        return self.__generator.random(shape if shape else None)
+
+    def randn(self, *shape: int) -> Union[float, np.ndarray]:
+        """
+        Draws standard normal random numbers
+        :param: shape: output shape (a scalar is drawn when no shape is specified)
+        """
+        if self.__is_legacy:
+            return self.__generator.randn(*shape)
+        return self.__generator.standard_normal(shape if shape else None)
+
+    def fillRand(self, out: np.ndarray) -> np.ndarray:
+        """
+        Fills an array with uniform [0, 1) random numbers (in place, without allocating for a 'Generator'; the
+        legacy 'RandomState' has no 'out' argument, so its draws are copied)
+        :param: out: float64 or float32 output array (a 'Generator' draws float32 numbers natively)
+        """
+        if self.__is_legacy:
+            out[...] = self.__generator.rand(*out.shape)
+        else:
+            self.__generator.random(out=out, dtype=out.dtype)
+        return out
+
+    def fillRandn(self, out: np.ndarray) -> np.ndarray:
+        """
+        Fills an array with standard normal random numbers (in place, without allocating for a 'Generator'; the
+        legacy 'RandomState' has no 'out' argument, so its draws are copied)
+        :param: out: float64 or float32 output array (a 'Generator' draws float32 numbers natively)
+        """
+        if self.__is_legacy:
+            out[...] = self.__generator.randn(*out.shape)
+        else:
+            self.__generator.standard_normal(out=out, dtype=out.dtype)
+        return out
+
+    def uniform(self, low: object, high: object, size: object = None) -> Union[float, np.ndarray]:
+        """
+        Draws uniform [low, high) random numbers
+        :param: low: lower bound(s)
+        :param: high: upper bound(s)
+        :param: size: output shape
+        """
+        return self.__generator.uniform(low, high, size)
+
+    @property
+    def generator(self):
+        """
+        Getter property of the 'self.__generator' attribute i.e. the wrapped 'RandomState' or 'Generator'
+        """
+        return self.__generator
+
+    @property
+    def is_legacy(self):
+        """
+        Getter property of the 'self.__is_legacy' attribute i.e. True for a legacy 'RandomState'
+        """
+        return self.__is_legacy
+
+
+def createRandomStream(random: object = None,
+        random_seed: Union[int, np.random.SeedSequence, None] = c.HelperConstants.RANDOM_SEED,
+        bit_generator: str = c.HelperConstants.BIT_GENERATOR) -> RandomStream:
+    """
+    Creates the random stream of an ACO algorithm component
+    :param: random: injected random number generator ('RandomState', 'Generator' or 'RandomStream'), used as is
+    :param: random_seed: seed (integer or 'SeedSequence') of the created random number generator
+    :param: bit_generator: bit generator of the created random number generator i.e. 'legacy' (a 'RandomState'),
+            'pcg64' or 'philox' (a 'Generator')
+    """
+    if random is not None:
+        return random if isinstance(random, RandomStream) else RandomStream(random)
+    if bit_generator not in RandomStream.BIT_GENERATORS:
+        raise ValueError(f"Invalid bit generator '{bit_generator}', expected one of {RandomStream.BIT_GENERATORS}")
+    if bit_generator == "legacy":
+        if isinstance(random_seed, np.random.SeedSequence):
+            random_seed = random_seed.generate_state(1)
+        return RandomStream(np.random.RandomState(random_seed))
+    bit_generator_type = np.random.PCG64 if bit_generator == "pcg64" else np.random.Philox
+    return RandomStream(np.random.Generator(bit_generator_type(random_seed)))
+
+
+def spawnSeeds(n_streams: int, random_seed: Optional[int] = c.HelperConstants.RANDOM_SEED) -> List[np.random.SeedSequence]:
+    """
+    Spawns independent seeds (child 'SeedSequence' objects) e.g. for the parallel workers of an ACO algorithm
+    :param: n_streams: number of seeds
+    :param: random_seed: root seed
+    """
+    return np.random.SeedSequence(random_seed).spawn(n_streams)
+
+
+def spawnRandomStreams(n_streams: int,
+        random_seed: Optional[int] = c.HelperConstants.RANDOM_SEED,
+        bit_generator: str = c.HelperConstants.BIT_GENERATOR) -> List[RandomStream]:
+    """
+    Spawns independent random streams e.g. for the parallel workers of an ACO algorithm
+    :param: n_streams: number of random streams
+    :param: random_seed: root seed
+    :param: bit_generator: bit generator i.e. 'legacy', 'pcg64' or 'philox'
+    """
+    return [createRandomStream(None, seed, bit_generator) for seed in spawnSeeds(n_streams, random_seed)]
@@ -0,0 +1,218 @@
+from typing import Optional
+import numpy as np
+
+import Buffers as bf
+import Constants as c
+import Kernels as kr
+import RandomStreams as rs
+import Selection as sl
+
+
+class KernelSampler(object):
+    """
+    Samples new ant solutions from the Gaussian kernels of the ACOR archive.
+
+    Two sampling modes are supported:
+
+        - 'vectorized': all the kernel indices of a generation are selected at once by the kernel selection
+          strategy (see 'Selection'), the Gaussian noise is drawn as a single (n_ants, n_vars) matrix and the
+          bounds are applied in one operation
+        - 'legacy': reproduces the original per-draw random number order (one roulette wheel draw followed by
+          one Gaussian draw per ant variable) so that seeded runs remain comparable with earlier results (only
+          the 'roulette' selection is supported)
+
+    The sampler owns a 'Buffers.BufferPool' of the per-generation scratch arrays (uniform draws, kernel indices,
+    Gaussian noise, ...), allocated on the first generation and refilled in place by the later ones, and can write
+    the new ant solutions straight to a caller owned array (e.g. the archive sample rows). With the 'numba' kernel
+    backend, the 'vectorized' mode gathers the kernels, draws the Gaussian samples (fused with the roulette wheel
+    selection) and applies the bounds with the compiled loops of 'Kernels'.
+    """
+    SAMPLING_MODES = ("vectorized", "legacy")
+
+    def __init__(self,
+            probs: np.ndarray,
+            random: object,
+            mode: str = c.AcoConstants.SAMPLING_MODE,
+            selection: str = c.AcoConstants.SELECTION,
+            tournament_size: int = c.AcoConstants.TOURNAMENT_SIZE,
+            selection_pressure: float = c.AcoConstants.RANK_SELECTION_PRESSURE,
+            kernel_backend: str = c.AcoConstants.KERNEL_BACKEND):
+        """
+        Constructor
+        :param: probs: Gaussian kernel selection probabilities
+        :param: random: random number generator ('RandomState', 'Generator' or 'RandomStreams.RandomStream')
+        :param: mode: sampling mode i.e. 'vectorized' or 'legacy'
+        :param: selection: kernel selection strategy i.e. 'roulette', 'alias', 'rank' or 'tournament'
+        :param: tournament_size: number of archive members per tournament ('tournament' selection)
+        :param: selection_pressure: linear ranking selection pressure ('rank' selection)
+        :param: kernel_backend: kernel backend i.e. 'numpy', 'numba' or 'auto' (see 'Kernels.resolveKernelBackend')
+        """
+        if mode not in KernelSampler.SAMPLING_MODES:
+            raise ValueError(f"Invalid sampling mode '{mode}', expected one of {KernelSampler.SAMPLING_MODES}")
+        if mode == "legacy" and selection != "roulette":
+            raise ValueError(f"The 'legacy' sampling mode only supports the 'roulette' selection, not '{selection}'")
+        self.__probs = np.reshape(probs, (-1))
+        self.__cum_probs = np.cumsum(self.__probs)
+        self.__random = rs.createRandomStream(random)
+        self.__mode = mode
+        self.__selector = sl.createSelector(selection, self.__probs, tournament_size, selection_pressure)
+        self.__buffers = bf.BufferPool()
+        self.__columns = None
+        self.__kernel_backend = kr.resolveKernelBackend(kernel_backend)
+
+    def sample(self,
+            means: np.ndarray,
+            sigmas: np.ndarray,
+            n_ants: int,
+            l_bound: float,
+            u_bound: float,
+            clip: bool = True,
+            out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Samples new (bounded) ant solutions
+        :param: means: Gaussian kernel means i.e. the archive positions (n_pop, n_vars)
+        :param: sigmas: Gaussian kernel standard deviations (n_pop, n_vars)
+        :param: n_ants: number of ants
+        :param: l_bound: domain lower bound
+        :param: u_bound: domain upper bound
+        :param: clip: applies the variable bounds if True (False leaves the bounds to the caller)
+        :param: out: (n_ants, n_vars) output array, filled in place (a new array is returned if None)
+        :return: positions of the new ant solutions (n_ants, n_vars)
+        """
+        positions = out if out is not None else np.empty((n_ants, np.shape(means)[1]), dtype=np.result_type(means, sigmas))
+        if self.__mode == "legacy":
+            self.__sampleLegacy(means, sigmas, n_ants, positions)
+        else:
+            self.__sampleVectorized(means, sigmas, n_ants, positions)
+        if clip:
+            self.clip(positions, l_bound, u_bound)
+        return positions
+
+    def clip(self, positions: np.ndarray, l_bound: float, u_bound: float) -> np.ndarray:
+        """
+        Applies the variable bounds (in place) with the kernel backend of the sampler
+        :param: positions: ant solution positions (n_ants, n_vars)
+        :param: l_bound: domain lower bound
+        :param: u_bound: domain upper bound
+        """
+        if self.__kernel_backend == "numba" and positions.ndim == 2:
+            return kr.applyBounds(positions, l_bound, u_bound)
+        return KernelSampler.applyBounds(positions, l_bound, u_bound)
+
+    def sampleBatch(self,
+            means: np.ndarray,
+            sigmas: np.ndarray,
+            n_ants: int) -> np.ndarray:
+        """
+        Samples new (unbounded) ant solutions of a batch of independent archives in one vectorized draw (the
+        'vectorized' mode with a leading batch axis)
+        :param: means: Gaussian kernel means i.e. the archive positions (n_instances, n_pop, n_vars)
+        :param: sigmas: Gaussian kernel standard deviations (n_instances, n_pop, n_vars)
+        :param: n_ants: number of ants per archive
+        :return: positions of the new ant solutions (n_instances, n_ants, n_vars)
+        """
+        n_instances, n_pop, n_vars = means.shape
+        # Select Gaussian Kernels
+        k = self.__selector.select(self.__random, (n_instances, n_ants, n_vars))
+        # Generate Gaussian Random Variables
+        noise = self.__random.randn(n_instances, n_ants, n_vars)
+        positions = np.take_along_axis(means, k, axis=1)
+        positions += np.take_along_axis(sigmas, k, axis=1) * noise
+        return positions
+
+    @staticmethod
+    def applyBounds(positions: np.ndarray, l_bound: float, u_bound: float) -> np.ndarray:
+        """
+        Applies the variable bounds (in place)
+        :param: positions: ant solution positions
+        :param: l_bound: domain lower bound
+        :param: u_bound: domain upper bound
+        """
+        np.maximum(positions, l_bound, out=positions)
+        return np.minimum(positions, u_bound, out=positions)
+
+    def __sampleVectorized(self, means, sigmas, n_ants, positions):
+        """
+        Batched sampling of all the ant solutions of a generation (in place, through the pooled buffers)
+        """
+        n_pop, n_vars = means.shape
+        shape = (n_ants, n_vars)
+        if self.__kernel_backend == "numba":
+            self.__sampleCompiled(means, sigmas, shape, positions)
+            return
+        if self.__columns is None or self.__columns.shape != shape:
+            # Full (not broadcast) column offsets, so the in place index update needs no ufunc buffering
+            self.__columns = np.tile(np.arange(n_vars), (n_ants, 1))
+        # Select Gaussian Kernels
+        k = self.__selector.select(self.__random, shape, out=self.__buffers.get("indices", shape, np.intp), buffers=self.__buffers)
+        # Flat (row-major) indices of the selected kernel means/sigmas
+        k *= n_vars
+        k += self.__columns
+        # Generate Gaussian Random Variables
+        noise = self.__random.fillRandn(self.__buffers.get("noise", shape, positions.dtype))
+        np.take(means, k, out=positions, mode="clip")
+        spreads = np.take(sigmas, k, out=self.__buffers.get("spreads", shape, positions.dtype), mode="clip")
+        spreads *= noise
+        positions += spreads
+
+    def __sampleCompiled(self, means, sigmas, shape, positions):
+        """
+        Batched sampling of all the ant solutions of a generation with the compiled kernels (same random number
+        order as the NumPy path i.e. the kernel selection draws first, then the Gaussian noise)
+        """
+        if isinstance(self.__selector, sl.RouletteSelector):
+            uniforms = self.__random.fillRand(self.__buffers.get("selection_uniforms", shape))
+            noise = self.__random.fillRandn(self.__buffers.get("noise", shape, positions.dtype))
+            kr.sampleRoulette(means, sigmas, self.__cum_probs, uniforms, noise, positions)
+        else:
+            k = self.__selector.select(self.__random, shape, out=self.__buffers.get("indices", shape, np.intp), buffers=self.__buffers)
+            noise = self.__random.fillRandn(self.__buffers.get("noise", shape, positions.dtype))
+            kr.gatherSamples(means, sigmas, k, noise, positions)
+
+    def __sampleLegacy(self, means, sigmas, n_ants, positions):
+        """
+        Per-draw sampling of the ant solutions (original random number order)
+        """
+        n_vars = means.shape[1]
+        for i in range(n_ants):
+            for j in range(n_vars):
+                # Select Gaussian Kernel
+                r = self.__random.rand()
+                k = np.argwhere(r <= self.__cum_probs)[0, 0]
+                # Generate Gaussian Random Variable
+                positions[i, j] = means[k, j] + sigmas[k, j] * self.__random.randn()
+
+    @property
+    def buffers(self):
+        """
+        Getter property of the 'self.__buffers' attribute i.e. the pooled scratch buffers
+        """
+        return self.__buffers
+
+    @property
+    def kernel_backend(self):
+        """
+        Getter property of the 'self.__kernel_backend' attribute i.e. the resolved kernel backend
+        """
+        return self.__kernel_backend
+
+    @property
+    def mode(self):
+        """
+        Getter property of the 'self.__mode' attribute
+        """
+        return self.__mode
+
+    @property
+    def selector(self):
+        """
+        Getter property of the 'self.__selector' attribute i.e. the kernel selection strategy
+        """
+        return self.__selector
+
+    @property
+    def cum_probs(self):
+        """
+        Getter property of the 'self.__cum_probs' attribute
+        """
+        return self.__cum_probs
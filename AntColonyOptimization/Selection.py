@@ -0,0 +1,216 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+import numpy as np
+
+import Buffers as bf
+import Constants as c
+
+
+class KernelSelector(ABC):
+    """
+    Base class of the Gaussian kernel selection strategies i.e. draws archive member (kernel) indices in bulk.
+
+    The archive is sorted by ascending cost, so index 0 is the best archive member. The selectors write their
+    random draws and intermediate results to the scratch buffers of a (reusable) 'Buffers.BufferPool'.
+    """
+    name = "selector"
+
+    @abstractmethod
+    def select(self,
+            random: object,
+            shape: Tuple[int, ...],
+            out: Optional[np.ndarray] = None,
+            buffers: Optional[bf.BufferPool] = None) -> np.ndarray:
+        """
+        Draws kernel indices
+        :param: random: random stream (see 'RandomStreams.RandomStream')
+        :param: shape: output shape e.g. (n_ants, n_vars)
+        :param: out: intp output array (a new array is returned if None)
+        :param: buffers: scratch buffer pool (temporary buffers are allocated if None)
+        :return: kernel indices (of the specified shape)
+        """
+
+
+class RouletteSelector(KernelSelector):
+    """
+    Roulette wheel selection proportional to the kernel weights i.e. a binary search of the cumulative probabilities
+    (O(log(n_pop)) per draw), which reproduces the original kernel selection random number order
+    """
+    name = "roulette"
+
+    def __init__(self, probs: np.ndarray):
+        """
+        Constructor
+        :param: probs: kernel selection probabilities (n_pop,)
+        """
+        self.__cum_probs = np.cumsum(np.reshape(probs, (-1)))
+
+    def select(self, random, shape, out=None, buffers=None):
+        """
+        Draws kernel indices by a binary search of the cumulative probabilities
+        :param: random: random stream (see 'RandomStreams.RandomStream')
+        :param: shape: output shape e.g. (n_ants, n_vars)
+        :param: out: intp output array (a new array is returned if None)
+        :param: buffers: scratch buffer pool (temporary buffers are allocated if None)
+        :return: kernel indices (of the specified shape)
+        """
+        buffers = buffers if buffers is not None else bf.BufferPool()
+        u = random.fillRand(buffers.get("selection_uniforms", shape))
+        # The binary search has no 'out' argument i.e. allocates the (intp) search result
+        k = np.searchsorted(self.__cum_probs, u, side="left")
+        return np.minimum(k, len(self.__cum_probs) - 1, out=out if out is not None else k)
+
+
+class AliasSelector(KernelSelector):
+    """
+    Walker/Vose alias method selection proportional to the kernel weights i.e. O(1) per draw (one uniform random
+    number, split into a table column and a coin flip) from an O(n_pop) table built once
+    """
+    name = "alias"
+
+    def __init__(self, probs: np.ndarray):
+        """
+        Constructor
+        :param: probs: kernel selection probabilities (n_pop,)
+        """
+        self.__probs, self.__aliases = AliasSelector.createAliasTable(probs)
+
+    @staticmethod
+    def createAliasTable(probs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Creates the (Vose) alias table of a discrete distribution
+        :param: probs: probabilities (n,)
+        :return: column acceptance probabilities (n,) and column aliases (n,)
+        """
+        probs = np.reshape(np.asarray(probs, dtype=float), (-1))
+        n = len(probs)
+        scaled_probs = probs * n / np.sum(probs)
+        acceptance_probs = np.ones(n)
+        aliases = np.arange(n)
+        small = [i for i in range(n) if scaled_probs[i] < 1.0]
+        large = [i for i in range(n) if scaled_probs[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            acceptance_probs[s] = scaled_probs[s]
+            aliases[s] = l
+            scaled_probs[l] -= 1.0 - scaled_probs[s]
+            (small if scaled_probs[l] < 1.0 else large).append(l)
+        # The remaining columns are full (up to rounding errors)
+        return acceptance_probs, aliases
+
+    def select(self, random, shape, out=None, buffers=None):
+        """
+        Draws kernel indices from the alias table
+        :param: random: random stream (see 'RandomStreams.RandomStream')
+        :param: shape: output shape e.g. (n_ants, n_vars)
+        :param: out: intp output array (a new array is returned if None)
+        :param: buffers: scratch buffer pool (temporary buffers are allocated if None)
+        :return: kernel indices (of the specified shape)
+        """
+        buffers = buffers if buffers is not None else bf.BufferPool()
+        n = len(self.__probs)
+        k = out if out is not None else np.empty(shape, dtype=np.intp)
+        u = random.fillRand(buffers.get("selection_uniforms", shape))
+        u *= n
+        # Table column (truncation) and coin flip (fractional part), kept in float64 to avoid mixed type buffering
+        columns = np.floor(u, out=buffers.get("selection_columns", shape))
+        np.minimum(columns, n - 1, out=columns)
+        np.copyto(k, columns, casting="unsafe")
+        u -= columns
+        acceptance_probs = np.take(self.__probs, k, out=buffers.get("selection_probs", shape), mode="clip")
+        rejected = np.greater_equal(u, acceptance_probs, out=buffers.get("selection_rejected", shape, bool))
+        aliases = np.take(self.__aliases, k, out=buffers.get("selection_aliases", shape, np.intp), mode="clip")
+        np.putmask(k, rejected, aliases)
+        return k
+
+    @property
+    def probs(self):
+        """
+        Getter property of the 'self.__probs' attribute i.e. the column acceptance probabilities
+        """
+        return self.__probs
+
+    @property
+    def aliases(self):
+        """
+        Getter property of the 'self.__aliases' attribute
+        """
+        return self.__aliases
+
+
+class TournamentSelector(KernelSelector):
+    """
+    Tournament selection i.e. each draw picks the best of 'tournament_size' uniformly drawn archive members
+    """
+    name = "tournament"
+
+    def __init__(self, n_pop: int, tournament_size: int = c.AcoConstants.TOURNAMENT_SIZE):
+        """
+        Constructor
+        :param: n_pop: population size (archive size)
+        :param: tournament_size: number of archive members per tournament
+        """
+        if tournament_size < 1:
+            raise ValueError(f"Invalid tournament size '{tournament_size}', expected a positive integer")
+        self.__n_pop = n_pop
+        self.__tournament_size = tournament_size
+
+    def select(self, random, shape, out=None, buffers=None):
+        """
+        Draws kernel indices as the best (lowest index) contender of each tournament
+        :param: random: random stream (see 'RandomStreams.RandomStream')
+        :param: shape: output shape e.g. (n_ants, n_vars)
+        :param: out: intp output array (a new array is returned if None)
+        :param: buffers: scratch buffer pool (temporary buffers are allocated if None)
+        :return: kernel indices (of the specified shape)
+        """
+        buffers = buffers if buffers is not None else bf.BufferPool()
+        contenders_shape = (*shape, self.__tournament_size)
+        u = random.fillRand(buffers.get("selection_uniforms", contenders_shape))
+        u *= self.__n_pop
+        contenders = buffers.get("selection_contenders", contenders_shape, np.intp)
+        np.copyto(contenders, u, casting="unsafe")
+        np.minimum(contenders, self.__n_pop - 1, out=contenders)
+        return np.min(contenders, axis=-1, out=out)
+
+
+def computeLinearRankProbabilities(n_pop: int, selection_pressure: float = c.AcoConstants.RANK_SELECTION_PRESSURE) -> np.ndarray:
+    """
+    Computes the linear ranking selection probabilities of a sorted archive
+    :param: n_pop: population size (archive size)
+    :param: selection_pressure: expected number of selections of the best member relative to the average, in [1, 2]
+    :return: selection probabilities (n_pop,)
+    """
+    if not 1.0 <= selection_pressure <= 2.0:
+        raise ValueError(f"Invalid selection pressure '{selection_pressure}', expected a value in [1, 2]")
+    if n_pop == 1:
+        return np.ones(1)
+    ranks = np.arange(n_pop - 1, -1, -1, dtype=float)
+    return ((2.0 - selection_pressure) + 2.0 * (selection_pressure - 1.0) * ranks / (n_pop - 1)) / n_pop
+
+
+SELECTION_STRATEGIES = ("roulette", "alias", "rank", "tournament")
+
+
+def createSelector(strategy: str,
+        probs: np.ndarray,
+        tournament_size: int = c.AcoConstants.TOURNAMENT_SIZE,
+        selection_pressure: float = c.AcoConstants.RANK_SELECTION_PRESSURE) -> KernelSelector:
+    """
+    Creates a kernel selection strategy
+    :param: strategy: selection strategy i.e. 'roulette' or 'alias' (proportional to the kernel weights), 'rank'
+            (linear ranking, alias sampled) or 'tournament'
+    :param: probs: kernel selection probabilities (n_pop,) i.e. the normalized kernel weights
+    :param: tournament_size: number of archive members per tournament ('tournament' strategy)
+    :param: selection_pressure: linear ranking selection pressure ('rank' strategy)
+    """
+    if strategy not in SELECTION_STRATEGIES:
+        raise ValueError(f"Invalid selection strategy '{strategy}', expected one of {SELECTION_STRATEGIES}")
+    n_pop = np.size(probs)
+    if strategy == "roulette":
+        return RouletteSelector(probs)
+    if strategy == "alias":
+        return AliasSelector(probs)
+    if strategy == "rank":
+        return AliasSelector(computeLinearRankProbabilities(n_pop, selection_pressure))
+    return TournamentSelector(n_pop, tournament_size)
@@ -0,0 +1,244 @@
+from typing import Dict
+import numpy as np
+
+import Constants as c
+import Kernels as kr
+
+
+class SigmaEngine(object):
+    """
+    Computes the standard deviations (sigmas) of the ACOR Gaussian kernels i.e.
+
+        sigma[l, j] = zeta * sum_r |means[l, j] - means[r, j]| / (n_pop - 1)
+
+    The per-dimension sums of absolute deviations can be computed with one of the following methods:
+
+        - 'loop': the original O(n_pop^2 * n_vars) pair by pair Python loop
+        - 'broadcast': chunked NumPy broadcasting i.e. O(n_pop^2 * n_vars) work with O(chunk_size * n_pop * n_vars)
+          temporary memory, suited to small/mid-size archives
+        - 'sorted': exact O(n_vars * n_pop * log(n_pop)) computation that sorts each dimension and uses prefix sums,
+          suited to large archives
+        - 'auto': 'broadcast' up to 'BROADCAST_MAX_POP' archive members and 'sorted' above it
+        - 'incremental': keeps the sums of the last computed archive and, after each archive merge (see 'update'),
+          only subtracts/adds the distances to the replaced/new archive members i.e. O(n_changed * n_pop * n_vars)
+          work per generation. The sums are fully recomputed ('auto' method) when more than half of the archive
+          changed, every 'refresh_interval' incremental updates (bounding the floating point drift) and whenever the
+          means do not match the tracked archive
+
+    With the 'numba' kernel backend, the O(n_pop^2) full computations ('loop' and 'broadcast', including 'auto' on
+    small/mid-size archives) of a single (2D) archive use the compiled, allocation-free loop of
+    'Kernels.computeDistanceSums' instead, whilst the 'sorted' computations keep their O(n_pop * log(n_pop)) path.
+    """
+    SIGMA_METHODS = ("loop", "broadcast", "sorted", "auto", "incremental")
+    BROADCAST_MAX_POP = 256
+
+    def __init__(self,
+            zeta: float,
+            method: str = c.AcoConstants.SIGMA_METHOD,
+            chunk_size: int = c.AcoConstants.SIGMA_CHUNK_SIZE,
+            refresh_interval: int = c.AcoConstants.SIGMA_REFRESH_INTERVAL,
+            kernel_backend: str = c.AcoConstants.KERNEL_BACKEND):
+        """
+        Constructor
+        :param: zeta: deviation-distance ratio
+        :param: method: sum of absolute deviations method i.e. 'loop', 'broadcast', 'sorted', 'auto' or 'incremental'
+        :param: chunk_size: number of archive members processed per chunk by the 'broadcast' method
+        :param: refresh_interval: number of incremental updates between full recomputations ('incremental' method)
+        :param: kernel_backend: kernel backend i.e. 'numpy', 'numba' or 'auto' (see 'Kernels.resolveKernelBackend')
+        """
+        if method not in SigmaEngine.SIGMA_METHODS:
+            raise ValueError(f"Invalid sigma method '{method}', expected one of {SigmaEngine.SIGMA_METHODS}")
+        self.__zeta = zeta
+        self.__method = method
+        self.__chunk_size = chunk_size
+        self.__refresh_interval = refresh_interval
+        self.__kernel_backend = kr.resolveKernelBackend(kernel_backend)
+        self.__means = None
+        self.__d = None
+        self.__n_updates = 0
+        self.__n_full_computations = 0
+        self.__n_incremental_updates = 0
+
+    def compute(self,
+            means: np.ndarray,
+            out: np.ndarray = None) -> np.ndarray:
+        """
+        Computes the Gaussian kernel standard deviations
+        :param: means: Gaussian kernel means i.e. the archive positions (n_pop, n_vars), optionally with leading batch
+                axes e.g. (n_instances, n_pop, n_vars)
+        :param: out: optional output array (of the 'means' shape)
+        :return: Gaussian kernel standard deviations (of the 'means' shape)
+        """
+        n_pop = means.shape[-2]
+        if self.__method == "incremental":
+            if self.__d is None or self.__d.shape != means.shape or not np.array_equal(self.__means, means):
+                self.__d = self.__computeDistanceSums(means, "auto")
+                self.__means = means.copy()
+                self.__n_updates = 0
+                self.__n_full_computations += 1
+            d = self.__d
+        else:
+            d = self.__computeDistanceSums(means, self.__method, out)
+        if out is None:
+            out = np.empty_like(d)
+        np.multiply(self.__zeta, d, out=out)
+        np.divide(out, n_pop - 1, out=out)
+        return out
+
+    def __computeDistanceSums(self, means: np.ndarray, method: str, out: np.ndarray = None) -> np.ndarray:
+        """
+        Computes the per-dimension sums of absolute deviations from scratch (into 'out' for the compiled kernel)
+        """
+        if method == "auto":
+            method = "broadcast" if means.shape[-2] <= SigmaEngine.BROADCAST_MAX_POP else "sorted"
+        if self.__kernel_backend == "numba" and means.ndim == 2 and method in ("loop", "broadcast"):
+            return kr.computeDistanceSums(means, out)
+        if method == "loop":
+            return SigmaEngine.computeDistanceSumsLoop(means)
+        if method == "broadcast":
+            return SigmaEngine.computeDistanceSumsBroadcast(means, self.__chunk_size)
+        return SigmaEngine.computeDistanceSumsSorted(means)
+
+    def update(self,
+            order: np.ndarray,
+            means: np.ndarray,
+            sample_positions: np.ndarray):
+        """
+        Updates the tracked sums of absolute deviations after an archive merge ('incremental' method only, a no-op
+        for the other methods)
+        :param: order: merge sort index of the archive and samples (see 'Archive.SolutionArchive.order')
+        :param: means: merged archive positions (n_pop, n_vars)
+        :param: sample_positions: merged sample positions (n_ants, n_vars)
+        """
+        if self.__method != "incremental" or self.__d is None:
+            return
+        n_pop = self.__d.shape[0]
+        keep = order[:n_pop]
+        is_new = keep >= n_pop
+        n_changed = int(np.count_nonzero(is_new))
+        if n_changed == 0:
+            return
+        if 2*n_changed > n_pop or self.__n_updates >= self.__refresh_interval:
+            self.__d = None
+            return
+        kept = keep[~is_new]
+        removed = np.setdiff1d(np.arange(n_pop), kept, assume_unique=True)
+        added_positions = sample_positions[keep[is_new] - n_pop]
+        kept_means = self.__means[kept]
+        # Remove the distances to the replaced members and add the distances to the new members
+        d_kept = self.__d[kept]
+        d_kept -= np.sum(np.abs(kept_means[:, np.newaxis, :] - self.__means[removed][np.newaxis, :, :]), axis=1)
+        d_kept += np.sum(np.abs(kept_means[:, np.newaxis, :] - added_positions[np.newaxis, :, :]), axis=1)
+        d = np.empty_like(self.__d)
+        d[~is_new] = d_kept
+        d[is_new] = np.sum(np.abs(added_positions[:, np.newaxis, :] - means[np.newaxis, :, :]), axis=1)
+        self.__d = d
+        self.__means = means.copy()
+        self.__n_updates += 1
+        self.__n_incremental_updates += 1
+
+    def getState(self) -> Dict[str, np.ndarray]:
+        """
+        Gets the tracked archive state of the 'incremental' method (used by the checkpoints, so a resumed run keeps
+        the running sums instead of recomputing them, which would not match bit-for-bit)
+        """
+        if self.__d is None:
+            return {"sigma_means": np.zeros((0, 0)), "sigma_distance_sums": np.zeros((0, 0)),
+                    "sigma_n_updates": np.array(0)}
+        return {"sigma_means": self.__means, "sigma_distance_sums": self.__d, "sigma_n_updates": np.array(self.__n_updates)}
+
+    def setState(self, state: Dict[str, np.ndarray]):
+        """
+        Restores the tracked archive state of the 'incremental' method (used by the checkpoints)
+        :param: state: sigma engine state created by 'getState'
+        """
+        self.reset()
+        if self.__method != "incremental" or "sigma_distance_sums" not in state or state["sigma_distance_sums"].size == 0:
+            return
+        self.__means = state["sigma_means"].copy()
+        self.__d = state["sigma_distance_sums"].copy()
+        self.__n_updates = int(state["sigma_n_updates"])
+
+    def reset(self):
+        """
+        Discards the tracked archive ('incremental' method) e.g. when the archive is reinitialized
+        """
+        self.__means = None
+        self.__d = None
+        self.__n_updates = 0
+
+    @staticmethod
+    def computeDistanceSumsLoop(means: np.ndarray) -> np.ndarray:
+        """
+        Computes the per-dimension sums of absolute deviations pair by pair
+        :param: means: archive positions (n_pop, n_vars), optionally with leading batch axes
+        """
+        n_pop = means.shape[-2]
+        d = np.zeros(means.shape)
+        for l_i in range(n_pop):
+            for r_i in range(n_pop):
+                d[..., l_i, :] += np.abs(means[..., l_i, :] - means[..., r_i, :])
+        return d
+
+    @staticmethod
+    def computeDistanceSumsBroadcast(means: np.ndarray, chunk_size: int) -> np.ndarray:
+        """
+        Computes the per-dimension sums of absolute deviations by chunked broadcasting
+        :param: means: archive positions (n_pop, n_vars), optionally with leading batch axes
+        :param: chunk_size: number of archive members processed per chunk
+        """
+        n_pop = means.shape[-2]
+        d = np.empty(means.shape)
+        for start in range(0, n_pop, chunk_size):
+            stop = min(start + chunk_size, n_pop)
+            np.sum(np.abs(means[..., start:stop, np.newaxis, :] - means[..., np.newaxis, :, :]), axis=-2, out=d[..., start:stop, :])
+        return d
+
+    @staticmethod
+    def computeDistanceSumsSorted(means: np.ndarray) -> np.ndarray:
+        """
+        Computes the per-dimension sums of absolute deviations from the sorted columns and their prefix sums.
+
+        For the i-th smallest value s_i of a column (0-based) with prefix sum P_i = s_0 + ... + s_i:
+
+            sum_r |s_i - s_r| = s_i * (2*i + 2 - n_pop) - 2*P_i + P_(n_pop - 1)
+
+        :param: means: archive positions (n_pop, n_vars), optionally with leading batch axes
+        """
+        n_pop = means.shape[-2]
+        order = np.argsort(means, axis=-2, kind="stable")
+        sorted_means = np.take_along_axis(means, order, axis=-2)
+        prefix_sums = np.cumsum(sorted_means, axis=-2)
+        ranks = np.arange(n_pop, dtype=means.dtype).reshape(-1, 1)
+        d_sorted = sorted_means * (2.0 * ranks + 2.0 - n_pop) - 2.0 * prefix_sums + prefix_sums[..., -1:, :]
+        d = np.empty_like(d_sorted)
+        np.put_along_axis(d, order, d_sorted, axis=-2)
+        return d
+
+    @property
+    def method(self):
+        """
+        Getter property of the 'self.__method' attribute
+        """
+        return self.__method
+
+    @property
+    def kernel_backend(self):
+        """
+        Getter property of the 'self.__kernel_backend' attribute i.e. the resolved kernel backend
+        """
+        return self.__kernel_backend
+
+    @property
+    def n_full_computations(self):
+        """
+        Getter property of the 'self.__n_full_computations' attribute ('incremental' method)
+        """
+        return self.__n_full_computations
+
+    @property
+    def n_incremental_updates(self):
+        """
+        Getter property of the 'self.__n_incremental_updates' attribute ('incremental' method)
+        """
+        return self.__n_incremental_updates
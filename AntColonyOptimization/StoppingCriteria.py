@@ -0,0 +1,154 @@
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class StoppingCriterion(ABC):
+    """
+    Base class of the ACO algorithm stopping criteria (checked after every generation).
+
+    A criterion inspects the ACO algorithm state through its public properties ('final_best_solution', 'sigmas',
+    'iteration', 'n_evaluations' and 'elapsed_time') and reports its 'name' when it fires.
+    """
+    name = "criterion"
+
+    def reset(self):
+        """
+        Resets the criterion state at the start of a run
+        """
+        pass
+
+    @abstractmethod
+    def isSatisfied(self, acor: object) -> bool:
+        """
+        Checks if the criterion is satisfied
+        :param: acor: ACO algorithm
+        :return: True if the ACO algorithm should stop
+        """
+
+
+class NoImprovementCriterion(StoppingCriterion):
+    """
+    Stops when the best cost has not improved (by more than 'tolerance') for 'patience' generations
+    """
+    name = "no_improvement"
+
+    def __init__(self, patience: int, tolerance: float = 0.0):
+        """
+        Constructor
+        :param: patience: number of generations without improvement
+        :param: tolerance: minimum best cost decrease counted as an improvement
+        """
+        self.__patience = patience
+        self.__tolerance = tolerance
+        self.__best_cost = np.inf
+        self.__n_stalled = 0
+
+    def reset(self):
+        """
+        Resets the best cost and the number of stalled generations at the start of a run
+        """
+        self.__best_cost = np.inf
+        self.__n_stalled = 0
+
+    def isSatisfied(self, acor: object) -> bool:
+        """
+        Checks if the best cost has stalled for 'patience' generations
+        :param: acor: ACO algorithm
+        :return: True if the best cost has not improved for 'patience' generations
+        """
+        cost = acor.final_best_solution.cost_function
+        if cost < self.__best_cost - self.__tolerance:
+            self.__best_cost = cost
+            self.__n_stalled = 0
+        else:
+            self.__n_stalled += 1
+        return self.__n_stalled >= self.__patience
+
+
+class TargetCostCriterion(StoppingCriterion):
+    """
+    Stops when the best cost reaches the target cost
+    """
+    name = "target_cost"
+
+    def __init__(self, target_cost: float):
+        """
+        Constructor
+        :param: target_cost: target (minimum) cost
+        """
+        self.__target_cost = target_cost
+
+    def isSatisfied(self, acor: object) -> bool:
+        """
+        Checks if the best cost has reached the target cost
+        :param: acor: ACO algorithm
+        :return: True if the best cost is lower than or equal to the target cost
+        """
+        return acor.final_best_solution.cost_function <= self.__target_cost
+
+
+class SigmaThresholdCriterion(StoppingCriterion):
+    """
+    Stops when the archive has collapsed i.e. the largest Gaussian kernel standard deviation falls below the threshold
+    """
+    name = "sigma_threshold"
+
+    def __init__(self, threshold: float):
+        """
+        Constructor
+        :param: threshold: standard deviation threshold
+        """
+        self.__threshold = threshold
+
+    def isSatisfied(self, acor: object) -> bool:
+        """
+        Checks if the archive has collapsed
+        :param: acor: ACO algorithm
+        :return: True if the largest Gaussian kernel standard deviation is below the threshold
+        """
+        return np.max(acor.sigmas) < self.__threshold
+
+
+class WallClockCriterion(StoppingCriterion):
+    """
+    Stops when the elapsed run time exceeds the wall-clock budget
+    """
+    name = "wall_clock"
+
+    def __init__(self, max_seconds: float):
+        """
+        Constructor
+        :param: max_seconds: wall-clock budget (seconds)
+        """
+        self.__max_seconds = max_seconds
+
+    def isSatisfied(self, acor: object) -> bool:
+        """
+        Checks if the wall-clock budget is exhausted
+        :param: acor: ACO algorithm
+        :return: True if the elapsed run time reached the budget
+        """
+        return acor.elapsed_time >= self.__max_seconds
+
+
+class MaxEvaluationsCriterion(StoppingCriterion):
+    """
+    Stops when the number of cost function evaluations reaches the cap (checked per generation, so the cap can be
+    exceeded by up to one generation of ants)
+    """
+    name = "max_evaluations"
+
+    def __init__(self, max_evaluations: int):
+        """
+        Constructor
+        :param: max_evaluations: maximum number of cost function evaluations
+        """
+        self.__max_evaluations = max_evaluations
+
+    def isSatisfied(self, acor: object) -> bool:
+        """
+        Checks if the evaluation cap is reached
+        :param: acor: ACO algorithm
+        :return: True if the number of cost function evaluations reached the cap
+        """
+        return acor.n_evaluations >= self.__max_evaluations
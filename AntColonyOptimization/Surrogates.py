@@ -0,0 +1,429 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, Union
+import numpy as np
+
+import Constants as c
+
+
+class Surrogate(ABC):
+    """
+    Base class of the cheap cost function models (surrogates) of the surrogate-assisted pre-screening.
+
+    A surrogate is (re)trained incrementally on every truly evaluated solution and only has to rank the candidate
+    solutions of a generation, not to predict their costs accurately.
+    """
+    name = "surrogate"
+
+    @abstractmethod
+    def reset(self):
+        """
+        Discards the training samples (at the start of a run)
+        """
+
+    @abstractmethod
+    def update(self, positions: np.ndarray, costs: np.ndarray):
+        """
+        Adds truly evaluated solutions to the training samples
+        :param: positions: solution positions (n_solutions, n_vars)
+        :param: costs: solution costs (n_solutions,)
+        """
+
+    @abstractmethod
+    def predict(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Predicts the costs of candidate solutions
+        :param: positions: candidate positions (n_candidates, n_vars)
+        :return: predicted costs (n_candidates,)
+        """
+
+    def getState(self) -> Dict[str, np.ndarray]:
+        """
+        Gets the training state (used by the checkpoints). Surrogates without a persisted state are retrained from the
+        archive on a checkpoint resume
+        :return: training state i.e. a dictionary of arrays (keys prefixed with 'surrogate_')
+        """
+        return {}
+
+    def setState(self, state: Dict[str, np.ndarray]):
+        """
+        Restores the training state (used by the checkpoints)
+        :param: state: training state created by 'getState'
+        """
+
+    @property
+    @abstractmethod
+    def is_ready(self) -> bool:
+        """
+        Getter property of the surrogate readiness i.e. True once there are enough samples to fit the model
+        """
+
+
+class QuadraticSurrogate(Surrogate):
+    """
+    Separable quadratic regression i.e. a least squares fit of 'cost ~ b + sum(x*l + x^2*q)' (2*n_vars + 1
+    coefficients), retrained incrementally by accumulating the normal equations. The accumulated normal equations
+    decay by the forgetting factor at every update, so the model follows the region the archive converges to
+    (recursive least squares with forgetting).
+    """
+    name = "quadratic"
+
+    def __init__(self, n_vars: int, forgetting: float = c.AcoConstants.SURROGATE_FORGETTING):
+        """
+        Constructor
+        :param: n_vars: number of variables
+        :param: forgetting: forgetting factor (in (0, 1], 1 weighs every sample equally)
+        """
+        if not 0.0 < forgetting <= 1.0:
+            raise ValueError(f"Invalid forgetting factor '{forgetting}', expected a value in (0, 1]")
+        self.__n_vars = n_vars
+        self.__n_features = 2*n_vars + 1
+        self.__forgetting = forgetting
+        self.reset()
+
+    def reset(self):
+        """
+        Discards the accumulated normal equations (at the start of a run)
+        """
+        self.__gram = np.zeros((self.__n_features, self.__n_features))
+        self.__moments = np.zeros(self.__n_features)
+        self.__coefficients = None
+        self.__n_samples = 0
+
+    def update(self, positions, costs):
+        """
+        Decays the normal equations by the forgetting factor and accumulates the truly evaluated solutions
+        :param: positions: solution positions (n_solutions, n_vars)
+        :param: costs: solution costs (n_solutions,)
+        """
+        features = self.__createFeatures(positions)
+        self.__gram *= self.__forgetting
+        self.__gram += features.T @ features
+        self.__moments *= self.__forgetting
+        self.__moments += features.T @ np.asarray(costs, dtype=float)
+        self.__coefficients = None
+        self.__n_samples += len(features)
+
+    def predict(self, positions):
+        """
+        Predicts the costs of candidate solutions (the coefficients are solved lazily after an update)
+        :param: positions: candidate positions (n_candidates, n_vars)
+        :return: predicted costs (n_candidates,)
+        """
+        if self.__coefficients is None:
+            # Minimum norm solution (the collapsed archive makes the normal equations nearly singular)
+            self.__coefficients = np.linalg.lstsq(self.__gram, self.__moments, rcond=None)[0]
+        return self.__createFeatures(positions) @ self.__coefficients
+
+    def getState(self):
+        """
+        Gets the training state i.e. the accumulated normal equations and the number of samples
+        :return: training state i.e. a dictionary of arrays (keys prefixed with 'surrogate_')
+        """
+        return {"surrogate_gram": self.__gram, "surrogate_moments": self.__moments,
+                "surrogate_n_samples": np.array(self.__n_samples)}
+
+    def setState(self, state):
+        """
+        Restores the accumulated normal equations (the coefficients are solved on the next prediction)
+        :param: state: training state created by 'getState'
+        """
+        self.__gram = state["surrogate_gram"].copy()
+        self.__moments = state["surrogate_moments"].copy()
+        self.__coefficients = None
+        self.__n_samples = int(state["surrogate_n_samples"])
+
+    def __createFeatures(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Creates the regression features i.e. [1, x, x^2] (n_solutions, 2*n_vars + 1)
+        """
+        positions = np.reshape(positions, (-1, self.__n_vars))
+        return np.hstack((np.ones((len(positions), 1)), positions, np.square(positions)))
+
+    @property
+    def is_ready(self):
+        """
+        Getter property of the surrogate readiness i.e. True once there are at least as many samples as coefficients
+        """
+        return self.__n_samples >= self.__n_features
+
+    @property
+    def n_samples(self):
+        """
+        Getter property of the 'self.__n_samples' attribute i.e. the number of training samples
+        """
+        return self.__n_samples
+
+
+class RbfSurrogate(Surrogate):
+    """
+    Cubic radial basis function interpolation with a linear polynomial tail, fitted on (up to) the 'max_samples'
+    best training samples. Retraining keeps the best samples incrementally and refits the (small) interpolation
+    system on the next prediction.
+    """
+    name = "rbf"
+
+    def __init__(self,
+            n_vars: int,
+            max_samples: int = c.AcoConstants.SURROGATE_MAX_SAMPLES,
+            smoothing: float = c.AcoConstants.SURROGATE_SMOOTHING):
+        """
+        Constructor
+        :param: n_vars: number of variables
+        :param: max_samples: maximum number of training samples (the best ones are kept)
+        :param: smoothing: interpolation matrix regularization (0 interpolates the samples exactly)
+        """
+        if max_samples < n_vars + 2:
+            raise ValueError(f"Invalid maximum number of samples '{max_samples}', expected at least {n_vars + 2}")
+        self.__n_vars = n_vars
+        self.__max_samples = max_samples
+        self.__smoothing = smoothing
+        self.reset()
+
+    def reset(self):
+        """
+        Discards the kept training samples (at the start of a run)
+        """
+        self.__positions = np.zeros((0, self.__n_vars))
+        self.__costs = np.zeros(0)
+        self.__weights = None
+        self.__tail = None
+
+    def update(self, positions, costs):
+        """
+        Adds truly evaluated solutions to the training samples and keeps the 'max_samples' best ones
+        :param: positions: solution positions (n_solutions, n_vars)
+        :param: costs: solution costs (n_solutions,)
+        """
+        positions = np.vstack((self.__positions, np.reshape(positions, (-1, self.__n_vars))))
+        costs = np.concatenate((self.__costs, np.asarray(costs, dtype=float)))
+        keep = np.argsort(costs, kind="stable")[:self.__max_samples]
+        self.__positions = positions[keep]
+        self.__costs = costs[keep]
+        self.__weights = None
+
+    def predict(self, positions):
+        """
+        Predicts the costs of candidate solutions (the interpolation system is refitted lazily after an update)
+        :param: positions: candidate positions (n_candidates, n_vars)
+        :return: predicted costs (n_candidates,)
+        """
+        if self.__weights is None:
+            self.__fit()
+        positions = np.reshape(positions, (-1, self.__n_vars))
+        return RbfSurrogate.__computeKernel(positions, self.__positions) @ self.__weights + \
+               positions @ self.__tail[1:] + self.__tail[0]
+
+    def getState(self):
+        """
+        Gets the training state i.e. the kept training samples
+        :return: training state i.e. a dictionary of arrays (keys prefixed with 'surrogate_')
+        """
+        return {"surrogate_positions": self.__positions, "surrogate_costs": self.__costs}
+
+    def setState(self, state):
+        """
+        Restores the kept training samples (the interpolation system is refitted on the next prediction)
+        :param: state: training state created by 'getState'
+        """
+        self.__positions = state["surrogate_positions"].copy()
+        self.__costs = state["surrogate_costs"].copy()
+        self.__weights = None
+
+    def __fit(self):
+        """
+        Solves the interpolation system [[phi, P], [P^T, 0]] [w; t] = [costs; 0] with P = [1, x]
+        """
+        n_samples = len(self.__costs)
+        tail = np.hstack((np.ones((n_samples, 1)), self.__positions))
+        n_tail = tail.shape[1]
+        system = np.zeros((n_samples + n_tail, n_samples + n_tail))
+        system[:n_samples, :n_samples] = RbfSurrogate.__computeKernel(self.__positions, self.__positions)
+        system[:n_samples, :n_samples] += self.__smoothing*np.eye(n_samples)
+        system[:n_samples, n_samples:] = tail
+        system[n_samples:, :n_samples] = tail.T
+        rhs = np.concatenate((self.__costs, np.zeros(n_tail)))
+        # Least squares, so duplicated samples (e.g. ants clipped onto the same bound) do not break the fit
+        solution = np.linalg.lstsq(system, rhs, rcond=None)[0]
+        self.__weights = solution[:n_samples]
+        self.__tail = solution[n_samples:]
+
+    @staticmethod
+    def __computeKernel(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Computes the cubic kernel matrix phi(|x_i - y_j|) = |x_i - y_j|^3 (n_x, n_y)
+        """
+        squared_distances = np.sum(np.square(x), axis=1)[:, None] + np.sum(np.square(y), axis=1)[None, :] - 2.0*(x @ y.T)
+        return np.maximum(squared_distances, 0.0)**1.5
+
+    @property
+    def is_ready(self):
+        """
+        Getter property of the surrogate readiness i.e. True once the interpolation system with its linear tail is
+        determined
+        """
+        return len(self.__costs) >= self.__n_vars + 2
+
+    @property
+    def n_samples(self):
+        """
+        Getter property of the number of (kept) training samples
+        """
+        return len(self.__costs)
+
+
+SURROGATES = ("quadratic", "rbf")
+
+
+def createSurrogate(surrogate: Union[str, Surrogate], n_vars: int) -> Surrogate:
+    """
+    Creates a surrogate
+    :param: surrogate: surrogate name i.e. 'quadratic' or 'rbf', or a 'Surrogate' (used as is)
+    :param: n_vars: number of variables
+    """
+    if isinstance(surrogate, Surrogate):
+        return surrogate
+    if surrogate not in SURROGATES:
+        raise ValueError(f"Invalid surrogate '{surrogate}', expected one of {SURROGATES}")
+    if surrogate == "quadratic":
+        return QuadraticSurrogate(n_vars)
+    return RbfSurrogate(n_vars)
+
+
+class SurrogateScreen(object):
+    """
+    Surrogate-assisted pre-screening of the new ant solutions.
+
+    Once its surrogate is ready, each generation samples 'oversampling' times more candidates than ants, ranks them
+    with the surrogate and sends only the 'fraction' of the number of ants with the best predicted costs to the true
+    cost function. The truly evaluated solutions retrain the surrogate.
+    """
+    def __init__(self,
+            surrogate: Union[str, Surrogate],
+            n_vars: int,
+            oversampling: int = c.AcoConstants.SURROGATE_OVERSAMPLING,
+            fraction: float = c.AcoConstants.SURROGATE_FRACTION):
+        """
+        Constructor
+        :param: surrogate: surrogate name i.e. 'quadratic' or 'rbf', or a 'Surrogate'
+        :param: n_vars: number of variables
+        :param: oversampling: number of sampled candidates per ant
+        :param: fraction: fraction of the number of ants truly evaluated per generation (in (0, 1])
+        """
+        if oversampling < 1:
+            raise ValueError(f"Invalid oversampling '{oversampling}', expected a positive integer")
+        if not 0.0 < fraction <= 1.0:
+            raise ValueError(f"Invalid fraction '{fraction}', expected a value in (0, 1]")
+        self.__surrogate = createSurrogate(surrogate, n_vars)
+        self.__oversampling = oversampling
+        self.__fraction = fraction
+        self.__n_screenings = 0
+        self.__n_candidates = 0
+
+    def reset(self):
+        """
+        Resets the surrogate and the screening counters (at the start of a run)
+        """
+        self.__surrogate.reset()
+        self.__n_screenings = 0
+        self.__n_candidates = 0
+
+    def getNumberOfCandidates(self, n_ants: int) -> int:
+        """
+        Gets the number of sampled candidates per generation
+        :param: n_ants: number of ants
+        """
+        return self.__oversampling*n_ants
+
+    def getNumberOfEvaluations(self, n_ants: int) -> int:
+        """
+        Gets the number of truly evaluated candidates per (screened) generation
+        :param: n_ants: number of ants
+        """
+        return max(1, math.ceil(self.__fraction*n_ants))
+
+    def select(self, candidates: np.ndarray, n_selected: int) -> np.ndarray:
+        """
+        Selects the candidates with the best predicted costs
+        :param: candidates: candidate positions (n_candidates, n_vars)
+        :param: n_selected: number of selected candidates
+        :return: indices of the selected candidates, best predicted first (n_selected,)
+        """
+        predicted_costs = self.__surrogate.predict(candidates)
+        self.__n_screenings += 1
+        self.__n_candidates += len(candidates)
+        return np.argsort(predicted_costs, kind="stable")[:n_selected]
+
+    def update(self, positions: np.ndarray, costs: np.ndarray):
+        """
+        Retrains the surrogate with truly evaluated solutions (non finite costs are skipped)
+        :param: positions: solution positions (n_solutions, n_vars)
+        :param: costs: solution costs (n_solutions,)
+        """
+        finite = np.isfinite(costs)
+        if np.any(finite):
+            self.__surrogate.update(positions[finite], costs[finite])
+
+    def getState(self) -> Dict[str, np.ndarray]:
+        """
+        Gets the pre-screening state i.e. the surrogate training state and the screening counters (used by the
+        checkpoints, so a resumed run makes the same pre-screening decisions as an uninterrupted one)
+        """
+        return {"surrogate_n_screenings": np.array(self.__n_screenings),
+                "surrogate_n_candidates": np.array(self.__n_candidates),
+                **self.__surrogate.getState()}
+
+    def setState(self, state: Dict[str, np.ndarray]):
+        """
+        Restores the pre-screening state (a checkpoint without it keeps the surrogate retrained from the archive)
+        :param: state: pre-screening state created by 'getState'
+        """
+        if "surrogate_n_screenings" not in state:
+            return
+        self.__n_screenings = int(state["surrogate_n_screenings"])
+        self.__n_candidates = int(state["surrogate_n_candidates"])
+        surrogate_state = self.__surrogate.getState()
+        if surrogate_state and all(key in state for key in surrogate_state):
+            self.__surrogate.setState({key: state[key] for key in surrogate_state})
+
+    @property
+    def surrogate(self):
+        """
+        Getter property of the 'self.__surrogate' attribute
+        """
+        return self.__surrogate
+
+    @property
+    def is_ready(self):
+        """
+        Getter property of the surrogate readiness
+        """
+        return self.__surrogate.is_ready
+
+    @property
+    def oversampling(self):
+        """
+        Getter property of the 'self.__oversampling' attribute
+        """
+        return self.__oversampling
+
+    @property
+    def fraction(self):
+        """
+        Getter property of the 'self.__fraction' attribute
+        """
+        return self.__fraction
+
+    @property
+    def n_screenings(self):
+        """
+        Getter property of the 'self.__n_screenings' attribute i.e. the number of screened generations
+        """
+        return self.__n_screenings
+
+    @property
+    def n_candidates(self):
+        """
+        Getter property of the 'self.__n_candidates' attribute i.e. the number of screened candidates
+        """
+        return self.__n_candidates
@@ -0,0 +1,162 @@
+import itertools
+import concurrent.futures as futures
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+import Constants as c
+import Config as cg
+import RandomStreams as rs
+import Acor as a
+
+
+class HyperparameterSweep(object):
+    """
+    Parallel hyperparameter sweep of the ACO algorithm.
+
+    Searches the 'q', 'zeta', 'n_ants' (and any other 'Config.AcoConfig' field) and 'n_pop' hyperparameters with a
+    grid or a random search. Every trial is an independent ACO algorithm run with its own immutable configuration
+    and the same random seed (so the trials are compared on common random numbers), executed on a process pool.
+
+    The search space maps each hyperparameter name to:
+
+        - a list of values: the grid values (grid search) or the values drawn from (random search)
+        - a (low, high) tuple: a range the random search draws from (uniformly; integer hyperparameters are rounded)
+    """
+    SEARCH_MODES = ("grid", "random")
+    INTEGER_HYPERPARAMETERS = ("n_ants", "n_pop", "max_iterations")
+
+    def __init__(self,
+            n_vars: int,
+            cost_func: object,
+            domain_bounds: Sequence,
+            search_space: Dict[str, object],
+            mode: str = c.SweepConstants.SEARCH_MODE,
+            n_trials: int = c.SweepConstants.N_TRIALS,
+            base_config: Optional[cg.AcoConfig] = None,
+            n_pop: int = c.AcoConstants.N_POP,
+            n_workers: Optional[int] = None,
+            parallel: bool = True,
+            random_seed: int = c.HelperConstants.RANDOM_SEED,
+            **acor_kwargs):
+        """
+        Constructor
+        :param: n_vars: number of variables
+        :param: cost_func: cost function (must be picklable for the parallel sweep)
+        :param: domain_bounds: continuous domain lower/upper bounds
+        :param: search_space: hyperparameter search space (see the class documentation)
+        :param: mode: search mode i.e. 'grid' or 'random'
+        :param: n_trials: number of trials of the random search
+        :param: base_config: configuration of the hyperparameters that are not searched (None snapshots 'AcoConstants')
+        :param: n_pop: population size (archive size) when 'n_pop' is not searched
+        :param: n_workers: number of worker processes (None uses the number of CPUs)
+        :param: parallel: runs the trials on a process pool if True, one after another otherwise
+        :param: random_seed: random seed of the trials (and of the random search draws)
+        :param: acor_kwargs: additional 'AcorContinuousDomain' constructor arguments
+        """
+        if mode not in HyperparameterSweep.SEARCH_MODES:
+            raise ValueError(f"Invalid search mode '{mode}', expected one of {HyperparameterSweep.SEARCH_MODES}")
+        base_config = base_config if base_config is not None else cg.AcoConfig()
+        valid_names = set(base_config.toDict()) | {"n_pop"}
+        invalid_names = set(search_space) - valid_names
+        if invalid_names:
+            raise ValueError(f"Invalid hyperparameters {sorted(invalid_names)}, expected some of {sorted(valid_names)}")
+        self.__n_vars = n_vars
+        self.__cost_func = cost_func
+        self.__domain_bounds = domain_bounds
+        self.__search_space = search_space
+        self.__mode = mode
+        self.__n_trials = n_trials
+        self.__base_config = base_config
+        self.__n_pop = n_pop
+        self.__n_workers = n_workers
+        self.__parallel = parallel
+        self.__random_seed = random_seed
+        self.__acor_kwargs = acor_kwargs
+        self.__results = None
+
+    def createTrials(self) -> List[Dict[str, object]]:
+        """
+        Creates the trial hyperparameters of the search
+        :return: hyperparameters of each trial
+        """
+        names = list(self.__search_space)
+        if self.__mode == "grid":
+            for name in names:
+                if isinstance(self.__search_space[name], tuple):
+                    raise ValueError(f"The grid search requires a list of '{name}' values, not a range")
+            return [dict(zip(names, values)) for values in itertools.product(*[self.__search_space[x] for x in names])]
+        random = rs.createRandomStream(random_seed=self.__random_seed)
+        trials = []
+        for _ in range(self.__n_trials):
+            trial = {}
+            for name in names:
+                domain = self.__search_space[name]
+                if isinstance(domain, tuple):
+                    value = random.uniform(domain[0], domain[1])
+                    value = int(round(value)) if name in HyperparameterSweep.INTEGER_HYPERPARAMETERS else float(value)
+                else:
+                    value = domain[min(int(random.rand() * len(domain)), len(domain) - 1)]
+                trial[name] = value
+            trials.append(trial)
+        return trials
+
+    def run(self) -> List[Dict]:
+        """
+        Runs the sweep
+        :return: trial results sorted by ascending best cost (hyperparameters, best cost, number of evaluations and
+                 run time of each trial)
+        """
+        trials = self.createTrials()
+        arguments = [(trial, self.__n_vars, self.__cost_func, self.__domain_bounds, self.__base_config, self.__n_pop,
+                      self.__random_seed, self.__acor_kwargs) for trial in trials]
+        if self.__parallel and len(trials) > 1:
+            with futures.ProcessPoolExecutor(max_workers=self.__n_workers) as executor:
+                results = list(executor.map(_runTrial, *zip(*arguments)))
+        else:
+            results = [_runTrial(*x) for x in arguments]
+        self.__results = sorted(results, key=lambda x: x["best_cost"])
+        return self.__results
+
+    @property
+    def results(self):
+        """
+        Getter property of the 'self.__results' attribute (sorted by ascending best cost)
+        """
+        return self.__results
+
+    @property
+    def best_result(self):
+        """
+        Getter property of the best trial result
+        """
+        return self.__results[0] if self.__results else None
+
+
+def _runTrial(hyperparameters: Dict[str, object],
+        n_vars: int,
+        cost_func: object,
+        domain_bounds: Sequence,
+        base_config: cg.AcoConfig,
+        n_pop: int,
+        random_seed: int,
+        acor_kwargs: Dict) -> Dict:
+    """
+    Runs a hyperparameter sweep trial
+    :return: trial result
+    """
+    hyperparameters = dict(hyperparameters)
+    n_pop = hyperparameters.pop("n_pop", n_pop)
+    config = base_config.replace(**hyperparameters)
+    acor = a.AcorContinuousDomain(n_pop=n_pop,
+                                  n_vars=n_vars,
+                                  cost_func=cost_func,
+                                  domain_bounds=domain_bounds,
+                                  random_seed=random_seed,
+                                  config=config,
+                                  **acor_kwargs)
+    acor.runGenerations(config.max_iterations)
+    return {"hyperparameters": {"n_pop": n_pop, **hyperparameters},
+            "config": config,
+            "best_cost": float(acor.final_best_solution.cost_function),
+            "n_evaluations": acor.n_evaluations,
+            "run_time": acor.elapsed_time}
@@ -0,0 +1,39 @@
+class GenerationState(object):
+    """
+    Lightweight (read-only) snapshot of the ACO algorithm progress after a generation, yielded by
+    'AcorContinuousDomain.iterate' and passed to the generation callbacks.
+
+    The snapshot only holds scalars (no positions are copied), so it is cheap enough to be created every generation.
+    """
+    __slots__ = ("iteration", "best_cost", "spread", "n_evaluations", "elapsed_time")
+
+    def __init__(self,
+            iteration: int,
+            best_cost: float,
+            spread: float,
+            n_evaluations: int,
+            elapsed_time: float):
+        """
+        Constructor
+        :param: iteration: number of executed generations
+        :param: best_cost: best cost found so far
+        :param: spread: sampling spread i.e. the largest Gaussian kernel standard deviation the ants of the generation
+                were sampled with (computed from the archive before the generation's merge)
+        :param: n_evaluations: number of evaluated solutions
+        :param: elapsed_time: elapsed run time (seconds)
+        """
+        self.iteration = iteration
+        self.best_cost = best_cost
+        self.spread = spread
+        self.n_evaluations = n_evaluations
+        self.elapsed_time = elapsed_time
+
+    def toDict(self) -> dict:
+        """
+        Converts the snapshot to a dictionary (e.g. for JSON logging)
+        """
+        return {name: getattr(self, name) for name in GenerationState.__slots__}
+
+    def __repr__(self) -> str:
+        return (f"GenerationState(iteration={self.iteration}, best_cost={self.best_cost:.6e}, spread={self.spread:.6e}, "
+                f"n_evaluations={self.n_evaluations}, elapsed_time={self.elapsed_time:.3f})")
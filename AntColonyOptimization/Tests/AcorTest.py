@@ -1,9 +1,12 @@
 import unittest as ut 
+from unittest import mock
 import numpy as np
 
 import Population as p 
 import Constants as c
 import Acor as a
+import Sigma as sg
+import Evaluators as e
 
 
 class TestAcorContiniousDomain(ut.TestCase):
@@ -25,7 +28,7 @@ class TestAcorContiniousDomain(ut.TestCase):
         """
         Test 'AcorContiniousDomain' constructor is valid
         """
-        acor = a.AcorContiniousDomain(n_pop=self.__n_pop, 
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
                                        n_vars=self.__n_vars, 
                                        cost_func=self.__cost_func, 
                                        domain_bounds=self.__domain_bounds)
@@ -35,7 +38,7 @@ class TestAcorContiniousDomain(ut.TestCase):
         """
         Test 'AcorContiniousDomain' population initialization is valid
         """
-        acor = a.AcorContiniousDomain(n_pop=self.__n_pop, 
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
                                        n_vars=self.__n_vars, 
                                        cost_func=self.__cost_func, 
                                        domain_bounds=self.__domain_bounds)
@@ -49,7 +52,7 @@ class TestAcorContiniousDomain(ut.TestCase):
         """
         Test 'AcorContiniousDomain' mean creation is valid
         """
-        acor = a.AcorContiniousDomain(n_pop=self.__n_pop, 
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
                                        n_vars=self.__n_vars, 
                                        cost_func=self.__cost_func, 
                                        domain_bounds=self.__domain_bounds)
@@ -62,7 +65,7 @@ class TestAcorContiniousDomain(ut.TestCase):
         """
         Test 'AcorContiniousDomain' sigma creation is valid
         """
-        acor = a.AcorContiniousDomain(n_pop=self.__n_pop, 
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
                                        n_vars=self.__n_vars, 
                                        cost_func=self.__cost_func, 
                                        domain_bounds=self.__domain_bounds)
@@ -77,7 +80,7 @@ class TestAcorContiniousDomain(ut.TestCase):
         """
         Test 'AcorContiniousDomain' Roulette Wheel selection is valid
         """
-        acor = a.AcorContiniousDomain(n_pop=self.__n_pop, 
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
                                        n_vars=self.__n_vars, 
                                        cost_func=self.__cost_func, 
                                        domain_bounds=self.__domain_bounds)
@@ -90,7 +93,7 @@ class TestAcorContiniousDomain(ut.TestCase):
         """
         Test 'AcorContiniousDomain' construction of a new ACO population is valid
         """
-        acor = a.AcorContiniousDomain(n_pop=self.__n_pop, 
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
                                        n_vars=self.__n_vars, 
                                        cost_func=self.__cost_func, 
                                        domain_bounds=self.__domain_bounds)
@@ -103,7 +106,7 @@ class TestAcorContiniousDomain(ut.TestCase):
         """
         Test 'AcorContiniousDomain' invocation of the ACO population main loop is valid
         """
-        acor = a.AcorContiniousDomain(n_pop=self.__n_pop, 
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
                                        n_vars=self.__n_vars, 
                                        cost_func=self.__cost_func, 
                                        domain_bounds=self.__domain_bounds)
@@ -111,6 +114,132 @@ class TestAcorContiniousDomain(ut.TestCase):
         self.assertIsNotNone(acor, self.__test_msg)
         self.assertIsNotNone(acor.final_best_solution, self.__test_msg)
         self.assertIsNotNone(acor.best_solutions, self.__test_msg)
+
+    def test_AcorContiniousDomain_Legacy_Sampling_Mode_RunMainLoop_Is_Valid(self):
+        """
+        Test 'AcorContiniousDomain' main loop is valid in the legacy (per-draw) sampling mode
+        """
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
+                                       n_vars=self.__n_vars, 
+                                       cost_func=self.__cost_func, 
+                                       domain_bounds=self.__domain_bounds,
+                                       sampling_mode="legacy")
+        acor.runMainLoop()
+        self.assertEqual("legacy", acor.sampling_mode, self.__test_msg)
+        self.assertIsNotNone(acor.final_best_solution, self.__test_msg)
+        self.assertEqual((self.__n_vars, 1), acor.final_best_solution.position.shape, self.__test_msg)
+        
+    def test_AcorContiniousDomain_Legacy_Sampling_Mode_Implies_Legacy_Seeding(self):
+        """
+        Test the legacy sampling mode uses the original ('legacy' RandomState) seeding unless a bit generator is given
+        """
+        results = []
+        for bit_generator in [None, "legacy", "pcg64"]:
+            acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                           n_vars=self.__n_vars,
+                                           cost_func=self.__cost_func,
+                                           domain_bounds=self.__domain_bounds,
+                                           sampling_mode="legacy",
+                                           bit_generator=bit_generator)
+            acor.runMainLoop()
+            results.append(acor.final_best_solution.cost_function)
+        self.assertEqual(results[0], results[1], self.__test_msg)
+        self.assertNotEqual(results[0], results[2], self.__test_msg)
+
+    def test_AcorContiniousDomain_Thread_Evaluator_Matches_Serial(self):
+        """
+        Test 'AcorContiniousDomain' main loop gives the same result with the serial and thread pool evaluators
+        """
+        results = []
+        for evaluator in ["serial", "thread"]:
+            acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
+                                           n_vars=self.__n_vars, 
+                                           cost_func=self.__cost_func, 
+                                           domain_bounds=self.__domain_bounds,
+                                           evaluator=evaluator)
+            acor.runMainLoop()
+            self.assertEqual(evaluator, acor.evaluator.backend, self.__test_msg)
+            results.append(acor.final_best_solution)
+        self.assertEqual(results[0].cost_function, results[1].cost_function, self.__test_msg)
+        np.testing.assert_array_equal(results[0].position, results[1].position, self.__test_msg)
+
+    def test_AcorContiniousDomain_Incremental_Sigmas_Are_Valid(self):
+        """
+        Test 'AcorContiniousDomain' incremental sigmas match a full recomputation of the final archive
+        """
+        acor = a.AcorContinuousDomain(n_pop=50, 
+                                       n_vars=self.__n_vars, 
+                                       cost_func=self.__cost_func, 
+                                       domain_bounds=self.__domain_bounds,
+                                       sigma_method="incremental")
+        acor.runMainLoop()
+        acor.createStandardDeviation()
+        expected = sg.SigmaEngine(c.AcoConstants.ZETA, method="broadcast").compute(acor.means)
+        np.testing.assert_allclose(expected, acor.sigmas, rtol=1e-9, atol=1e-12, err_msg=self.__test_msg)
+        self.assertGreater(acor.sigma_engine.n_incremental_updates, 0, self.__test_msg)
+
+    def test_AcorContiniousDomain_Float32_Mode_Is_Valid(self):
+        """
+        Test 'AcorContiniousDomain' runs the archive and the sampling in float32 and keeps float64 costs
+        """
+        for sampling_mode in ("vectorized", "legacy"):
+            acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
+                                           n_vars=self.__n_vars, 
+                                           cost_func=self.__cost_func, 
+                                           domain_bounds=self.__domain_bounds,
+                                           sampling_mode=sampling_mode,
+                                           dtype="float32")
+            acor.runMainLoop()
+            self.assertEqual((np.float32, np.float32), (acor.means.dtype, acor.sigmas.dtype), self.__test_msg)
+            self.assertEqual(np.float32, acor.new_pops[0].position.dtype, self.__test_msg)
+            self.assertEqual(np.float64, acor.archive.costs.dtype, self.__test_msg)
+            self.assertEqual(np.float64, acor.final_best_solution.position.dtype, self.__test_msg)
+            self.assertTrue(np.all(acor.means >= np.float32(self.__domain_bounds[0])), self.__test_msg)
+            self.assertTrue(np.all(acor.means <= np.float32(self.__domain_bounds[1])), self.__test_msg)
+            self.assertAlmostEqual(0.5, acor.final_best_solution.cost_function, places=2, msg=self.__test_msg)
+        with self.assertRaises(ValueError):
+            a.AcorContinuousDomain(n_pop=self.__n_pop, n_vars=self.__n_vars, cost_func=self.__cost_func,
+                                   domain_bounds=self.__domain_bounds, dtype="float16")
+
+    def test_AcorContiniousDomain_Sample_Buffers_Are_Allocated_Once(self):
+        """
+        Test 'AcorContiniousDomain' allocates the sample buffers on the first generation only and samples in place
+        into the archive
+        """
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop, 
+                                       n_vars=self.__n_vars, 
+                                       cost_func=self.__cost_func, 
+                                       domain_bounds=self.__domain_bounds)
+        acor.runGenerations(1)
+        n_allocations = acor.sampler.buffers.n_allocations
+        sample_positions = acor.new_pops[0].position
+        acor.runGenerations(5)
+        self.assertEqual(n_allocations, acor.sampler.buffers.n_allocations, self.__test_msg)
+        self.assertTrue(np.shares_memory(sample_positions, acor.new_pops[0].position), self.__test_msg)
+
+    def test_AcorContiniousDomain_runGenerations_Closes_The_Owned_Evaluator(self):
+        """
+        Test 'runGenerations' keeps an evaluator created from a backend name open between the calls and closes it
+        once the run is finished, whilst an injected evaluator is left open
+        """
+        expected = a.AcorContinuousDomain(n_pop=self.__n_pop, n_vars=self.__n_vars, cost_func=self.__cost_func,
+                                          domain_bounds=self.__domain_bounds)
+        expected.runGenerations(10)
+        with mock.patch.object(e.Evaluator, "close", autospec=True, side_effect=e.Evaluator.close) as close:
+            acor = a.AcorContinuousDomain(n_pop=self.__n_pop, n_vars=self.__n_vars, cost_func=self.__cost_func,
+                                          domain_bounds=self.__domain_bounds, evaluator="thread")
+            self.assertEqual(0, acor.runGenerations(0), self.__test_msg)
+            self.assertEqual(5, acor.runGenerations(5), self.__test_msg)
+            self.assertEqual(0, close.call_count, self.__test_msg)
+            self.assertEqual(5, acor.runGenerations(20), self.__test_msg)
+            self.assertEqual(1, close.call_count, self.__test_msg)
+            with e.Evaluator(self.__cost_func, backend="thread") as evaluator:
+                injected = a.AcorContinuousDomain(n_pop=self.__n_pop, n_vars=self.__n_vars, cost_func=self.__cost_func,
+                                                  domain_bounds=self.__domain_bounds, evaluator=evaluator)
+                injected.runGenerations(10)
+                self.assertEqual(1, close.call_count, self.__test_msg)
+        self.assertEqual(expected.final_best_solution.cost_function, acor.final_best_solution.cost_function,
+                         self.__test_msg)
         
 
 if __name__ == "__main__":
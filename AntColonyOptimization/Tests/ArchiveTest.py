@@ -0,0 +1,89 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import Population as p
+import Archive as ar
+
+
+class TestSolutionArchive(ut.TestCase):
+    """
+    test suit for the SolutionArchive class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_pop = c.AcoConstants.N_POP
+        self.__n_ants = c.AcoConstants.N_ANTS
+        self.__n_vars = c.ProblemConstants.COST_FUNC_MAP["case_1"]["n_dims"]
+        self.__random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__test_msg = "Invalid test!!"
+
+    def test_SolutionArchive_Initialize_Is_Sorted(self):
+        """
+        Test 'SolutionArchive' initialization sorts the archive by cost
+        """
+        archive = ar.SolutionArchive(self.__n_pop, self.__n_ants, self.__n_vars)
+        positions = self.__random.rand(self.__n_pop, self.__n_vars)
+        costs = self.__random.rand(self.__n_pop)
+        archive.initialize(positions, costs)
+        order = np.argsort(costs)
+        np.testing.assert_array_equal(costs[order], archive.costs, self.__test_msg)
+        np.testing.assert_array_equal(positions[order], archive.means, self.__test_msg)
+        self.assertEqual(self.__n_pop, len(archive.populations), self.__test_msg)
+
+    def test_SolutionArchive_Merge_Matches_Sorted_Population_List(self):
+        """
+        Test 'SolutionArchive' merge matches the stable sort of the merged Population list (including ties)
+        """
+        archive = ar.SolutionArchive(self.__n_pop, self.__n_ants, self.__n_vars)
+        positions = self.__random.rand(self.__n_pop, self.__n_vars)
+        costs = np.round(self.__random.rand(self.__n_pop), 1)
+        archive.initialize(positions, costs)
+        pops = sorted(archive.populations, key=lambda x: x.cost_function)
+        pops = [p.Population(position=x.position.copy(), cost_function=x.cost_function) for x in pops]
+        sample_positions = self.__random.rand(self.__n_ants, self.__n_vars)
+        sample_costs = np.round(self.__random.rand(self.__n_ants), 1)
+        archive.sample_positions[:] = sample_positions
+        archive.sample_costs[:] = sample_costs
+        new_pops = [p.Population(position=np.reshape(x, (-1, 1)), cost_function=y) for x, y in zip(sample_positions, sample_costs)]
+        expected = sorted(pops + new_pops, key=lambda x: x.cost_function)[:self.__n_pop]
+        archive.merge()
+        np.testing.assert_array_equal([x.cost_function for x in expected], archive.costs, self.__test_msg)
+        np.testing.assert_array_equal(np.hstack([x.position for x in expected]).T, archive.means, self.__test_msg)
+
+    def test_SolutionArchive_Means_Is_Zero_Copy_View(self):
+        """
+        Test 'SolutionArchive' means is a stable zero-copy view of the archive positions
+        """
+        archive = ar.SolutionArchive(self.__n_pop, self.__n_ants, self.__n_vars)
+        archive.initialize(self.__random.rand(self.__n_pop, self.__n_vars), self.__random.rand(self.__n_pop))
+        means = archive.means
+        archive.sample_positions[:] = self.__random.rand(self.__n_ants, self.__n_vars)
+        archive.sample_costs[:] = self.__random.rand(self.__n_ants)
+        archive.merge()
+        self.assertTrue(np.shares_memory(means, archive.means), self.__test_msg)
+        np.testing.assert_array_equal(means, archive.means, self.__test_msg)
+        best = archive.best_population
+        self.assertFalse(np.shares_memory(best.position, archive.means), self.__test_msg)
+
+    def test_SolutionArchive_Float32_Archive_Keeps_Float64_Costs(self):
+        """
+        Test a 'float32' archive keeps its costs and best solution in the costs precision
+        """
+        archive = ar.SolutionArchive(self.__n_pop, self.__n_ants, self.__n_vars, dtype="float32", cost_dtype="float64")
+        positions = self.__random.rand(self.__n_pop, self.__n_vars)
+        costs = self.__random.rand(self.__n_pop)
+        archive.initialize(positions, costs)
+        self.assertEqual(np.float32, archive.means.dtype, self.__test_msg)
+        self.assertEqual(np.float32, archive.sample_positions.dtype, self.__test_msg)
+        self.assertEqual(np.float64, archive.costs.dtype, self.__test_msg)
+        best = archive.best_population
+        self.assertEqual(np.float64, best.position.dtype, self.__test_msg)
+        self.assertEqual(np.min(costs), best.cost_function, self.__test_msg)
+        np.testing.assert_allclose(positions[np.argmin(costs)], np.reshape(best.position, (-1)), rtol=1e-7, err_msg=self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,124 @@
+import unittest as ut
+import asyncio
+from unittest import mock
+import numpy as np
+
+import Constants as c
+import CostFunctions as cf
+import Evaluators as e
+import EvaluationCache as ec
+import Acor as a
+
+
+class TestAsyncAcorContinuousDomain(ut.TestCase):
+    """
+    test suit for the asyncio ACO driver
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_vars = c.ProblemConstants.COST_FUNC_MAP["case_2"]["n_dims"]
+        self.__domain_bounds = c.ProblemConstants.COST_FUNC_MAP["case_2"]["bounds"]
+        self.__n_pop = c.AcoConstants.N_POP
+        c.AcoConstants.MAX_ITERATIONS = 5
+        self.__in_flight = 0
+        self.__max_in_flight = 0
+        self.__test_msg = "Invalid test!!"
+
+    async def __sleepySphere(self, x):
+        """
+        Sleep based stand-in for an I/O bound (e.g. model server scored) objective
+        """
+        self.__in_flight += 1
+        self.__max_in_flight = max(self.__max_in_flight, self.__in_flight)
+        await asyncio.sleep(0.001)
+        self.__in_flight -= 1
+        return cf.sphere(x)
+
+    def test_AsyncEvaluator_Concurrency_Limit_Is_Respected(self):
+        """
+        Test 'AsyncEvaluator' evaluates concurrently, in order and within the concurrency limit
+        """
+        positions = np.random.RandomState(c.HelperConstants.RANDOM_SEED).uniform(-5.12, 5.12, (40, self.__n_vars))
+        evaluator = e.AsyncEvaluator(self.__sleepySphere, max_concurrency=8)
+        costs = asyncio.run(evaluator.evaluate(positions))
+        self.assertTrue(evaluator.is_async, self.__test_msg)
+        self.assertEqual(8, self.__max_in_flight, self.__test_msg)
+        np.testing.assert_array_equal(cf.sphere.batch(positions), costs, self.__test_msg)
+
+    def test_AcorContinuousDomain_Run_Matches_RunMainLoop(self):
+        """
+        Test 'AcorContinuousDomain.run' with an async objective matches 'runMainLoop' with the sync objective
+        """
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                       n_vars=self.__n_vars,
+                                       cost_func=cf.sphere,
+                                       domain_bounds=self.__domain_bounds)
+        acor.runMainLoop()
+        async_acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                             n_vars=self.__n_vars,
+                                             cost_func=self.__sleepySphere,
+                                             domain_bounds=self.__domain_bounds,
+                                             max_concurrency=4)
+        asyncio.run(async_acor.run())
+        self.assertLessEqual(self.__max_in_flight, 4, self.__test_msg)
+        self.assertAlmostEqual(acor.final_best_solution.cost_function, async_acor.final_best_solution.cost_function, msg=self.__test_msg)
+        np.testing.assert_allclose(acor.final_best_solution.position, async_acor.final_best_solution.position, err_msg=self.__test_msg)
+
+    def test_AcorContinuousDomain_Run_With_Cache_Is_Valid(self):
+        """
+        Test 'AcorContinuousDomain.run' with an async objective behind the evaluation cache matches the uncached run
+        """
+        results = []
+        for cache_size in (None, 1000):
+            async_acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                                 n_vars=self.__n_vars,
+                                                 cost_func=self.__sleepySphere,
+                                                 domain_bounds=self.__domain_bounds,
+                                                 cache_size=cache_size)
+            asyncio.run(async_acor.run())
+            results.append(async_acor.final_best_solution.cost_function)
+        self.assertEqual(results[0], results[1], self.__test_msg)
+        self.assertEqual(self.__n_pop + 5*c.AcoConstants.N_ANTS,
+                         async_acor.cache.hits + async_acor.cache.misses, self.__test_msg)
+
+    def test_AcorContinuousDomain_Run_With_Surrogate_Matches_RunMainLoop(self):
+        """
+        Test 'AcorContinuousDomain.run' shares the generation steps (screening, surrogate update, archive merge and
+        callbacks) of 'runMainLoop' and closes the evaluator it owns
+        """
+        c.AcoConstants.MAX_ITERATIONS = 30
+        states = []
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                       n_vars=self.__n_vars,
+                                       cost_func=cf.sphere,
+                                       domain_bounds=self.__domain_bounds,
+                                       surrogate="quadratic")
+        acor.runMainLoop()
+        with mock.patch.object(e.Evaluator, "close") as close:
+            async_acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                                 n_vars=self.__n_vars,
+                                                 cost_func=self.__sleepySphere,
+                                                 domain_bounds=self.__domain_bounds,
+                                                 surrogate="quadratic",
+                                                 evaluator="thread",
+                                                 callbacks=[states.append])
+            asyncio.run(async_acor.run())
+            self.assertEqual(1, close.call_count, self.__test_msg)
+        self.assertGreater(async_acor.surrogate_screen.n_screenings, 0, self.__test_msg)
+        self.assertEqual(acor.n_evaluations, async_acor.n_evaluations, self.__test_msg)
+        self.assertEqual(list(range(1, 31)), [x.iteration for x in states], self.__test_msg)
+        np.testing.assert_allclose(acor.history.costs, async_acor.history.costs, err_msg=self.__test_msg)
+
+    def test_CachedCostFunction_Async_Cost_Function_Is_Rejected(self):
+        """
+        Test the synchronous evaluation of an async objective by the evaluation cache raises a clear error
+        """
+        cache = ec.CachedCostFunction(self.__sleepySphere, max_size=10)
+        with self.assertRaises(TypeError):
+            cache.batch(np.zeros((2, self.__n_vars)))
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,94 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import Sigma as sg
+import BatchSolver as bs
+import Acor as a
+
+
+class TestBatchAcorContinuousDomain(ut.TestCase):
+    """
+    test suit for the BatchAcorContinuousDomain class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_4"]
+        self.__n_vars = problem["n_dims"]
+        self.__cost_func = problem["func"]
+        self.__domain_bounds = problem["bounds"]
+        self.__n_pop = c.AcoConstants.N_POP
+        c.AcoConstants.MAX_ITERATIONS = 30
+        self.__test_msg = "Invalid test!!"
+
+    def test_Single_Instance_Matches_AcorContinuousDomain(self):
+        """
+        Test a single instance batch reproduces the (vectorized sampling) ACO algorithm run with the same seed
+        """
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                       n_vars=self.__n_vars,
+                                       cost_func=self.__cost_func,
+                                       domain_bounds=self.__domain_bounds)
+        acor.runMainLoop()
+        batch = bs.BatchAcorContinuousDomain(n_instances=1,
+                                             n_pop=self.__n_pop,
+                                             n_vars=self.__n_vars,
+                                             cost_func=self.__cost_func,
+                                             domain_bounds=self.__domain_bounds)
+        solutions = batch.runMainLoop()
+        self.assertEqual(acor.final_best_solution.cost_function, solutions[0].cost_function, self.__test_msg)
+        np.testing.assert_array_equal(acor.history.costs, batch.history[:, 0], self.__test_msg)
+
+    def test_Batch_Run_Is_Valid(self):
+        """
+        Test a batch run returns one result per instance and respects the per instance bounds
+        """
+        n_instances = 6
+        bounds = [[-1.0 - i, 1.0 + i] for i in range(n_instances)]
+        batch = bs.BatchAcorContinuousDomain(n_instances=n_instances,
+                                             n_pop=self.__n_pop,
+                                             n_vars=self.__n_vars,
+                                             cost_func=self.__cost_func,
+                                             domain_bounds=bounds)
+        solutions = batch.runMainLoop()
+        self.assertEqual(n_instances, len(solutions), self.__test_msg)
+        self.assertEqual((30, n_instances), batch.history.shape, self.__test_msg)
+        self.assertTrue(np.all(np.diff(batch.history, axis=0) <= 0.0), self.__test_msg)
+        self.assertEqual(n_instances*(self.__n_pop + 30*c.AcoConstants.N_ANTS), batch.n_evaluations, self.__test_msg)
+        for i, solution in enumerate(solutions):
+            self.assertEqual(self.__cost_func(solution.position), solution.cost_function, self.__test_msg)
+            self.assertTrue(np.all(np.abs(batch.means[i]) <= 1.0 + i), self.__test_msg)
+
+    def test_Instance_Aware_Cost_Function_Is_Valid(self):
+        """
+        Test an instance-aware cost function (a shifted sphere per instance) is solved per instance
+        """
+        c.AcoConstants.MAX_ITERATIONS = 200
+        shifts = np.linspace(-2.0, 2.0, 5).reshape(-1, 1, 1)
+        def shiftedSphere(x):
+            return np.sum(np.square(x - shifts), axis=2)
+        batch = bs.BatchAcorContinuousDomain(n_instances=5,
+                                             n_pop=self.__n_pop,
+                                             n_vars=3,
+                                             cost_func=shiftedSphere,
+                                             domain_bounds=[-5.0, 5.0],
+                                             instance_aware=True)
+        batch.runMainLoop()
+        np.testing.assert_allclose(np.broadcast_to(shifts[:, :, 0], (5, 3)), batch.best_positions, atol=1e-2,
+                                   err_msg=self.__test_msg)
+
+    def test_Batched_Sigmas_Are_Valid(self):
+        """
+        Test the sigma engine methods support a leading batch axis
+        """
+        means = np.random.RandomState(c.HelperConstants.RANDOM_SEED).rand(4, 12, 3)
+        for method in sg.SigmaEngine.SIGMA_METHODS:
+            engine = sg.SigmaEngine(c.AcoConstants.ZETA, method)
+            expected = np.array([engine.compute(x) for x in means])
+            np.testing.assert_allclose(expected, engine.compute(means), rtol=1e-12, err_msg=f"{self.__test_msg} {method}")
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,95 @@
+import unittest as ut
+import os
+import copy
+import tempfile
+
+import Constants as c
+import Benchmark as b
+
+
+class TestBenchmarkSuite(ut.TestCase):
+    """
+    test suit for the BenchmarkSuite class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__suite = b.BenchmarkSuite(cases=["case_1", "case_2"],
+                                        n_vars_grid=(2, 5),
+                                        n_pop_grid=(10,),
+                                        n_ants_grid=(20,),
+                                        n_generations=10,
+                                        n_repeats=1)
+        self.__test_msg = "Invalid test!!"
+
+    def test_BenchmarkSuite_Run_Is_Valid(self):
+        """
+        Test 'BenchmarkSuite.run' benchmarks the whole grid without changing the ACO constants
+        """
+        max_iterations, n_ants = c.AcoConstants.MAX_ITERATIONS, c.AcoConstants.N_ANTS
+        results = self.__suite.run()
+        self.assertEqual(4, len(results), self.__test_msg)
+        self.assertEqual((max_iterations, n_ants), (c.AcoConstants.MAX_ITERATIONS, c.AcoConstants.N_ANTS), self.__test_msg)
+        for result in results:
+            self.assertEqual(10, result["n_generations"], self.__test_msg)
+            self.assertAlmostEqual(result["generations_per_second"]*20, result["evaluations_per_second"], msg=self.__test_msg)
+            self.assertGreater(result["peak_memory"], 0, self.__test_msg)
+
+    def test_BenchmarkSuite_Is_Reproducible(self):
+        """
+        Test the (seeded) final costs are reproducible
+        """
+        costs = [x["final_cost"] for x in self.__suite.run()]
+        self.assertEqual(costs, [x["final_cost"] for x in self.__suite.run()], self.__test_msg)
+
+    def test_BenchmarkSuite_Compare_Flags_Regressions(self):
+        """
+        Test the baseline save/load round trip and the regression flags
+        """
+        results = self.__suite.run()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "baseline.json")
+            b.BenchmarkSuite.saveBaseline(path, results)
+            baseline = b.BenchmarkSuite.loadBaseline(path)
+        self.assertEqual([], b.BenchmarkSuite.compare(results, baseline), self.__test_msg)
+        regressed = copy.deepcopy(results)
+        regressed[0]["generations_per_second"] /= 2.0
+        regressed[1]["final_cost"] += 1.0
+        regressed[2]["peak_memory"] *= 2
+        regressions = b.BenchmarkSuite.compare(regressed, baseline)
+        self.assertEqual([(0, "generations_per_second"), (1, "final_cost"), (2, "peak_memory")],
+                         [([b.BenchmarkSuite.createKey(x) for x in results].index(x["benchmark"]), x["metric"]) for x in regressions],
+                         self.__test_msg)
+
+    def test_BenchmarkSuite_Dtype_Grid_Is_Valid(self):
+        """
+        Test the floating point type grid benchmarks and keys
+        """
+        suite = b.BenchmarkSuite(cases=["case_2"], n_vars_grid=(50,), n_pop_grid=(10,), n_ants_grid=(20,),
+                                 n_generations=5, n_repeats=1, dtype_grid=("float64", "float32"))
+        results = suite.run()
+        self.assertEqual(["float64", "float32"], [x["dtype"] for x in results], self.__test_msg)
+        self.assertEqual("case_2/n_vars=50/n_pop=10/n_ants=20", b.BenchmarkSuite.createKey(results[0]), self.__test_msg)
+        self.assertEqual("case_2/n_vars=50/n_pop=10/n_ants=20/dtype=float32", b.BenchmarkSuite.createKey(results[1]),
+                         self.__test_msg)
+        self.assertLess(results[1]["peak_memory"], results[0]["peak_memory"], self.__test_msg)
+
+    def test_SurrogateReport_Is_Valid(self):
+        """
+        Test the surrogate report lists the true evaluations of every problem and quality level
+        """
+        report = b.SurrogateReport("quadratic", cases=["case_1", "case_2"], quality_levels=(0.5, 0.9), n_generations=10)
+        results = report.run()
+        self.assertEqual(4, len(results), self.__test_msg)
+        for result in results:
+            self.assertIsNotNone(result["baseline_evaluations"], self.__test_msg)
+            if result["surrogate_evaluations"] is not None:
+                self.assertAlmostEqual(1.0 - result["surrogate_evaluations"]/result["baseline_evaluations"],
+                                       result["evaluation_reduction"], msg=self.__test_msg)
+        with self.assertRaises(ValueError):
+            b.SurrogateReport("kriging")
+
+
+if __name__ == "__main__":
+    ut.main()
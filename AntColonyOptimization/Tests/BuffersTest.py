@@ -0,0 +1,43 @@
+import unittest as ut
+import numpy as np
+
+import Buffers as bf
+
+
+class TestBufferPool(ut.TestCase):
+    """
+    test suit for the BufferPool class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__test_msg = "Invalid test!!"
+
+    def test_BufferPool_Buffers_Are_Reused(self):
+        """
+        Test 'BufferPool' hands out the same buffer for the same name, shape and data type
+        """
+        buffers = bf.BufferPool()
+        noise = buffers.get("noise", (4, 3))
+        self.assertIs(noise, buffers.get("noise", (4, 3)), self.__test_msg)
+        self.assertIsNot(noise, buffers.get("spreads", (4, 3)), self.__test_msg)
+        self.assertEqual(2, buffers.n_allocations, self.__test_msg)
+        self.assertEqual(2 * noise.nbytes, buffers.n_bytes, self.__test_msg)
+
+    def test_BufferPool_Buffers_Are_Reallocated_On_Shape_Or_Type_Change(self):
+        """
+        Test 'BufferPool' reallocates a buffer whose shape or data type changes
+        """
+        buffers = bf.BufferPool()
+        buffers.get("indices", (4, 3), np.intp)
+        self.assertEqual((5, 3), buffers.get("indices", (5, 3), np.intp).shape, self.__test_msg)
+        self.assertEqual(np.float64, buffers.get("indices", (5, 3)).dtype, self.__test_msg)
+        self.assertEqual(3, buffers.n_allocations, self.__test_msg)
+        self.assertEqual({"indices": (5, 3)}, buffers.shapes, self.__test_msg)
+        buffers.clear()
+        self.assertEqual(0, buffers.n_bytes, self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,157 @@
+import unittest as ut
+import os
+import tempfile
+from time import sleep
+import numpy as np
+
+import Constants as c
+import Checkpoint as cp
+import Acor as a
+
+
+class TestCheckpoint(ut.TestCase):
+    """
+    test suit for the ACO algorithm checkpoint/resume
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_3"]
+        self.__n_vars = problem["n_dims"]
+        self.__cost_func = problem["func"]
+        self.__domain_bounds = problem["bounds"]
+        self.__n_pop = c.AcoConstants.N_POP
+        c.AcoConstants.MAX_ITERATIONS = 30
+        self.__temp_dir = tempfile.TemporaryDirectory()
+        self.__checkpoint_path = os.path.join(self.__temp_dir.name, "acor.npz")
+        self.__test_msg = "Invalid test!!"
+
+    def tearDown(self) -> None:
+        """
+        Test tear down fixture
+        """
+        self.__temp_dir.cleanup()
+
+    def __createAcor(self, **kwargs):
+        """
+        Creates the ACO algorithm
+        """
+        return a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                       n_vars=self.__n_vars,
+                                       cost_func=self.__cost_func,
+                                       domain_bounds=self.__domain_bounds,
+                                       **kwargs)
+
+    def test_Checkpoint_Random_State_Round_Trip_Is_Valid(self):
+        """
+        Test the random number generator states survive the checkpoint encoding
+        """
+        for random in [np.random.RandomState(1), np.random.Generator(np.random.PCG64(1))]:
+            random.random_sample(5) if isinstance(random, np.random.RandomState) else random.random(5)
+            encoded_state = cp.Checkpoint.encodeRandomState(random)
+            expected = random.standard_normal(10)
+            cp.Checkpoint.restoreRandomState(random, encoded_state)
+            np.testing.assert_array_equal(expected, random.standard_normal(10), self.__test_msg)
+
+    def test_Checkpoint_Save_Is_Atomic(self):
+        """
+        Test the checkpoint save leaves no temporary files behind
+        """
+        cp.Checkpoint.save(self.__checkpoint_path, {"x": np.arange(3)})
+        cp.Checkpoint.save(self.__checkpoint_path, {"x": np.arange(4)})
+        self.assertEqual(["acor.npz"], os.listdir(self.__temp_dir.name), self.__test_msg)
+        np.testing.assert_array_equal(np.arange(4), cp.Checkpoint.load(self.__checkpoint_path)["x"], self.__test_msg)
+
+    def test_AcorContinuousDomain_Resume_Is_Bit_For_Bit(self):
+        """
+        Test a run resumed from a checkpoint matches (bit-for-bit) an uninterrupted run
+        """
+        expected = self.__createAcor()
+        expected.runMainLoop()
+        interrupted = self.__createAcor(checkpoint_path=self.__checkpoint_path, checkpoint_interval=10)
+        interrupted.runGenerations(25)
+        resumed = self.__createAcor()
+        resumed.resumeMainLoop(self.__checkpoint_path)
+        self.assertEqual(expected.iteration, resumed.iteration, self.__test_msg)
+        self.assertEqual(expected.n_evaluations, resumed.n_evaluations, self.__test_msg)
+        self.assertEqual("max_iterations", resumed.stop_reason, self.__test_msg)
+        np.testing.assert_array_equal(expected.archive.means, resumed.archive.means, self.__test_msg)
+        np.testing.assert_array_equal([x.cost_function for x in expected.best_solutions],
+                                      [x.cost_function for x in resumed.best_solutions], self.__test_msg)
+        np.testing.assert_array_equal(expected.final_best_solution.position, resumed.final_best_solution.position, self.__test_msg)
+
+    def test_AcorContinuousDomain_Incremental_Sigma_Resume_Is_Bit_For_Bit(self):
+        """
+        Test a run of the 'incremental' sigma method resumed from a checkpoint matches (bit-for-bit) an uninterrupted
+        run i.e. the checkpoint restores the (drifted) running sums of absolute deviations
+        """
+        expected = self.__createAcor(sigma_method="incremental")
+        expected.runMainLoop()
+        interrupted = self.__createAcor(sigma_method="incremental", checkpoint_path=self.__checkpoint_path, checkpoint_interval=10)
+        interrupted.runGenerations(25)
+        resumed = self.__createAcor(sigma_method="incremental")
+        resumed.resumeMainLoop(self.__checkpoint_path)
+        self.assertGreater(resumed.sigma_engine.n_incremental_updates, 0, self.__test_msg)
+        np.testing.assert_array_equal(expected.archive.means, resumed.archive.means, self.__test_msg)
+        np.testing.assert_array_equal([x.cost_function for x in expected.best_solutions],
+                                      [x.cost_function for x in resumed.best_solutions], self.__test_msg)
+
+    def test_AcorContinuousDomain_Surrogate_Resume_Is_Bit_For_Bit(self):
+        """
+        Test a surrogate pre-screened run resumed from a checkpoint matches (bit-for-bit) an uninterrupted run i.e.
+        the checkpoint restores the surrogate training state
+        """
+        for surrogate in ("quadratic", "rbf"):
+            expected = self.__createAcor(surrogate=surrogate)
+            expected.runMainLoop()
+            interrupted = self.__createAcor(surrogate=surrogate, checkpoint_path=self.__checkpoint_path, checkpoint_interval=10)
+            interrupted.runGenerations(25)
+            resumed = self.__createAcor(surrogate=surrogate)
+            resumed.resumeMainLoop(self.__checkpoint_path)
+            self.assertEqual(expected.n_evaluations, resumed.n_evaluations, f"{self.__test_msg} {surrogate}")
+            self.assertGreater(resumed.surrogate_screen.n_screenings, 0, self.__test_msg)
+            self.assertEqual(expected.surrogate_screen.n_screenings, resumed.surrogate_screen.n_screenings, self.__test_msg)
+            np.testing.assert_array_equal(expected.archive.means, resumed.archive.means, f"{self.__test_msg} {surrogate}")
+            np.testing.assert_array_equal([x.cost_function for x in expected.best_solutions],
+                                          [x.cost_function for x in resumed.best_solutions], self.__test_msg)
+
+    def test_AcorContinuousDomain_Elapsed_Time_Stops_With_The_Run(self):
+        """
+        Test the elapsed time stops counting when the run is finalized (so the checkpoints and the results do not
+        include the time spent after the run) and excludes the pauses between the resumed runs
+        """
+        acor = self.__createAcor()
+        acor.runGenerations(10)
+        paused_time = acor.elapsed_time
+        sleep(0.2)
+        self.assertEqual(paused_time, acor.elapsed_time, self.__test_msg)
+        acor.runGenerations(20)
+        self.assertLess(acor.elapsed_time, paused_time + 0.2, self.__test_msg)
+        self.assertEqual("max_iterations", acor.stop_reason, self.__test_msg)
+        elapsed_time = acor.elapsed_time
+        sleep(0.2)
+        acor.saveCheckpoint(self.__checkpoint_path)
+        self.assertEqual(elapsed_time, acor.elapsed_time, self.__test_msg)
+        self.assertEqual(elapsed_time, acor.generation_state.elapsed_time, self.__test_msg)
+        resumed = self.__createAcor()
+        resumed.loadCheckpoint(self.__checkpoint_path)
+        sleep(0.2)
+        self.assertAlmostEqual(elapsed_time, resumed.elapsed_time, places=9, msg=self.__test_msg)
+
+    def test_AcorContinuousDomain_Resume_Mismatch_Is_Rejected(self):
+        """
+        Test resuming a checkpoint of a differently sized problem is rejected
+        """
+        acor = self.__createAcor(checkpoint_path=self.__checkpoint_path, checkpoint_interval=5)
+        acor.runGenerations(5)
+        other = a.AcorContinuousDomain(n_pop=self.__n_pop + 1,
+                                        n_vars=self.__n_vars,
+                                        cost_func=self.__cost_func,
+                                        domain_bounds=self.__domain_bounds)
+        with self.assertRaises(ValueError, msg=self.__test_msg):
+            other.resumeMainLoop(self.__checkpoint_path)
+
+
+if __name__ == "__main__":
+    ut.main()
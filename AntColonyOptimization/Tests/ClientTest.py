@@ -0,0 +1,81 @@
+import unittest as ut
+import os
+import sys
+import json
+import tempfile
+import subprocess
+from unittest import mock
+import numpy as np
+
+import Constants as c
+import Client as cl
+
+
+class TestClient(ut.TestCase):
+    """
+    test suit for the (headless) Client and its command line entry point
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__temp_dir = tempfile.TemporaryDirectory()
+        self.__arguments = ["--case", "case_2", "--n-vars", "4", "--max-iterations", "15", "--headless"]
+        self.__test_msg = "Invalid test!!"
+
+    def tearDown(self) -> None:
+        """
+        Test tear down fixture
+        """
+        self.__temp_dir.cleanup()
+
+    def test_Import_Is_Lazy(self):
+        """
+        Test importing the client does not import the plotting/DataFrame modules
+        """
+        code = "import sys, Client; print(sorted(x for x in ('matplotlib', 'pandas') if x in sys.modules))"
+        output = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(cl.__file__)),
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual("[]", output.strip(), self.__test_msg)
+
+    def test_Cli_Without_Arguments_Runs_The_Demo(self):
+        """
+        Test the command line entry point runs the demo without any argument (and the parsed run otherwise)
+        """
+        with mock.patch.object(cl, "runAcoClient") as run_aco_client, mock.patch.object(sys, "argv", ["Client.py"]):
+            self.assertEqual(0, cl.main(), self.__test_msg)
+            self.assertEqual(0, cl.main([]), self.__test_msg)
+            self.assertEqual(2, run_aco_client.call_count, self.__test_msg)
+            cl.main(self.__arguments)
+            self.assertEqual(2, run_aco_client.call_count, self.__test_msg)
+
+    def test_Cli_Writes_Json_Results(self):
+        """
+        Test the command line entry point writes the JSON results of the (overridden) case
+        """
+        path = os.path.join(self.__temp_dir.name, "results.json")
+        self.assertEqual(0, cl.main(self.__arguments + ["--n-ants", "12", "--output", path]), self.__test_msg)
+        with open(path) as results_file:
+            results = json.load(results_file)
+        self.assertEqual("case_2", results["problem_use_case"], self.__test_msg)
+        self.assertEqual(4, len(results["best_position"]), self.__test_msg)
+        self.assertEqual(12, results["config"]["n_ants"], self.__test_msg)
+        self.assertEqual(15, len(results["history_costs"]), self.__test_msg)
+        self.assertEqual(results["history_costs"][-1], results["best_cost"], self.__test_msg)
+
+    def test_Cli_Writes_Npz_Results_And_Plot(self):
+        """
+        Test the command line entry point writes the '.npz' results and the (off-screen) performance plot
+        """
+        path = os.path.join(self.__temp_dir.name, "results.npz")
+        plot_path = os.path.join(self.__temp_dir.name, "performance.png")
+        cl.main(self.__arguments + ["--output", path, "--plot", plot_path])
+        with np.load(path) as results:
+            self.assertEqual((4,), results["best_position"].shape, self.__test_msg)
+            self.assertEqual(15, int(results["config_max_iterations"]), self.__test_msg)
+            self.assertEqual("max_iterations", str(results["stop_reason"]), self.__test_msg)
+        self.assertGreater(os.path.getsize(plot_path), 0, self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,80 @@
+import unittest as ut
+import threading
+import dataclasses
+import numpy as np
+
+import Constants as c
+import Config as cg
+import Acor as a
+
+
+class TestAcoConfig(ut.TestCase):
+    """
+    test suit for the AcoConfig class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_2"]
+        self.__n_vars = problem["n_dims"]
+        self.__cost_func = problem["func"]
+        self.__domain_bounds = problem["bounds"]
+        self.__n_pop = c.AcoConstants.N_POP
+        self.__test_msg = "Invalid test!!"
+
+    def __runAcor(self, config):
+        """
+        Runs the ACO algorithm with the specified configuration
+        """
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                       n_vars=self.__n_vars,
+                                       cost_func=self.__cost_func,
+                                       domain_bounds=self.__domain_bounds,
+                                       config=config)
+        acor.runGenerations(config.max_iterations)
+        return acor
+
+    def test_AcoConfig_Is_Valid(self):
+        """
+        Test 'AcoConfig' snapshots the constants, is immutable and validates its hyperparameters
+        """
+        config = cg.AcoConfig(q=0.2)
+        self.assertEqual((c.AcoConstants.N_ANTS, 0.2, c.AcoConstants.ZETA), (config.n_ants, config.q, config.zeta), self.__test_msg)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.q = 0.5
+        self.assertEqual(0.7, config.replace(zeta=0.7).zeta, self.__test_msg)
+        self.assertEqual(0.2, config.toDict()["q"], self.__test_msg)
+        with self.assertRaises(ValueError):
+            cg.AcoConfig(n_ants=0)
+
+    def test_AcorContinuousDomain_Uses_The_Config(self):
+        """
+        Test the ACO algorithm uses its configuration instead of the 'AcoConstants' values
+        """
+        config = cg.AcoConfig(n_ants=7, max_iterations=12, q=0.3, zeta=0.9)
+        acor = self.__runAcor(config)
+        self.assertEqual(config, acor.config, self.__test_msg)
+        self.assertEqual(12, acor.iteration, self.__test_msg)
+        self.assertEqual(self.__n_pop + 12*7, acor.n_evaluations, self.__test_msg)
+
+    def test_Differently_Configured_Runs_Are_Thread_Safe(self):
+        """
+        Test differently configured ACO algorithms running side by side in threads match their sequential runs
+        """
+        configs = [cg.AcoConfig(n_ants=n_ants, max_iterations=50, q=q) for n_ants, q in [(10, 0.1), (20, 0.5), (40, 0.9)]]
+        expected = [self.__runAcor(config).history.costs for config in configs]
+        results = [None]*len(configs)
+        def run(i):
+            results[i] = self.__runAcor(configs[i]).history.costs
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(configs))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for expected_costs, costs in zip(expected, results):
+            np.testing.assert_array_equal(expected_costs, costs, self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
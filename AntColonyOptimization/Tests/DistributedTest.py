@@ -0,0 +1,270 @@
+import os
+import time
+import socket
+import tempfile
+import unittest as ut
+import multiprocessing as mp
+import numpy as np
+
+import Constants as c
+import CostFunctions as cf
+import Acor as a
+import Distributed as ds
+import Evaluators as e
+
+
+def scalarSphere(x):
+    """
+    Single solution cost function
+    """
+    return float(np.sum(np.square(x)))
+
+
+def crashingCostFunction(x):
+    """
+    Cost function of a worker node crashing on its first task
+    """
+    os._exit(1)
+
+
+def hangingCostFunction(x):
+    """
+    Cost function of a worker node hanging on its first task
+    """
+    time.sleep(60)
+
+
+def failingCostFunction(x):
+    """
+    Cost function raising an error
+    """
+    raise ValueError("cost function failure")
+
+
+def workerPidCostFunction(x):
+    """
+    Cost function raising an error on out of domain solutions, and returning the worker process id otherwise
+    """
+    if np.any(np.abs(x) > 5.12):
+        raise ValueError("cost function failure")
+    return float(os.getpid())
+
+
+class TestFraming(ut.TestCase):
+    """
+    test suit for the binary framing of the distributed evaluation messages
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__test_msg = "Invalid test!!"
+
+    def test_Frame_Round_Trip_Is_Valid(self):
+        """
+        Test the positions, costs and empty frames are received as sent
+        """
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            for dtype in (np.float64, np.float32):
+                positions = self.__random.uniform(-5.12, 5.12, (40, 10)).astype(dtype)
+                ds.sendFrame(sender, ds.MSG_TASK, 7, positions)
+                message_type, task_id, payload = ds.receiveFrame(receiver)
+                self.assertEqual((ds.MSG_TASK, 7), (message_type, task_id), self.__test_msg)
+                self.assertEqual(np.dtype(dtype), payload.dtype, self.__test_msg)
+                np.testing.assert_array_equal(positions, payload, err_msg=self.__test_msg)
+            costs = self.__random.uniform(0.0, 1.0, 40)
+            ds.sendFrame(sender, ds.MSG_RESULT, 8, costs)
+            _, _, payload = ds.receiveFrame(receiver)
+            np.testing.assert_array_equal(costs, payload[:, 0], err_msg=self.__test_msg)
+            ds.sendFrame(sender, ds.MSG_HEARTBEAT)
+            self.assertEqual((ds.MSG_HEARTBEAT, 0, None), ds.receiveFrame(receiver), self.__test_msg)
+
+    def test_Frame_Is_Compact(self):
+        """
+        Test a frame is the fixed size header followed by the raw array bytes
+        """
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            positions = np.zeros((40, 10))
+            ds.sendFrame(sender, ds.MSG_TASK, 1, positions)
+            sender.close()
+            n_bytes = 0
+            while True:
+                chunk = receiver.recv(65536)
+                if not chunk:
+                    break
+                n_bytes += len(chunk)
+        self.assertEqual(ds.HEADER.size + positions.nbytes, n_bytes, self.__test_msg)
+
+    def test_parseAddress_Is_Valid(self):
+        """
+        Test 'parseAddress' parses the TCP and Unix socket addresses
+        """
+        self.assertEqual((socket.AF_INET, ("127.0.0.1", 5000)), ds.parseAddress("tcp://127.0.0.1:5000"), self.__test_msg)
+        self.assertEqual((socket.AF_UNIX, "/tmp/acor.sock"), ds.parseAddress("unix:///tmp/acor.sock"), self.__test_msg)
+        with self.assertRaises(ValueError):
+            ds.parseAddress("127.0.0.1:5000")
+
+
+class TestDistributedEvaluator(ut.TestCase):
+    """
+    test suit for the DistributedEvaluator class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__positions = np.random.RandomState(c.HelperConstants.RANDOM_SEED).uniform(-5.12, 5.12, (40, 10))
+        self.__expected = cf.rastrigin.batch(self.__positions)
+        self.__processes = []
+        self.__test_msg = "Invalid test!!"
+
+    def tearDown(self) -> None:
+        """
+        Test teardown fixture
+        """
+        for process in self.__processes:
+            process.terminate()
+            process.join()
+
+    def __startWorker(self, evaluator, cost_func, **kwargs):
+        """
+        Starts a worker process and waits for it to connect
+        """
+        evaluator.start()
+        process = mp.Process(target=ds.runWorker, args=(evaluator.address, cost_func), kwargs=kwargs, daemon=True)
+        process.start()
+        self.__processes.append(process)
+        evaluator.waitForWorkers(len(self.__processes), timeout=10.0)
+
+    def test_DistributedEvaluator_Tcp_Is_Valid(self):
+        """
+        Test the local TCP workers evaluate the solutions in the solution order
+        """
+        with ds.DistributedEvaluator(cf.rastrigin, address="tcp://127.0.0.1:0", n_local_workers=2, batch_size=7) as evaluator:
+            actual = evaluator.evaluate(self.__positions)
+            self.assertEqual(2, evaluator.n_workers, self.__test_msg)
+            self.assertEqual(6, evaluator.n_tasks, self.__test_msg)
+            self.assertEqual(40, evaluator.n_evaluations, self.__test_msg)
+        np.testing.assert_array_equal(self.__expected, actual, err_msg=self.__test_msg)
+
+    def test_DistributedEvaluator_Unix_Socket_Is_Valid(self):
+        """
+        Test the local Unix socket workers evaluate the solutions (including single solution cost functions)
+        """
+        path = os.path.join(tempfile.mkdtemp(), "acor.sock")
+        with ds.DistributedEvaluator(scalarSphere, address=f"unix://{path}", n_local_workers=2) as evaluator:
+            actual = evaluator.evaluate(self.__positions)
+        np.testing.assert_allclose(cf.sphere.batch(self.__positions), actual, rtol=1e-12, err_msg=self.__test_msg)
+        self.assertFalse(os.path.exists(path), self.__test_msg)
+
+    def test_DistributedEvaluator_Unix_Socket_Path_Is_Protected(self):
+        """
+        Test a stale unix socket is replaced whilst a regular file at the socket path is never deleted
+        """
+        temp_dir = tempfile.mkdtemp()
+        stale_path = os.path.join(temp_dir, "stale.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(stale_path)
+        stale.close()
+        with ds.DistributedEvaluator(cf.rastrigin, address=f"unix://{stale_path}", n_local_workers=0) as evaluator:
+            evaluator.start()
+            self.assertEqual(f"unix://{stale_path}", evaluator.address, self.__test_msg)
+        file_path = os.path.join(temp_dir, "data.txt")
+        with open(file_path, "w") as data_file:
+            data_file.write("data")
+        with self.assertRaises(FileExistsError):
+            ds.DistributedEvaluator(cf.rastrigin, address=f"unix://{file_path}", n_local_workers=0).start()
+        self.assertTrue(os.path.isfile(file_path), self.__test_msg)
+
+    def test_DistributedEvaluator_Crashed_Worker_Task_Is_Redispatched(self):
+        """
+        Test the task of a crashed worker is re-dispatched to another worker
+        """
+        with ds.DistributedEvaluator(cf.rastrigin, n_local_workers=0) as evaluator:
+            self.__startWorker(evaluator, crashingCostFunction)
+            self.__startWorker(evaluator, cf.rastrigin)
+            actual = evaluator.evaluate(self.__positions)
+            self.assertEqual(1, evaluator.n_redispatched, self.__test_msg)
+            self.assertEqual(1, evaluator.n_workers, self.__test_msg)
+        np.testing.assert_array_equal(self.__expected, actual, err_msg=self.__test_msg)
+
+    def test_DistributedEvaluator_Hung_Worker_Task_Is_Redispatched(self):
+        """
+        Test the task of a worker exceeding the task timeout is re-dispatched to another worker
+        """
+        with ds.DistributedEvaluator(cf.rastrigin, n_local_workers=0, task_timeout=0.5,
+                                     heartbeat_interval=0.1, heartbeat_timeout=5.0) as evaluator:
+            self.__startWorker(evaluator, hangingCostFunction, heartbeat_interval=0.1)
+            self.__startWorker(evaluator, cf.rastrigin, heartbeat_interval=0.1)
+            actual = evaluator.evaluate(self.__positions)
+            self.assertEqual(1, evaluator.n_redispatched, self.__test_msg)
+            self.assertEqual(1, evaluator.n_lost_workers, self.__test_msg)
+        np.testing.assert_array_equal(self.__expected, actual, err_msg=self.__test_msg)
+
+    def test_DistributedEvaluator_Silent_Worker_Task_Is_Redispatched(self):
+        """
+        Test the task of a worker missing its heartbeats is re-dispatched to another worker
+        """
+        with ds.DistributedEvaluator(cf.rastrigin, n_local_workers=0,
+                                     heartbeat_interval=0.1, heartbeat_timeout=0.5) as evaluator:
+            self.__startWorker(evaluator, hangingCostFunction, heartbeat_interval=None)
+            self.__startWorker(evaluator, cf.rastrigin, heartbeat_interval=0.1)
+            actual = evaluator.evaluate(self.__positions)
+            self.assertEqual(1, evaluator.n_redispatched, self.__test_msg)
+        np.testing.assert_array_equal(self.__expected, actual, err_msg=self.__test_msg)
+
+    def test_DistributedEvaluator_Worker_Error_Is_Raised(self):
+        """
+        Test a cost function error of a worker is raised by the coordinator
+        """
+        with ds.DistributedEvaluator(failingCostFunction, n_local_workers=1) as evaluator:
+            with self.assertRaisesRegex(RuntimeError, "cost function failure"):
+                evaluator.evaluate(self.__positions)
+
+    def test_DistributedEvaluator_Worker_Stays_Available_After_An_Error(self):
+        """
+        Test the worker reporting a cost function error is neither dropped nor skipped by the next evaluations
+        """
+        with ds.DistributedEvaluator(workerPidCostFunction, n_local_workers=2, batch_size=1) as evaluator:
+            with self.assertRaisesRegex(RuntimeError, "cost function failure"):
+                evaluator.evaluate(self.__positions + 100.0)
+            worker_pids = set()
+            for _ in range(5):
+                worker_pids.update(evaluator.evaluate(self.__positions))
+            self.assertEqual(2, len(worker_pids), self.__test_msg)
+            self.assertEqual(2, evaluator.n_workers, self.__test_msg)
+            self.assertEqual(0, evaluator.n_lost_workers, self.__test_msg)
+
+    def test_DistributedEvaluator_Without_Workers_Times_Out(self):
+        """
+        Test an evaluation without any connected worker times out
+        """
+        with ds.DistributedEvaluator(cf.rastrigin, n_local_workers=0, heartbeat_interval=0.1,
+                                     connect_timeout=0.3) as evaluator:
+            with self.assertRaises(TimeoutError):
+                evaluator.evaluate(self.__positions)
+
+    def test_Acor_Distributed_Evaluator_Matches_Serial(self):
+        """
+        Test the ACO algorithm results are independent of the distributed evaluation
+        """
+        c.AcoConstants.MAX_ITERATIONS = 20
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_4"]
+        results = []
+        for evaluator in (None, "distributed"):
+            acor = a.AcorContinuousDomain(n_pop=c.AcoConstants.N_POP,
+                                          n_vars=problem["n_dims"],
+                                          cost_func=problem["func"],
+                                          domain_bounds=problem["bounds"],
+                                          evaluator=evaluator)
+            acor.runMainLoop()
+            results.append(acor.final_best_solution.cost_function)
+        self.assertIsInstance(e.createEvaluator(cf.rastrigin, "distributed"), ds.DistributedEvaluator, self.__test_msg)
+        self.assertEqual(results[0], results[1], self.__test_msg)
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -0,0 +1,126 @@
+import unittest as ut
+import pickle
+import numpy as np
+
+import Constants as c
+import CostFunctions as cf
+import Evaluators as e
+import EvaluationCache as ec
+import Acor as a
+
+
+class TestCachedCostFunction(ut.TestCase):
+    """
+    test suit for the CachedCostFunction class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_calls = 0
+        self.__random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__test_msg = "Invalid test!!"
+
+    def __countingSphere(self, x):
+        """
+        Single solution sphere cost function counting its calls
+        """
+        self.__n_calls += 1
+        return cf.sphere(x)
+
+    def test_CachedCostFunction_Repeated_Positions_Are_Evaluated_Once(self):
+        """
+        Test 'CachedCostFunction' evaluates repeated (e.g. clipped) positions once and counts the hits/misses
+        """
+        cache = ec.CachedCostFunction(self.__countingSphere, max_size=100)
+        positions = np.vstack([np.full((3, 4), 0.5), np.full((2, 4), 1.5), self.__random.rand(1, 4)])
+        costs = cache.batch(positions)
+        np.testing.assert_array_equal(cf.sphere.batch(positions), costs, self.__test_msg)
+        self.assertEqual(3, self.__n_calls, self.__test_msg)
+        self.assertEqual((3, 3), (cache.misses, cache.hits), self.__test_msg)
+        cache.batch(positions)
+        self.assertEqual(3, self.__n_calls, self.__test_msg)
+        self.assertEqual((3, 9), (cache.misses, cache.hits), self.__test_msg)
+        self.assertAlmostEqual(0.75, cache.hit_rate, msg=self.__test_msg)
+
+    def test_CachedCostFunction_Tolerance_Quantizes_Positions(self):
+        """
+        Test 'CachedCostFunction' shares one evaluation between positions within the quantization tolerance
+        """
+        cache = ec.CachedCostFunction(self.__countingSphere, max_size=100, tolerance=1e-3)
+        cache(np.full((4, 1), 1.0))
+        cache(np.full((4, 1), 1.0 + 1e-5))
+        self.assertEqual(1, self.__n_calls, self.__test_msg)
+        self.assertEqual(1, cache.hits, self.__test_msg)
+
+    def test_CachedCostFunction_LRU_Eviction_Is_Bounded(self):
+        """
+        Test 'CachedCostFunction' evicts the least recently used costs
+        """
+        cache = ec.CachedCostFunction(self.__countingSphere, max_size=2)
+        x_1, x_2, x_3 = [np.full((2, 1), float(i)) for i in range(3)]
+        cache(x_1)
+        cache(x_2)
+        cache(x_1)
+        cache(x_3)
+        self.assertEqual(2, cache.size, self.__test_msg)
+        cache(x_1)
+        self.assertEqual(3, self.__n_calls, self.__test_msg)
+        cache(x_2)
+        self.assertEqual(4, self.__n_calls, self.__test_msg)
+
+    def test_CachedCostFunction_Is_Picklable(self):
+        """
+        Test 'CachedCostFunction' can be pickled (e.g. for process pool evaluators)
+        """
+        cache = ec.CachedCostFunction(cf.rastrigin, max_size=10)
+        cache(np.zeros((3, 1)))
+        clone = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(0.0, clone(np.zeros((3, 1))), self.__test_msg)
+        self.assertEqual(1, clone.hits, self.__test_msg)
+
+    def test_AcorContinuousDomain_Cache_Skips_Clipped_Duplicates(self):
+        """
+        Test 'AcorContinuousDomain' evaluation cache matches the uncached run and records hits on 'dp'
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_1"]
+        c.AcoConstants.MAX_ITERATIONS = 200
+        results = []
+        for cache_size in [None, 10000]:
+            acor = a.AcorContinuousDomain(n_pop=c.AcoConstants.N_POP,
+                                           n_vars=problem["n_dims"],
+                                           cost_func=problem["func"],
+                                           domain_bounds=problem["bounds"],
+                                           cache_size=cache_size)
+            acor.runMainLoop()
+            results.append(acor.final_best_solution.cost_function)
+        self.assertEqual(results[0], results[1], self.__test_msg)
+        self.assertGreater(acor.cache.hits, 0, self.__test_msg)
+
+    def test_AcorContinuousDomain_Cache_Lookups_Precede_Process_Evaluator(self):
+        """
+        Test 'AcorContinuousDomain' looks the costs up before dispatching to a process evaluator (only the cache
+        misses reach the worker pool and the hits/misses are counted by the coordinator)
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_1"]
+        c.AcoConstants.MAX_ITERATIONS = 200
+        results = []
+        for cache_size in [None, 10000]:
+            with e.Evaluator(problem["func"], backend="process", n_workers=2) as evaluator:
+                acor = a.AcorContinuousDomain(n_pop=c.AcoConstants.N_POP,
+                                               n_vars=problem["n_dims"],
+                                               cost_func=problem["func"],
+                                               domain_bounds=problem["bounds"],
+                                               evaluator=evaluator,
+                                               cache_size=cache_size)
+                acor.runMainLoop()
+                results.append(acor.final_best_solution.cost_function)
+        n_lookups = c.AcoConstants.N_POP + c.AcoConstants.MAX_ITERATIONS*c.AcoConstants.N_ANTS
+        self.assertEqual(results[0], results[1], self.__test_msg)
+        self.assertGreater(acor.cache.hits, 0, self.__test_msg)
+        self.assertEqual(n_lookups, acor.cache.hits + acor.cache.misses, self.__test_msg)
+        self.assertEqual(acor.cache.misses, evaluator.n_evaluations, self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
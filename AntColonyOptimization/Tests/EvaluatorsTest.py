@@ -0,0 +1,93 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import CostFunctions as cf
+import Evaluators as e
+
+
+class TestBatchCostFunction(ut.TestCase):
+    """
+    test suit for the batch cost function evaluation contract
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_ants = c.AcoConstants.N_ANTS
+        self.__random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__test_msg = "Invalid test!!"
+
+    def test_Builtin_Cost_Functions_Batch_Matches_Single_Solution(self):
+        """
+        Test the batch evaluation of the built-in cost functions matches the single solution evaluation
+        """
+        for problem in c.ProblemConstants.COST_FUNC_MAP.values():
+            l_bound, u_bound = problem["bounds"]
+            positions = self.__random.uniform(l_bound, u_bound, (self.__n_ants, problem["n_dims"]))
+            cost_func = problem["func"]
+            expected = np.array([cost_func(np.reshape(x, (-1, 1))) for x in positions])
+            actual = cost_func.batch(positions)
+            self.assertTrue(e.BatchCostFunction.isBatchCostFunction(cost_func), self.__test_msg)
+            self.assertEqual((self.__n_ants,), actual.shape, self.__test_msg)
+            np.testing.assert_allclose(expected, actual, rtol=1e-12, err_msg=self.__test_msg)
+
+    def test_BatchCostFunction_Scalar_Fallback_Is_Valid(self):
+        """
+        Test 'BatchCostFunction' adapts a single solution (user) cost function
+        """
+        n_calls = []
+        def scalarSphere(x):
+            n_calls.append(x.shape)
+            return float(np.sum(np.square(x)))
+        positions = self.__random.uniform(-5.12, 5.12, (self.__n_ants, 10))
+        batch_cost_func = e.BatchCostFunction(scalarSphere)
+        actual = batch_cost_func(positions)
+        self.assertFalse(batch_cost_func.is_batch, self.__test_msg)
+        self.assertEqual([(10, 1)] * self.__n_ants, n_calls, self.__test_msg)
+        np.testing.assert_allclose(cf.sphere.batch(positions), actual, rtol=1e-12, err_msg=self.__test_msg)
+
+
+class TestEvaluator(ut.TestCase):
+    """
+    test suit for the Evaluator class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_ants = c.AcoConstants.N_ANTS
+        self.__positions = np.random.RandomState(c.HelperConstants.RANDOM_SEED).uniform(-5.12, 5.12, (self.__n_ants, 10))
+        self.__test_msg = "Invalid test!!"
+
+    def test_Evaluator_Invalid_Backend_Is_Rejected(self):
+        """
+        Test 'Evaluator' rejects an unknown backend
+        """
+        with self.assertRaises(ValueError, msg=self.__test_msg):
+            e.Evaluator(cf.rastrigin, backend="unknown")
+
+    def test_Evaluator_Backends_Are_Deterministic(self):
+        """
+        Test every 'Evaluator' backend (and chunking) returns the serial costs in the solution order
+        """
+        expected = cf.rastrigin.batch(self.__positions)
+        for backend in e.Evaluator.BACKENDS:
+            for chunk_size in [None, 1, 7]:
+                with e.Evaluator(cf.rastrigin, backend=backend, n_workers=2, chunk_size=chunk_size) as evaluator:
+                    actual = evaluator.evaluate(self.__positions)
+                    self.assertEqual(self.__n_ants, evaluator.n_evaluations, self.__test_msg)
+                np.testing.assert_array_equal(expected, actual, f"{self.__test_msg} {backend}")
+
+    def test_Evaluator_Process_Backend_Matches_Single_Solution_Costs(self):
+        """
+        Test the 'process' backend matches the single solution costs of a (picklable) cost function
+        """
+        expected = np.array([cf.stybtangm(np.reshape(x, (-1, 1))) for x in self.__positions])
+        with e.Evaluator(cf.stybtangm, backend="process", n_workers=2) as evaluator:
+            actual = evaluator.evaluate(self.__positions)
+        np.testing.assert_array_equal(expected, actual, self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,117 @@
+import unittest as ut
+import os
+import tempfile
+import numpy as np
+
+import Constants as c
+import History as h
+import Checkpoint as cp
+import Acor as a
+
+
+class TestHistoryRecorder(ut.TestCase):
+    """
+    test suit for the HistoryRecorder class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_vars = 4
+        self.__max_iterations = 25
+        random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__positions = random.rand(self.__max_iterations, self.__n_vars)
+        self.__costs = np.sort(random.rand(self.__max_iterations))[::-1]
+        self.__temp_dir = tempfile.TemporaryDirectory()
+        self.__test_msg = "Invalid test!!"
+
+    def tearDown(self) -> None:
+        """
+        Test tear down fixture
+        """
+        self.__temp_dir.cleanup()
+
+    def __record(self, mode, **kwargs):
+        """
+        Records the test history
+        """
+        recorder = h.HistoryRecorder(self.__max_iterations, self.__n_vars, mode=mode, **kwargs)
+        for position, cost in zip(self.__positions, self.__costs):
+            recorder.record(position, cost)
+        return recorder
+
+    def test_HistoryRecorder_Modes_Record_Costs(self):
+        """
+        Test every 'HistoryRecorder' mode records the best costs
+        """
+        path = os.path.join(self.__temp_dir.name, "history.npy")
+        for mode in h.HistoryRecorder.MODES:
+            recorder = self.__record(mode, interval=10, path=path)
+            np.testing.assert_array_equal(self.__costs, recorder.costs, f"{self.__test_msg} {mode}")
+            self.assertEqual(self.__max_iterations, len(recorder.best_solutions), self.__test_msg)
+
+    def test_HistoryRecorder_Positions_Are_Valid(self):
+        """
+        Test the 'HistoryRecorder' positions of the 'full', 'sampled', 'memmap' and 'costs' modes
+        """
+        path = os.path.join(self.__temp_dir.name, "history.npy")
+        np.testing.assert_array_equal(self.__positions, self.__record("full").positions, self.__test_msg)
+        sampled = self.__record("sampled", interval=10)
+        np.testing.assert_array_equal([0, 10, 20], sampled.position_iterations, self.__test_msg)
+        np.testing.assert_array_equal(self.__positions[::10], sampled.positions, self.__test_msg)
+        self.__record("memmap", path=path).truncate(self.__max_iterations)
+        np.testing.assert_array_equal(self.__positions, np.load(path), self.__test_msg)
+        self.assertIsNone(self.__record("costs").positions, self.__test_msg)
+
+    def test_HistoryRecorder_Checkpoint_Round_Trip_Is_Valid(self):
+        """
+        Test every 'HistoryRecorder' mode state survives a checkpoint save/load round trip
+        """
+        n_recorded = 15
+        for mode in h.HistoryRecorder.MODES:
+            path = os.path.join(self.__temp_dir.name, f"history-{mode}.npy")
+            checkpoint_path = os.path.join(self.__temp_dir.name, f"checkpoint-{mode}.npz")
+            recorder = h.HistoryRecorder(self.__max_iterations, self.__n_vars, mode=mode, interval=10, path=path)
+            for position, cost in zip(self.__positions[:n_recorded], self.__costs[:n_recorded]):
+                recorder.record(position, cost)
+            cp.Checkpoint.save(checkpoint_path, recorder.getState())
+            restored = h.HistoryRecorder(self.__max_iterations, self.__n_vars, mode=mode, interval=10, path=path)
+            restored.setState(cp.Checkpoint.load(checkpoint_path))
+            for position, cost in zip(self.__positions[n_recorded:], self.__costs[n_recorded:]):
+                recorder.record(position, cost)
+                restored.record(position, cost)
+            np.testing.assert_array_equal(recorder.costs, restored.costs, f"{self.__test_msg} {mode}")
+            if mode == "costs":
+                self.assertIsNone(restored.positions, self.__test_msg)
+            else:
+                np.testing.assert_array_equal(recorder.positions, restored.positions, f"{self.__test_msg} {mode}")
+
+    def test_HistoryRecorder_Downsample_Is_Valid(self):
+        """
+        Test 'HistoryRecorder' downsampling keeps the first and last iterations within the point budget
+        """
+        iterations, costs = self.__record("costs").downsample(max_points=6)
+        self.assertLessEqual(len(iterations), 6, self.__test_msg)
+        self.assertEqual((0, self.__max_iterations - 1), (iterations[0], iterations[-1]), self.__test_msg)
+        np.testing.assert_array_equal(self.__costs[iterations], costs, self.__test_msg)
+
+    def test_AcorContinuousDomain_Costs_History_Matches_Full_History(self):
+        """
+        Test the 'costs' history mode of the ACO algorithm records the 'full' mode best costs
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_2"]
+        c.AcoConstants.MAX_ITERATIONS = 20
+        histories = []
+        for mode in ["full", "costs"]:
+            acor = a.AcorContinuousDomain(n_pop=c.AcoConstants.N_POP,
+                                           n_vars=problem["n_dims"],
+                                           cost_func=problem["func"],
+                                           domain_bounds=problem["bounds"],
+                                           history_mode=mode)
+            acor.runMainLoop()
+            histories.append(acor.history.costs)
+        np.testing.assert_array_equal(histories[0], histories[1], self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
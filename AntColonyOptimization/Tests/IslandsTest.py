@@ -0,0 +1,78 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import Islands as il
+
+
+class TestIslandModelRunner(ut.TestCase):
+    """
+    test suit for the IslandModelRunner class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_4"]
+        self.__n_vars = problem["n_dims"]
+        self.__cost_func = problem["func"]
+        self.__domain_bounds = problem["bounds"]
+        self.__n_pop = c.AcoConstants.N_POP
+        self.__n_islands = 3
+        self.__n_generations = 20
+        c.AcoConstants.MAX_ITERATIONS = self.__n_generations
+        self.__test_msg = "Invalid test!!"
+
+    def __createRunner(self, parallel, n_generations=None):
+        """
+        Creates the island model runner
+        """
+        return il.IslandModelRunner(n_islands=self.__n_islands,
+                                    n_pop=self.__n_pop,
+                                    n_vars=self.__n_vars,
+                                    cost_func=self.__cost_func,
+                                    domain_bounds=self.__domain_bounds,
+                                    n_generations=n_generations if n_generations is not None else self.__n_generations,
+                                    migration_interval=5,
+                                    n_migrants=2,
+                                    parallel=parallel)
+
+    def test_IslandModelRunner_Run_Is_Valid(self):
+        """
+        Test 'IslandModelRunner' returns the global best and the per island convergence histories
+        """
+        runner = self.__createRunner(parallel=True)
+        best_solution = runner.run()
+        self.assertEqual(self.__n_islands, len(set(runner.seeds)), self.__test_msg)
+        self.assertEqual(self.__n_islands, len(runner.convergence_histories), self.__test_msg)
+        for history in runner.convergence_histories:
+            self.assertEqual((self.__n_generations,), history.shape, self.__test_msg)
+            self.assertTrue(np.all(np.diff(history) <= 0.0), self.__test_msg)
+        self.assertEqual(min(x.cost_function for x in runner.island_best_solutions), best_solution.cost_function, self.__test_msg)
+
+    def test_IslandModelRunner_Generation_Budget_Is_Valid(self):
+        """
+        Test 'IslandModelRunner' clamps the last migration epoch to the generation budget
+        """
+        n_generations = 12
+        for parallel in (False, True):
+            runner = self.__createRunner(parallel=parallel, n_generations=n_generations)
+            runner.run()
+            for history in runner.convergence_histories:
+                self.assertEqual((n_generations,), history.shape, self.__test_msg)
+
+    def test_IslandModelRunner_Parallel_Matches_Serial(self):
+        """
+        Test 'IslandModelRunner' results are independent of the worker processes
+        """
+        parallel_runner = self.__createRunner(parallel=True)
+        serial_runner = self.__createRunner(parallel=False)
+        parallel_runner.run()
+        serial_runner.run()
+        for expected, actual in zip(serial_runner.convergence_histories, parallel_runner.convergence_histories):
+            np.testing.assert_array_equal(expected, actual, self.__test_msg)
+        np.testing.assert_array_equal(serial_runner.best_solution.position, parallel_runner.best_solution.position, self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,146 @@
+import os
+import sys
+import tempfile
+import subprocess
+import unittest as ut
+from unittest import mock
+import numpy as np
+
+import Constants as c
+import CostFunctions as cf
+import Kernels as kr
+import Sigma as sg
+import Sampling as s
+import Acor as a
+
+
+class TestKernels(ut.TestCase):
+    """
+    test suit for the (optionally compiled) kernels, checked against the NumPy paths (the kernels run as plain Python
+    functions when Numba is not installed)
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_pop, self.__n_vars, self.__n_ants = 12, 5, 30
+        random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__means = random.uniform(-5.0, 5.0, (self.__n_pop, self.__n_vars))
+        self.__sigmas = random.uniform(0.0, 2.0, (self.__n_pop, self.__n_vars))
+        w = random.uniform(0.0, 1.0, self.__n_pop)
+        self.__probs = w/np.sum(w)
+        self.__uniforms = random.rand(self.__n_ants, self.__n_vars)
+        self.__noise = random.randn(self.__n_ants, self.__n_vars)
+        self.__test_msg = "Invalid test!!"
+
+    def test_Kernel_Backend_Resolution_Is_Valid(self):
+        """
+        Test the kernel backend resolution and its fallback to the NumPy kernels
+        """
+        self.assertEqual("numpy", kr.resolveKernelBackend("numpy"), self.__test_msg)
+        self.assertEqual("numba" if kr.hasNumba() else "numpy", kr.resolveKernelBackend("auto"), self.__test_msg)
+        with self.assertRaises(ValueError):
+            kr.resolveKernelBackend("cython")
+        if not kr.hasNumba():
+            with self.assertWarns(RuntimeWarning):
+                self.assertEqual("numpy", kr.resolveKernelBackend("numba"), self.__test_msg)
+
+    def test_Numba_Is_Imported_Lazily(self):
+        """
+        Test importing the ACO algorithm does not import Numba (a stand-in 'numba' module is put on the path)
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "numba.py"), "w") as numba_file:
+                numba_file.write("def njit(**kwargs):\n    return lambda func: func\n")
+            python_path = os.pathsep.join([temp_dir, os.path.dirname(os.path.abspath(kr.__file__))])
+            script = "import sys, Acor, Kernels; print('numba' in sys.modules, Kernels.hasNumba(), 'numba' in sys.modules)"
+            output = subprocess.run([sys.executable, "-c", script], env={**os.environ, "PYTHONPATH": python_path},
+                                    capture_output=True, text=True, check=True).stdout.split()
+        self.assertEqual(["False", "True", "True"], output, self.__test_msg)
+
+    def test_Distance_Sums_Kernel_Matches_NumPy(self):
+        """
+        Test the sigma distance sums kernel matches the NumPy computation
+        """
+        expected = sg.SigmaEngine.computeDistanceSumsBroadcast(self.__means, c.AcoConstants.SIGMA_CHUNK_SIZE)
+        out = np.full((self.__n_pop, self.__n_vars), np.nan)
+        actual = kr.computeDistanceSums(self.__means, out)
+        self.assertIs(out, actual, self.__test_msg)
+        np.testing.assert_allclose(expected, actual, rtol=1e-12, err_msg=self.__test_msg)
+
+    def test_Distance_Sums_Kernel_Keeps_Sorted_Method(self):
+        """
+        Test the 'numba' backend sigma engine only uses the O(n_pop^2) distance sums kernel for the 'loop'/'broadcast'
+        methods and keeps the O(n_pop * log(n_pop)) 'sorted' computations (e.g. of 'auto' on large archives)
+        """
+        large_means = np.random.RandomState(c.HelperConstants.RANDOM_SEED).uniform(-5.0, 5.0, (300, self.__n_vars))
+        cases = [("broadcast", self.__means, 1), ("auto", self.__means, 2), ("sorted", self.__means, 2), ("auto", large_means, 2)]
+        expected = [sg.SigmaEngine(c.AcoConstants.ZETA, method).compute(means) for method, means, _ in cases]
+        with mock.patch.object(kr, "resolveKernelBackend", return_value="numba"), \
+             mock.patch.object(kr, "computeDistanceSums", wraps=kr.computeDistanceSums) as kernel:
+            for (method, means, n_calls), sigmas in zip(cases, expected):
+                engine = sg.SigmaEngine(c.AcoConstants.ZETA, method, kernel_backend="numba")
+                np.testing.assert_allclose(sigmas, engine.compute(means), rtol=1e-12, err_msg=self.__test_msg)
+                self.assertEqual(n_calls, kernel.call_count, f"{self.__test_msg} {method}")
+
+    def test_Sampling_Kernels_Match_NumPy(self):
+        """
+        Test the fused sampling kernels match the NumPy roulette wheel selection and Gaussian sampling
+        """
+        cum_probs = np.cumsum(self.__probs)
+        k = np.minimum(np.searchsorted(cum_probs, self.__uniforms, side="left"), self.__n_pop - 1)
+        columns = np.arange(self.__n_vars)
+        expected = self.__means[k, columns] + self.__sigmas[k, columns] * self.__noise
+        out = np.zeros((self.__n_ants, self.__n_vars))
+        kr.sampleRoulette(self.__means, self.__sigmas, cum_probs, self.__uniforms, self.__noise, out)
+        np.testing.assert_allclose(expected, out, rtol=1e-12, err_msg=self.__test_msg)
+        out = np.zeros((self.__n_ants, self.__n_vars))
+        kr.gatherSamples(self.__means, self.__sigmas, k, self.__noise, out)
+        np.testing.assert_allclose(expected, out, rtol=1e-12, err_msg=self.__test_msg)
+
+    def test_Bounds_Kernel_Matches_NumPy(self):
+        """
+        Test the bounds kernel matches the NumPy bounds
+        """
+        positions = 4.0*self.__noise
+        expected = s.KernelSampler.applyBounds(positions.copy(), -5.0, 5.0)
+        actual = kr.applyBounds(positions, -5.0, 5.0)
+        self.assertIs(positions, actual, self.__test_msg)
+        np.testing.assert_array_equal(expected, actual, self.__test_msg)
+
+    def test_Cost_Function_Kernels_Match_NumPy(self):
+        """
+        Test the compiled cost function kernels (and twins) match the built-in NumPy cost functions
+        """
+        x = self.__means
+        for func, kernel in ((cf.rastrigin, kr.rastrigin), (cf.stybtangm, kr.stybtangm)):
+            np.testing.assert_allclose(func.batch(x), kernel(x), rtol=1e-12, err_msg=self.__test_msg)
+            compiled = cf.getCompiledCostFunction(func)
+            np.testing.assert_allclose(func.batch(x), compiled.batch(x), rtol=1e-12, err_msg=self.__test_msg)
+            self.assertAlmostEqual(func(x[0]), compiled(x[0]), places=9, msg=self.__test_msg)
+        self.assertIs(cf.sphere, cf.getCompiledCostFunction(cf.sphere), self.__test_msg)
+
+    @ut.skipUnless(kr.hasNumba(), "Numba is not installed")
+    def test_Numba_Backend_Matches_NumPy_Backend(self):
+        """
+        Test the ACO algorithm runs with the compiled kernels match the NumPy kernel runs
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_4"]
+        for selection in ("roulette", "alias"):
+            results = []
+            for kernel_backend in ("numpy", "numba"):
+                acor = a.AcorContinuousDomain(n_pop=c.AcoConstants.N_POP,
+                                              n_vars=problem["n_dims"],
+                                              cost_func=problem["func"],
+                                              domain_bounds=problem["bounds"],
+                                              show_progress=False,
+                                              selection=selection,
+                                              kernel_backend=kernel_backend)
+                acor.runGenerations(20)
+                self.assertEqual(kernel_backend, acor.kernel_backend, self.__test_msg)
+                results.append(acor.archive.costs.copy())
+            np.testing.assert_allclose(results[0], results[1], rtol=1e-9, err_msg=self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
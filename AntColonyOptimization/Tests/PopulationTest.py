@@ -1,8 +1,10 @@
 import unittest as ut 
 import inspect
+from unittest import mock
 
 import Population as p 
 import Constants as c
+import Evaluators as e
 
 
 class TestPopulations(ut.TestCase):
@@ -40,6 +42,31 @@ class TestPopulations(ut.TestCase):
         self.assertEqual(expected_n_pops, actual_n_pops, self.__test_msg)
         self.assertIsNotNone(ant_populations_best, self.__test_msg)
 
+    def test_Population_Empty_New_Populations_Do_Not_Alias(self):
+        """
+        Test each empty new ant population owns a distinct position row
+        """
+        n_ants = c.AcoConstants.N_ANTS
+        new_pops = p.Populations.createEmptyNewPopulations(n_ants, self.__n_vars)
+        new_pops[0].position[0, 0] = 1.0
+        self.assertEqual(n_ants, len(new_pops), self.__test_msg)
+        self.assertEqual((self.__n_vars, 1), new_pops[1].position.shape, self.__test_msg)
+        self.assertEqual(0.0, new_pops[1].position[0, 0], self.__test_msg)
+
+    def test_Population_Owned_Evaluator_Is_Closed(self):
+        """
+        Test an evaluator created from a backend name is closed after the initialization whilst an injected one is not
+        """
+        with mock.patch.object(e.Evaluator, "close") as close:
+            pops = p.Populations(self.__n_pop, self.__n_vars, self.__cost_func, self.__domain_bounds, evaluator="thread")
+            self.assertEqual(self.__n_pop, len(pops.ant_populations), self.__test_msg)
+            self.assertEqual(1, close.call_count, self.__test_msg)
+            evaluator = e.Evaluator(self.__cost_func, backend="thread")
+            pops = p.Populations(self.__n_pop, self.__n_vars, self.__cost_func, self.__domain_bounds, evaluator=evaluator)
+            self.assertEqual(self.__n_pop, len(pops.ant_populations), self.__test_msg)
+            self.assertEqual(1, close.call_count, self.__test_msg)
+        evaluator.close()
+
 
         
 
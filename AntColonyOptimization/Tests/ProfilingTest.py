@@ -0,0 +1,94 @@
+import unittest as ut
+import os
+import json
+import tempfile
+import numpy as np
+
+import Constants as c
+import Profiling as pr
+import Acor as a
+
+
+class TestProfiling(ut.TestCase):
+    """
+    test suit for the ACO algorithm main loop profiling
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_2"]
+        self.__n_vars = problem["n_dims"]
+        self.__cost_func = problem["func"]
+        self.__domain_bounds = problem["bounds"]
+        self.__n_pop = c.AcoConstants.N_POP
+        c.AcoConstants.MAX_ITERATIONS = 20
+        self.__test_msg = "Invalid test!!"
+
+    def __runAcor(self, profile):
+        """
+        Runs the ACO algorithm
+        """
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                       n_vars=self.__n_vars,
+                                       cost_func=self.__cost_func,
+                                       domain_bounds=self.__domain_bounds,
+                                       profile=profile)
+        acor.runMainLoop()
+        return acor
+
+    def test_PhaseProfiler_Report_Is_Valid(self):
+        """
+        Test the profiled run reports every phase once per generation
+        """
+        profiler = self.__runAcor(profile=True).profiler
+        report = profiler.toDict()
+        self.assertEqual(20, report["n_generations"], self.__test_msg)
+        self.assertEqual(set(pr.PhaseProfiler.PHASES), set(report["phases"]), self.__test_msg)
+        for name, phase in report["phases"].items():
+            self.assertEqual(20, phase["n_calls"], f"{self.__test_msg} {name}")
+            self.assertGreaterEqual(phase["total_time"], 0.0, self.__test_msg)
+        fractions = [phase["fraction"] for phase in report["phases"].values()]
+        self.assertAlmostEqual(1.0, sum(fractions), places=9, msg=self.__test_msg)
+
+    def test_PhaseProfiler_Exports_Are_Valid(self):
+        """
+        Test the JSON and DataFrame exports of the profiling report
+        """
+        profiler = self.__runAcor(profile=True).profiler
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "profile.json")
+            report = profiler.toJson(path)
+            with open(path) as report_file:
+                self.assertEqual(json.loads(report), json.load(report_file), self.__test_msg)
+        data_frame = profiler.toDataFrame()
+        self.assertEqual(list(pr.PhaseProfiler.PHASES), list(data_frame.index), self.__test_msg)
+        self.assertTrue(np.all(data_frame["n_calls"] == 20), self.__test_msg)
+
+    def test_Profiling_Does_Not_Change_The_Results(self):
+        """
+        Test the profiled and the (default) unprofiled runs are identical
+        """
+        unprofiled = self.__runAcor(profile=False)
+        profiled = self.__runAcor(profile=True)
+        self.assertIsInstance(unprofiled.profiler, pr.NullProfiler, self.__test_msg)
+        np.testing.assert_array_equal(unprofiled.history.costs, profiled.history.costs, self.__test_msg)
+
+    def test_NullProfiler_Exports_An_Empty_Report(self):
+        """
+        Test the disabled profiler exports an empty report with the profiling report structure
+        """
+        profiler = self.__runAcor(profile=False).profiler
+        self.assertIsInstance(profiler, pr.ProfilingReport, self.__test_msg)
+        self.assertEqual({"n_generations": 0, "profiled_time": 0.0, "phases": {}}, profiler.toDict(), self.__test_msg)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "profile.json")
+            report = profiler.toJson(path)
+            with open(path) as report_file:
+                self.assertEqual(profiler.toDict(), json.load(report_file), self.__test_msg)
+        self.assertEqual(profiler.toDict(), json.loads(report), self.__test_msg)
+        self.assertTrue(profiler.toDataFrame().empty, self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,95 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import RandomStreams as rs
+import Acor as a
+
+
+class TestRandomStreams(ut.TestCase):
+    """
+    test suit for the ACO algorithm random streams
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_4"]
+        self.__n_vars = problem["n_dims"]
+        self.__cost_func = problem["func"]
+        self.__domain_bounds = problem["bounds"]
+        self.__n_pop = c.AcoConstants.N_POP
+        c.AcoConstants.MAX_ITERATIONS = 20
+        self.__test_msg = "Invalid test!!"
+
+    def __runAcor(self, **kwargs):
+        """
+        Runs the ACO algorithm
+        """
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                       n_vars=self.__n_vars,
+                                       cost_func=self.__cost_func,
+                                       domain_bounds=self.__domain_bounds,
+                                       **kwargs)
+        acor.runMainLoop()
+        return acor.history.costs
+
+    def test_RandomStream_Draws_Are_Valid(self):
+        """
+        Test every bit generator draws scalars and bulk arrays through the same interface
+        """
+        for bit_generator in rs.RandomStream.BIT_GENERATORS:
+            random = rs.createRandomStream(random_seed=c.HelperConstants.RANDOM_SEED, bit_generator=bit_generator)
+            self.assertEqual(bit_generator == "legacy", random.is_legacy, self.__test_msg)
+            self.assertTrue(np.isscalar(random.rand()) and np.isscalar(random.randn()), self.__test_msg)
+            self.assertEqual((3, 4), random.rand(3, 4).shape, self.__test_msg)
+            self.assertEqual((3, 4), random.randn(3, 4).shape, self.__test_msg)
+            self.assertTrue(np.all(np.abs(random.uniform(-2.0, 2.0, (100,))) <= 2.0), self.__test_msg)
+        with self.assertRaises(ValueError):
+            rs.createRandomStream(bit_generator="mt")
+
+    def test_RandomStream_In_Place_Draws_Match_Bulk_Draws(self):
+        """
+        Test every bit generator fills arrays in place with the same draws as the bulk interface
+        """
+        for bit_generator in rs.RandomStream.BIT_GENERATORS:
+            expected = rs.createRandomStream(random_seed=c.HelperConstants.RANDOM_SEED, bit_generator=bit_generator)
+            actual = rs.createRandomStream(random_seed=c.HelperConstants.RANDOM_SEED, bit_generator=bit_generator)
+            out = np.zeros((3, 4))
+            np.testing.assert_array_equal(expected.rand(3, 4), actual.fillRand(out), self.__test_msg)
+            np.testing.assert_array_equal(expected.randn(3, 4), actual.fillRandn(out), self.__test_msg)
+            out = np.zeros((3, 4), dtype=np.float32)
+            self.assertEqual(np.float32, actual.fillRandn(actual.fillRand(out)).dtype, self.__test_msg)
+
+    def test_Spawned_Random_Streams_Are_Independent(self):
+        """
+        Test the spawned random streams are reproducible and independent
+        """
+        draws = [x.rand(5) for x in rs.spawnRandomStreams(4, c.HelperConstants.RANDOM_SEED)]
+        self.assertEqual(4, len({x.tobytes() for x in draws}), self.__test_msg)
+        np.testing.assert_array_equal(draws[2], rs.spawnRandomStreams(4, c.HelperConstants.RANDOM_SEED)[2].rand(5),
+                                      self.__test_msg)
+
+    def test_Injected_Generator_Is_Used(self):
+        """
+        Test the ACO algorithm draws its random numbers from the injected generator
+        """
+        for bit_generator in [np.random.PCG64, np.random.Philox]:
+            costs = self.__runAcor(random=np.random.Generator(bit_generator(7)))
+            np.testing.assert_array_equal(costs, self.__runAcor(random=np.random.Generator(bit_generator(7))), self.__test_msg)
+        np.testing.assert_array_equal(self.__runAcor(random_seed=7, bit_generator="philox"),
+                                      self.__runAcor(random=np.random.Generator(np.random.Philox(7))), self.__test_msg)
+
+    def test_Global_Random_State_Is_Not_Used(self):
+        """
+        Test the ACO algorithm does not draw from (or reseed) the global NumPy random state
+        """
+        np.random.seed(c.HelperConstants.RANDOM_SEED)
+        for bit_generator in rs.RandomStream.BIT_GENERATORS:
+            self.__runAcor(bit_generator=bit_generator)
+        np.testing.assert_array_equal(np.random.RandomState(c.HelperConstants.RANDOM_SEED).rand(5), np.random.rand(5),
+                                      self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
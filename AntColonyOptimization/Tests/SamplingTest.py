@@ -0,0 +1,112 @@
+import unittest as ut
+import tracemalloc
+import numpy as np
+
+import Constants as c
+import Sampling as s
+
+
+class TestKernelSampler(ut.TestCase):
+    """
+    test suit for the KernelSampler class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_pop = c.AcoConstants.N_POP
+        self.__n_vars = c.ProblemConstants.COST_FUNC_MAP["case_1"]["n_dims"]
+        self.__n_ants = c.AcoConstants.N_ANTS
+        self.__domain_bounds = c.ProblemConstants.COST_FUNC_MAP["case_1"]["bounds"]
+        random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__means = random.uniform(self.__domain_bounds[0], self.__domain_bounds[1], (self.__n_pop, self.__n_vars))
+        self.__sigmas = random.uniform(0.0, 0.5, (self.__n_pop, self.__n_vars))
+        w = random.uniform(0.0, 1.0, self.__n_pop)
+        self.__probs = w/np.sum(w)
+        self.__test_msg = "Invalid test!!"
+
+    def test_KernelSampler_Invalid_Mode_Is_Rejected(self):
+        """
+        Test 'KernelSampler' rejects an unknown sampling mode
+        """
+        random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        with self.assertRaises(ValueError, msg=self.__test_msg):
+            s.KernelSampler(self.__probs, random, mode="unknown")
+
+    def test_KernelSampler_Vectorized_Sample_Is_Valid(self):
+        """
+        Test 'KernelSampler' vectorized sampling returns bounded positions of the expected shape
+        """
+        random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        sampler = s.KernelSampler(self.__probs, random, mode="vectorized")
+        positions = sampler.sample(self.__means, self.__sigmas, self.__n_ants, *self.__domain_bounds)
+        self.assertEqual((self.__n_ants, self.__n_vars), positions.shape, self.__test_msg)
+        self.assertTrue(np.all(positions >= self.__domain_bounds[0]), self.__test_msg)
+        self.assertTrue(np.all(positions <= self.__domain_bounds[1]), self.__test_msg)
+
+    def test_KernelSampler_Vectorized_Kernel_Selection_Matches_Roulette_Wheel(self):
+        """
+        Test 'KernelSampler' vectorized kernel selection matches the per-draw roulette wheel selection
+        """
+        sampler = s.KernelSampler(self.__probs, np.random.RandomState(c.HelperConstants.RANDOM_SEED))
+        r = np.random.RandomState(c.HelperConstants.RANDOM_SEED).rand(1000)
+        expected = np.array([np.argwhere(x <= np.cumsum(self.__probs))[0, 0] for x in r])
+        actual = np.searchsorted(sampler.cum_probs, r, side="left")
+        np.testing.assert_array_equal(expected, actual, self.__test_msg)
+
+    def test_KernelSampler_Legacy_Sample_Reproduces_Per_Draw_Order(self):
+        """
+        Test 'KernelSampler' legacy sampling reproduces the original per-draw random number order
+        """
+        random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        expected = np.zeros((self.__n_ants, self.__n_vars))
+        for i in range(self.__n_ants):
+            for j in range(self.__n_vars):
+                r = random.rand()
+                k = np.argwhere(r <= np.cumsum(self.__probs))[0, 0]
+                expected[i, j] = self.__means[k, j] + self.__sigmas[k, j] * random.randn()
+        expected = np.minimum(np.maximum(expected, self.__domain_bounds[0]), self.__domain_bounds[1])
+        sampler = s.KernelSampler(self.__probs, np.random.RandomState(c.HelperConstants.RANDOM_SEED), mode="legacy")
+        actual = sampler.sample(self.__means, self.__sigmas, self.__n_ants, *self.__domain_bounds)
+        np.testing.assert_array_equal(expected, actual, self.__test_msg)
+
+    def test_KernelSampler_Sample_In_Place_Is_Valid(self):
+        """
+        Test 'KernelSampler' in place sampling fills the output array with the positions of a fresh sampling
+        """
+        for mode in s.KernelSampler.SAMPLING_MODES:
+            expected = s.KernelSampler(self.__probs, np.random.RandomState(c.HelperConstants.RANDOM_SEED), mode=mode).sample(
+                self.__means, self.__sigmas, self.__n_ants, *self.__domain_bounds)
+            out = np.zeros((self.__n_ants, self.__n_vars))
+            actual = s.KernelSampler(self.__probs, np.random.RandomState(c.HelperConstants.RANDOM_SEED), mode=mode).sample(
+                self.__means, self.__sigmas, self.__n_ants, *self.__domain_bounds, out=out)
+            self.assertIs(out, actual, self.__test_msg)
+            np.testing.assert_array_equal(expected, out, self.__test_msg)
+
+    def test_KernelSampler_Steady_State_Allocations_Are_Bounded(self):
+        """
+        Test 'KernelSampler' steady state in place sampling allocates no generation sized arrays (tracemalloc peak
+        far below the size of one (n_ants, n_vars) array)
+        """
+        n_ants, n_vars = 1000, 20
+        means = np.zeros((self.__n_pop, n_vars))
+        sigmas = np.ones((self.__n_pop, n_vars))
+        out = np.zeros((n_ants, n_vars))
+        for selection in ("alias", "rank", "tournament"):
+            sampler = s.KernelSampler(self.__probs, np.random.default_rng(c.HelperConstants.RANDOM_SEED), selection=selection)
+            sampler.sample(means, sigmas, n_ants, *self.__domain_bounds, out=out)
+            n_allocations = sampler.buffers.n_allocations
+            tracemalloc.start()
+            try:
+                start = tracemalloc.get_traced_memory()[0]
+                for _ in range(10):
+                    sampler.sample(means, sigmas, n_ants, *self.__domain_bounds, out=out)
+                peak = tracemalloc.get_traced_memory()[1] - start
+            finally:
+                tracemalloc.stop()
+            self.assertLess(peak, out.nbytes // 10, self.__test_msg)
+            self.assertEqual(n_allocations, sampler.buffers.n_allocations, self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
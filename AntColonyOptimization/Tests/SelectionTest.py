@@ -0,0 +1,106 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import RandomStreams as rs
+import Selection as sl
+import Sampling as s
+import Acor as a
+
+
+class TestSelection(ut.TestCase):
+    """
+    test suit for the kernel selection strategies
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_pop = 25
+        points = np.arange(self.__n_pop, dtype=float)
+        w = np.exp(-0.5*np.square((points - 1)/(c.AcoConstants.Q*self.__n_pop)))
+        self.__probs = w/np.sum(w)
+        self.__random = rs.createRandomStream(random_seed=c.HelperConstants.RANDOM_SEED)
+        self.__n_draws = 400000
+        self.__test_msg = "Invalid test!!"
+
+    def __computeFrequencies(self, selector):
+        """
+        Computes the empirical selection frequencies of a selector
+        """
+        k = selector.select(self.__random, (self.__n_draws // 100, 100))
+        self.assertEqual((self.__n_draws // 100, 100), k.shape, self.__test_msg)
+        self.assertTrue(np.all((k >= 0) & (k < self.__n_pop)), self.__test_msg)
+        return np.bincount(np.reshape(k, (-1)), minlength=self.__n_pop) / self.__n_draws
+
+    def test_AliasSelector_Table_Is_Exact(self):
+        """
+        Test the alias table reproduces the selection probabilities exactly
+        """
+        selector = sl.AliasSelector(self.__probs)
+        table_probs = selector.probs / self.__n_pop
+        np.add.at(table_probs, selector.aliases, (1.0 - selector.probs) / self.__n_pop)
+        np.testing.assert_allclose(self.__probs, table_probs, atol=1e-12, err_msg=self.__test_msg)
+
+    def test_Proportional_Selectors_Match_The_Probabilities(self):
+        """
+        Test the 'roulette' and 'alias' selections draw the kernels with the kernel weight probabilities
+        """
+        for strategy in ["roulette", "alias"]:
+            frequencies = self.__computeFrequencies(sl.createSelector(strategy, self.__probs))
+            np.testing.assert_allclose(self.__probs, frequencies, atol=3e-3, err_msg=f"{self.__test_msg} {strategy}")
+
+    def test_Rank_And_Tournament_Selectors_Are_Valid(self):
+        """
+        Test the 'rank' and 'tournament' selections match their theoretical probabilities
+        """
+        rank_probs = sl.computeLinearRankProbabilities(self.__n_pop, 1.5)
+        self.assertAlmostEqual(1.0, np.sum(rank_probs), places=12, msg=self.__test_msg)
+        self.assertTrue(np.all(np.diff(rank_probs) < 0.0), self.__test_msg)
+        frequencies = self.__computeFrequencies(sl.createSelector("rank", self.__probs, selection_pressure=1.5))
+        np.testing.assert_allclose(rank_probs, frequencies, atol=3e-3, err_msg=self.__test_msg)
+        frequencies = self.__computeFrequencies(sl.createSelector("tournament", self.__probs, tournament_size=3))
+        ranks = np.arange(self.__n_pop)
+        tournament_probs = np.power(1.0 - ranks/self.__n_pop, 3) - np.power(1.0 - (ranks + 1)/self.__n_pop, 3)
+        np.testing.assert_allclose(tournament_probs, frequencies, atol=3e-3, err_msg=self.__test_msg)
+
+    def test_Invalid_Selections_Are_Rejected(self):
+        """
+        Test the unknown strategies and the non 'roulette' legacy sampling are rejected
+        """
+        with self.assertRaises(ValueError):
+            sl.createSelector("boltzmann", self.__probs)
+        with self.assertRaises(ValueError):
+            s.KernelSampler(self.__probs, self.__random, mode="legacy", selection="alias")
+
+    def test_Kernel_Selector_Is_Abstract(self):
+        """
+        Test 'KernelSelector' requires its subclasses to implement 'select'
+        """
+        class IncompleteSelector(sl.KernelSelector):
+            name = "incomplete"
+
+        with self.assertRaises(TypeError):
+            sl.KernelSelector()
+        with self.assertRaises(TypeError):
+            IncompleteSelector()
+
+    def test_AcorContinuousDomain_Selections_Are_Valid(self):
+        """
+        Test the ACO algorithm runs with every selection strategy
+        """
+        c.AcoConstants.MAX_ITERATIONS = 30
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_2"]
+        for strategy in sl.SELECTION_STRATEGIES:
+            acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                           n_vars=problem["n_dims"],
+                                           cost_func=problem["func"],
+                                           domain_bounds=problem["bounds"],
+                                           selection=strategy)
+            acor.runMainLoop()
+            costs = acor.history.costs
+            self.assertLess(costs[-1], costs[0], f"{self.__test_msg} {strategy}")
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,104 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import Sigma as sg
+import Archive as ar
+
+
+class TestSigmaEngine(ut.TestCase):
+    """
+    test suit for the SigmaEngine class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__zeta = c.AcoConstants.ZETA
+        self.__random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__test_msg = "Invalid test!!"
+
+    def __computeReferenceSigmas(self, means):
+        """
+        Original pair by pair sigma computation
+        """
+        n_pop = means.shape[0]
+        sigmas = np.zeros(means.shape)
+        for l_i in range(n_pop):
+            d = 0.0
+            for r_i in range(n_pop):
+                d += np.abs(means[l_i, :] - means[r_i, :])
+            sigmas[l_i, :] = (self.__zeta * d) / (n_pop - 1)
+        return sigmas
+
+    def test_SigmaEngine_Invalid_Method_Is_Rejected(self):
+        """
+        Test 'SigmaEngine' rejects an unknown method
+        """
+        with self.assertRaises(ValueError, msg=self.__test_msg):
+            sg.SigmaEngine(self.__zeta, method="unknown")
+
+    def test_SigmaEngine_Methods_Match_Reference(self):
+        """
+        Test every 'SigmaEngine' method matches the original sigma computation
+        """
+        for n_pop, n_vars in [(2, 1), (10, 10), (57, 13)]:
+            means = self.__random.uniform(-5.12, 5.12, (n_pop, n_vars))
+            expected = self.__computeReferenceSigmas(means)
+            for method in sg.SigmaEngine.SIGMA_METHODS:
+                engine = sg.SigmaEngine(self.__zeta, method=method, chunk_size=8)
+                actual = engine.compute(means)
+                np.testing.assert_allclose(expected, actual, rtol=1e-10, atol=1e-12, err_msg=f"{self.__test_msg} {method}")
+
+    def test_SigmaEngine_Sorted_Handles_Ties(self):
+        """
+        Test the 'sorted' method is exact for archives with repeated (e.g. clipped) positions
+        """
+        means = np.round(self.__random.uniform(0.5, 1.5, (40, 5)), 1)
+        expected = self.__computeReferenceSigmas(means)
+        actual = sg.SigmaEngine(self.__zeta, method="sorted").compute(means)
+        np.testing.assert_allclose(expected, actual, rtol=1e-10, atol=1e-12, err_msg=self.__test_msg)
+
+    def test_SigmaEngine_Out_Array_Is_Filled_In_Place(self):
+        """
+        Test 'SigmaEngine' writes into the supplied output array
+        """
+        means = self.__random.uniform(-5.0, 5.0, (10, 10))
+        out = np.zeros(means.shape)
+        result = sg.SigmaEngine(self.__zeta, method="broadcast").compute(means, out=out)
+        self.assertIs(out, result, self.__test_msg)
+        np.testing.assert_array_equal(self.__computeReferenceSigmas(means), out, self.__test_msg)
+
+    def test_SigmaEngine_Incremental_Tracks_Archive_Merges(self):
+        """
+        Test the 'incremental' method matches a full recomputation after every archive merge
+        """
+        n_pop, n_ants, n_vars = 30, 4, 6
+        archive = ar.SolutionArchive(n_pop, n_ants, n_vars)
+        archive.initialize(self.__random.rand(n_pop, n_vars), self.__random.rand(n_pop))
+        engine = sg.SigmaEngine(self.__zeta, method="incremental", refresh_interval=1000)
+        reference = sg.SigmaEngine(self.__zeta, method="broadcast")
+        for _ in range(50):
+            np.testing.assert_allclose(reference.compute(archive.means), engine.compute(archive.means), rtol=1e-9,
+                                       atol=1e-12, err_msg=self.__test_msg)
+            archive.sample_positions[:] = self.__random.rand(n_ants, n_vars)
+            archive.sample_costs[:] = self.__random.rand(n_ants) * 0.5
+            archive.merge()
+            engine.update(archive.order, archive.means, archive.sample_positions)
+        self.assertEqual(1, engine.n_full_computations, self.__test_msg)
+        self.assertGreater(engine.n_incremental_updates, 0, self.__test_msg)
+
+    def test_SigmaEngine_Incremental_Recomputes_Untracked_Means(self):
+        """
+        Test the 'incremental' method fully recomputes the sums of means it did not track
+        """
+        engine = sg.SigmaEngine(self.__zeta, method="incremental")
+        for _ in range(2):
+            means = self.__random.rand(12, 3)
+            np.testing.assert_allclose(self.__computeReferenceSigmas(means), engine.compute(means), rtol=1e-10,
+                                       err_msg=self.__test_msg)
+        self.assertEqual(2, engine.n_full_computations, self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,105 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import StoppingCriteria as sc
+import Acor as a
+
+
+class TestStoppingCriteria(ut.TestCase):
+    """
+    test suit for the ACO algorithm stopping criteria
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_2"]
+        self.__n_vars = problem["n_dims"]
+        self.__cost_func = problem["func"]
+        self.__domain_bounds = problem["bounds"]
+        self.__n_pop = c.AcoConstants.N_POP
+        c.AcoConstants.MAX_ITERATIONS = 1000
+        self.__test_msg = "Invalid test!!"
+
+    def __runAcor(self, stopping_criteria):
+        """
+        Runs the ACO algorithm with the specified stopping criteria
+        """
+        acor = a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                       n_vars=self.__n_vars,
+                                       cost_func=self.__cost_func,
+                                       domain_bounds=self.__domain_bounds,
+                                       stopping_criteria=stopping_criteria)
+        acor.runMainLoop()
+        self.assertEqual(acor.iteration, len(acor.best_solutions), self.__test_msg)
+        self.assertTrue(all(x is not None for x in acor.best_solutions), self.__test_msg)
+        return acor
+
+    def test_Max_Iterations_Is_Reported_Without_Criteria(self):
+        """
+        Test the 'max_iterations' rule is reported when no early stopping criterion fires
+        """
+        c.AcoConstants.MAX_ITERATIONS = 20
+        acor = self.__runAcor(None)
+        self.assertEqual("max_iterations", acor.stop_reason, self.__test_msg)
+        self.assertEqual(20, acor.iteration, self.__test_msg)
+
+    def test_Target_Cost_Criterion_Is_Valid(self):
+        """
+        Test 'TargetCostCriterion' stops the run once the target cost is reached
+        """
+        acor = self.__runAcor([sc.TargetCostCriterion(1e-3)])
+        self.assertEqual("target_cost", acor.stop_reason, self.__test_msg)
+        self.assertLessEqual(acor.final_best_solution.cost_function, 1e-3, self.__test_msg)
+        self.assertLess(acor.iteration, 1000, self.__test_msg)
+
+    def test_No_Improvement_Criterion_Is_Valid(self):
+        """
+        Test 'NoImprovementCriterion' stops the run after the patience is exhausted
+        """
+        acor = self.__runAcor([sc.NoImprovementCriterion(patience=10, tolerance=1e-6)])
+        self.assertEqual("no_improvement", acor.stop_reason, self.__test_msg)
+        costs = np.array([x.cost_function for x in acor.best_solutions])
+        self.assertLessEqual(costs[-11] - costs[-1], 1e-6, self.__test_msg)
+
+    def test_Sigma_Threshold_Criterion_Is_Valid(self):
+        """
+        Test 'SigmaThresholdCriterion' stops the run once the archive has collapsed
+        """
+        acor = self.__runAcor([sc.SigmaThresholdCriterion(1e-4)])
+        self.assertEqual("sigma_threshold", acor.stop_reason, self.__test_msg)
+        self.assertLess(np.max(acor.sigmas), 1e-4, self.__test_msg)
+
+    def test_Max_Evaluations_Criterion_Is_Valid(self):
+        """
+        Test 'MaxEvaluationsCriterion' stops the run once the evaluation cap is reached
+        """
+        acor = self.__runAcor([sc.MaxEvaluationsCriterion(500)])
+        self.assertEqual("max_evaluations", acor.stop_reason, self.__test_msg)
+        self.assertEqual(self.__n_pop + acor.iteration * c.AcoConstants.N_ANTS, acor.n_evaluations, self.__test_msg)
+        self.assertLess(acor.n_evaluations - 500, c.AcoConstants.N_ANTS, self.__test_msg)
+
+    def test_Wall_Clock_Criterion_Is_Valid(self):
+        """
+        Test 'WallClockCriterion' stops the run once the wall-clock budget is spent
+        """
+        acor = self.__runAcor([sc.WallClockCriterion(0.0)])
+        self.assertEqual("wall_clock", acor.stop_reason, self.__test_msg)
+        self.assertEqual(1, acor.iteration, self.__test_msg)
+
+    def test_Stopping_Criterion_Is_Abstract(self):
+        """
+        Test 'StoppingCriterion' requires its subclasses to implement 'isSatisfied'
+        """
+        class IncompleteCriterion(sc.StoppingCriterion):
+            name = "incomplete"
+
+        with self.assertRaises(TypeError):
+            sc.StoppingCriterion()
+        with self.assertRaises(TypeError):
+            IncompleteCriterion()
+
+
+if __name__ == "__main__":
+    ut.main()
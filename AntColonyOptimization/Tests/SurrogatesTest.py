@@ -0,0 +1,115 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import Surrogates as sr
+import Acor as a
+
+
+class TestSurrogates(ut.TestCase):
+    """
+    test suit for the surrogate pre-screening
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        self.__n_vars = 3
+        random = np.random.RandomState(c.HelperConstants.RANDOM_SEED)
+        self.__positions = random.uniform(-2.0, 2.0, (60, self.__n_vars))
+        self.__costs = np.sum(np.square(self.__positions - 0.5), axis=1)
+        self.__candidates = random.uniform(-2.0, 2.0, (100, self.__n_vars))
+        self.__test_msg = "Invalid test!!"
+
+    def test_QuadraticSurrogate_Fits_A_Quadratic(self):
+        """
+        Test the (incrementally trained) quadratic surrogate recovers a separable quadratic cost function
+        """
+        surrogate = sr.QuadraticSurrogate(self.__n_vars, forgetting=1.0)
+        self.assertFalse(surrogate.is_ready, self.__test_msg)
+        for positions, costs in zip(np.split(self.__positions, 3), np.split(self.__costs, 3)):
+            surrogate.update(positions, costs)
+        self.assertTrue(surrogate.is_ready, self.__test_msg)
+        self.assertEqual(60, surrogate.n_samples, self.__test_msg)
+        expected = np.sum(np.square(self.__candidates - 0.5), axis=1)
+        np.testing.assert_allclose(expected, surrogate.predict(self.__candidates), atol=1e-8, err_msg=self.__test_msg)
+
+    def test_RbfSurrogate_Interpolates_The_Best_Samples(self):
+        """
+        Test the RBF surrogate interpolates its (best) training samples
+        """
+        surrogate = sr.RbfSurrogate(self.__n_vars, max_samples=40)
+        surrogate.update(self.__positions, self.__costs)
+        self.assertEqual(40, surrogate.n_samples, self.__test_msg)
+        best = np.argsort(self.__costs)[:40]
+        np.testing.assert_allclose(self.__costs[best], surrogate.predict(self.__positions[best]), atol=1e-6,
+                                   err_msg=self.__test_msg)
+        with self.assertRaises(ValueError):
+            sr.RbfSurrogate(self.__n_vars, max_samples=self.__n_vars)
+
+    def test_SurrogateScreen_Selects_The_Best_Predicted_Candidates(self):
+        """
+        Test the surrogate screen selects the candidates with the best predicted costs
+        """
+        screen = sr.SurrogateScreen("quadratic", self.__n_vars, oversampling=4, fraction=0.25)
+        screen.update(self.__positions, self.__costs)
+        self.assertEqual(40, screen.getNumberOfCandidates(10), self.__test_msg)
+        self.assertEqual(3, screen.getNumberOfEvaluations(10), self.__test_msg)
+        selected = screen.select(self.__candidates, 5)
+        expected = np.argsort(np.sum(np.square(self.__candidates - 0.5), axis=1))[:5]
+        np.testing.assert_array_equal(expected, selected, self.__test_msg)
+        self.assertEqual((1, 100), (screen.n_screenings, screen.n_candidates), self.__test_msg)
+        for kwargs in ({"oversampling": 0}, {"fraction": 0.0}, {"fraction": 1.5}):
+            with self.assertRaises(ValueError):
+                sr.SurrogateScreen("quadratic", self.__n_vars, **kwargs)
+        with self.assertRaises(ValueError):
+            sr.createSurrogate("kriging", self.__n_vars)
+
+    def test_Surrogate_Is_Abstract(self):
+        """
+        Test 'Surrogate' requires its subclasses to implement 'reset', 'update', 'predict' and 'is_ready'
+        """
+        class IncompleteSurrogate(sr.Surrogate):
+            name = "incomplete"
+
+            def reset(self):
+                pass
+
+            def update(self, positions, costs):
+                pass
+
+        with self.assertRaises(TypeError):
+            sr.Surrogate()
+        with self.assertRaises(TypeError):
+            IncompleteSurrogate()
+
+    def test_Surrogate_Screening_Reduces_The_True_Evaluations(self):
+        """
+        Test the pre-screened ACO algorithm truly evaluates only the screened fraction of the ants
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_2"]
+        results = []
+        for surrogate in sr.SURROGATES:
+            acor = a.AcorContinuousDomain(n_pop=c.AcoConstants.N_POP,
+                                          n_vars=problem["n_dims"],
+                                          cost_func=problem["func"],
+                                          domain_bounds=problem["bounds"],
+                                          show_progress=False,
+                                          surrogate=surrogate,
+                                          surrogate_fraction=0.25)
+            n_calls = []
+            acor.runGenerations(0)
+            for _ in range(20):
+                n_evaluations = acor.n_evaluations
+                acor.runGenerations(1)
+                n_calls.append(acor.n_evaluations - n_evaluations)
+            self.assertTrue(set(n_calls) <= {c.AcoConstants.N_ANTS, c.AcoConstants.N_ANTS // 4}, self.__test_msg)
+            self.assertEqual(c.AcoConstants.N_ANTS // 4, n_calls[-1], self.__test_msg)
+            self.assertGreater(acor.surrogate_screen.n_screenings, 0, self.__test_msg)
+            self.assertTrue(np.all(np.isfinite(acor.archive.costs)), self.__test_msg)
+            results.append(acor.final_best_solution.cost_function)
+        self.assertTrue(np.all(np.isfinite(results)), self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,72 @@
+import unittest as ut
+
+import Constants as c
+import Config as cg
+import Sweep as sw
+
+
+class TestHyperparameterSweep(ut.TestCase):
+    """
+    test suit for the HyperparameterSweep class
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_2"]
+        self.__n_vars = problem["n_dims"]
+        self.__cost_func = problem["func"]
+        self.__domain_bounds = problem["bounds"]
+        self.__base_config = cg.AcoConfig(max_iterations=15)
+        self.__test_msg = "Invalid test!!"
+
+    def __createSweep(self, search_space, **kwargs):
+        """
+        Creates the hyperparameter sweep
+        """
+        return sw.HyperparameterSweep(n_vars=self.__n_vars,
+                                      cost_func=self.__cost_func,
+                                      domain_bounds=self.__domain_bounds,
+                                      search_space=search_space,
+                                      base_config=self.__base_config,
+                                      **kwargs)
+
+    def test_Grid_Sweep_Is_Valid(self):
+        """
+        Test the (parallel) grid search runs every grid point and matches the sequential search
+        """
+        search_space = {"q": [0.1, 0.5], "zeta": [0.5, 1.0], "n_pop": [10, 20]}
+        results = self.__createSweep(search_space, n_workers=2).run()
+        self.assertEqual(8, len(results), self.__test_msg)
+        best_costs = [x["best_cost"] for x in results]
+        self.assertEqual(sorted(best_costs), best_costs, self.__test_msg)
+        self.assertEqual({10, 20}, {x["hyperparameters"]["n_pop"] for x in results}, self.__test_msg)
+        sequential = self.__createSweep(search_space, parallel=False).run()
+        self.assertEqual(best_costs, [x["best_cost"] for x in sequential], self.__test_msg)
+
+    def test_Random_Sweep_Is_Valid(self):
+        """
+        Test the random search draws reproducible trials within the search space
+        """
+        search_space = {"q": (0.05, 1.0), "n_ants": (5, 30), "zeta": [0.5, 1.0]}
+        sweep = self.__createSweep(search_space, mode="random", n_trials=6, parallel=False)
+        trials = sweep.createTrials()
+        self.assertEqual(trials, self.__createSweep(search_space, mode="random", n_trials=6).createTrials(), self.__test_msg)
+        for trial in trials:
+            self.assertTrue(0.05 <= trial["q"] <= 1.0 and 5 <= trial["n_ants"] <= 30, self.__test_msg)
+            self.assertIsInstance(trial["n_ants"], int, self.__test_msg)
+            self.assertIn(trial["zeta"], [0.5, 1.0], self.__test_msg)
+        results = sweep.run()
+        self.assertEqual(results[0], sweep.best_result, self.__test_msg)
+        self.assertEqual(15, results[0]["config"].max_iterations, self.__test_msg)
+
+    def test_Invalid_Search_Space_Raises(self):
+        """
+        Test unknown hyperparameters are rejected
+        """
+        with self.assertRaises(ValueError):
+            self.__createSweep({"alpha": [1.0]})
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,88 @@
+import unittest as ut
+import numpy as np
+
+import Constants as c
+import StoppingCriteria as sc
+import Telemetry as t
+import Acor as a
+
+
+class TestTelemetry(ut.TestCase):
+    """
+    test suit for the ACO algorithm generation telemetry (iterator and callbacks)
+    """
+    def setUp(self) -> None:
+        """
+        Test setup fixture
+        """
+        problem = c.ProblemConstants.COST_FUNC_MAP["case_2"]
+        self.__n_vars = problem["n_dims"]
+        self.__cost_func = problem["func"]
+        self.__domain_bounds = problem["bounds"]
+        self.__n_pop = c.AcoConstants.N_POP
+        c.AcoConstants.MAX_ITERATIONS = 20
+        self.__test_msg = "Invalid test!!"
+
+    def __createAcor(self, **kwargs):
+        """
+        Creates the ACO algorithm
+        """
+        return a.AcorContinuousDomain(n_pop=self.__n_pop,
+                                      n_vars=self.__n_vars,
+                                      cost_func=self.__cost_func,
+                                      domain_bounds=self.__domain_bounds,
+                                      **kwargs)
+
+    def test_Iterate_Yields_Generation_States(self):
+        """
+        Test 'iterate' yields one valid snapshot per generation and matches 'runMainLoop'
+        """
+        acor = self.__createAcor()
+        states = list(acor.iterate())
+        self.assertEqual(20, len(states), self.__test_msg)
+        self.assertTrue(all(isinstance(x, t.GenerationState) for x in states), self.__test_msg)
+        self.assertEqual(list(range(1, 21)), [x.iteration for x in states], self.__test_msg)
+        best_costs = [x.best_cost for x in states]
+        self.assertEqual(sorted(best_costs, reverse=True), best_costs, self.__test_msg)
+        self.assertEqual(self.__n_pop + 20*c.AcoConstants.N_ANTS, states[-1].n_evaluations, self.__test_msg)
+        self.assertEqual("max_iterations", acor.stop_reason, self.__test_msg)
+        reference = self.__createAcor()
+        reference.runMainLoop()
+        np.testing.assert_array_equal(reference.history.costs, best_costs, self.__test_msg)
+
+    def test_Iterate_Can_Be_Resumed(self):
+        """
+        Test a consumer can stop iterating and resume the main loop later
+        """
+        acor = self.__createAcor()
+        for state in acor.iterate():
+            if state.iteration == 5:
+                break
+        self.assertIsNone(acor.stop_reason, self.__test_msg)
+        states = list(acor.iterate())
+        self.assertEqual(list(range(6, 21)), [x.iteration for x in states], self.__test_msg)
+
+    def test_Generation_State_Spread_Is_The_Sampling_Spread(self):
+        """
+        Test the snapshot spread is the largest standard deviation the generation was sampled with
+        """
+        acor = self.__createAcor()
+        for state in acor.iterate():
+            self.assertEqual(float(np.max(acor.sigmas)), state.spread, self.__test_msg)
+            self.assertGreater(state.spread, 0.0, self.__test_msg)
+
+    def test_Callbacks_Are_Invoked_Every_Generation(self):
+        """
+        Test the generation callbacks receive one snapshot per generation (including early stopped runs)
+        """
+        states = []
+        acor = self.__createAcor(callbacks=[states.append],
+                                 stopping_criteria=[sc.NoImprovementCriterion(patience=1)])
+        acor.runMainLoop()
+        self.assertEqual(acor.iteration, len(states), self.__test_msg)
+        self.assertEqual(acor.final_best_solution.cost_function, states[-1].best_cost, self.__test_msg)
+        self.assertEqual(set(t.GenerationState.__slots__), set(states[-1].toDict()), self.__test_msg)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -1,7 +1,9 @@
+import json
 from time import time, sleep
 import datetime
 from pprint import pformat
-from typing import List
+from typing import Dict, List
+import numpy as np
 
 import Constants as c
 
@@ -48,3 +50,38 @@ class Helpers(object):
         best_results_msg += f"Optimal value:{c.HelperConstants.CARRIAGE_RETURN}{pformat(aco_best_results.cost_function)}{c.HelperConstants.CARRIAGE_RETURN}"
         best_results_msg += f"{c.HelperConstants.CARRIAGE_RETURN}"
         return best_results_msg
+
+    @staticmethod
+    def createAcoResults(acor: object, **metadata) -> Dict:
+        """
+        Creates the (JSON serializable) results of an ACO algorithm run
+        :param: acor: ACO algorithm (after its main loop)
+        :param: metadata: additional (JSON serializable) result entries e.g. the problem case
+        """
+        best_solution = acor.final_best_solution
+        return {**metadata,
+                "best_position": np.reshape(best_solution.position, (-1)).tolist(),
+                "best_cost": float(best_solution.cost_function),
+                "n_iterations": acor.iteration,
+                "n_evaluations": acor.n_evaluations,
+                "stop_reason": acor.stop_reason,
+                "elapsed_time": acor.elapsed_time,
+                "config": acor.config.toDict(),
+                "history_costs": acor.history.costs.tolist()}
+
+    @staticmethod
+    def saveAcoResults(path: str, acor: object, **metadata):
+        """
+        Saves the results of an ACO algorithm run to a JSON file or (for a '.npz' path) a NumPy archive
+        :param: path: results file path
+        :param: acor: ACO algorithm (after its main loop)
+        :param: metadata: additional (JSON serializable) result entries e.g. the problem case
+        """
+        results = Helpers.createAcoResults(acor, **metadata)
+        if path.endswith(".npz"):
+            config = results.pop("config")
+            arrays = {key: np.asarray(value if value is not None else "") for key, value in results.items()}
+            np.savez(path, **arrays, **{f"config_{key}": np.asarray(value) for key, value in config.items()})
+        else:
+            with open(path, "w") as results_file:
+                json.dump(results, results_file, indent=2)